@@ -1,10 +1,31 @@
+#include <pybind11/numpy.h>
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 
+#include <stdexcept>
+#include <string>
+
 #include "mc_core.hpp"
 
 namespace py = pybind11;
 
+namespace {
+
+// C-contiguous arrays of exactly this dtype; no forcecast, so pybind11
+// rejects (rather than silently copies) anything that would need converting.
+template <class T>
+using carray = py::array_t<T, py::array::c_style>;
+
+template <class T>
+void check_column(const carray<T>& a, const char* name, py::ssize_t n_rows) {
+    if (a.ndim() != 1 || a.shape(0) != n_rows) {
+        throw std::invalid_argument(
+            std::string(name) + " must be a 1-D array of length " + std::to_string(n_rows));
+    }
+}
+
+}  // namespace
+
 PYBIND11_MODULE(_mc_core, m) {
     m.doc() = "C++ Monte Carlo pricer for European options under GBM";
 
@@ -17,12 +38,644 @@ PYBIND11_MODULE(_mc_core, m) {
            double T,
            std::size_t n_paths,
            unsigned int seed,
-           bool is_call) {
-            MCResult res = mc_price_european(S0, K, r, sigma, T, n_paths, seed, is_call);
+           bool is_call,
+           int variance_reduction,
+           int precision) {
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european(S0, K, r, sigma, T, n_paths, seed, is_call, vr,
+                                        static_cast<Precision>(precision));
+            }
             // Return a simple dict for clarity
             py::dict out;
             out["price"] = res.price;
             out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("variance_reduction") = 0,
+        py::arg("precision") = 0,
+        "Monte Carlo price for a European option (call/put) under GBM. "
+        "variance_reduction: 0 = none, 1 = antithetic, 2 = control variate. "
+        "precision: 0 = double, 1 = single (sums still in double)."
+    );
+
+    m.def(
+        "mc_price_european_scalar",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           int variance_reduction) {
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_scalar(S0, K, r, sigma, T, n_paths, seed, is_call, vr);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("variance_reduction") = 0,
+        "Reference one-path-at-a-time European kernel (mt19937 + std::exp), "
+        "as before the block kernel."
+    );
+
+    m.def(
+        "mc_price_european_parallel",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           unsigned int n_threads,
+           int variance_reduction,
+           int precision) {
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_parallel(
+                    S0, K, r, sigma, T, n_paths, seed, is_call, n_threads, vr,
+                    static_cast<Precision>(precision));
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("n_threads") = 0,
+        py::arg("variance_reduction") = 0,
+        py::arg("precision") = 0,
+        "Multithreaded Monte Carlo price; result is independent of n_threads."
+    );
+
+    m.def(
+        "mc_price_european_summarised",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           double low,
+           double high,
+           std::size_t n_bins,
+           double relative_accuracy,
+           std::size_t max_buckets,
+           std::size_t sample_size,
+           unsigned int n_threads,
+           int variance_reduction,
+           int precision) {
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+            const SummarySpec spec{low, high, n_bins, relative_accuracy, max_buckets, sample_size};
+            MCSummaries summaries;
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_summarised(
+                    S0, K, r, sigma, T, n_paths, seed, is_call, n_threads, spec, summaries,
+                    vr, static_cast<Precision>(precision));
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            out["histogram"] = py::array(py::cast(summaries.histogram));
+            out["underflow"] = summaries.underflow;
+            out["overflow"] = summaries.overflow;
+            out["zero_count"] = summaries.zero_count;
+            out["bucket_offset"] = summaries.bucket_offset;
+            out["buckets"] = py::array(py::cast(summaries.buckets));
+            out["sample_keys"] = py::array(py::cast(summaries.sample_keys));
+            out["sample_values"] = py::array(py::cast(summaries.sample_values));
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("low"),
+        py::arg("high"),
+        py::arg("n_bins"),
+        py::arg("relative_accuracy") = 0.01,
+        py::arg("max_buckets") = 2048,
+        py::arg("sample_size") = 1000,
+        py::arg("n_threads") = 1,
+        py::arg("variance_reduction") = 0,
+        py::arg("precision") = 0,
+        "European MC price plus streaming summaries (S_T histogram, payoff "
+        "quantile-sketch buckets, reservoir sample) from the same pass."
+    );
+
+    m.def(
+        "mc_price_european_instrumented",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           unsigned int n_threads,
+           int variance_reduction,
+           int precision) {
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+            MCStageTimes times;
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_instrumented(
+                    S0, K, r, sigma, T, n_paths, seed, is_call, n_threads, times,
+                    vr, static_cast<Precision>(precision));
+            }
+            py::dict stages;
+            stages["rng"] = times.rng;
+            stages["exp"] = times.exp;
+            stages["payoff"] = times.payoff;
+            stages["accumulate"] = times.accumulate;
+            stages["reduction"] = times.reduction;
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            out["stages"] = stages;
+            out["wall_time"] = times.wall;
+            out["n_threads"] = times.n_threads;
+            out["n_blocks"] = times.n_blocks;
+            out["bytes_allocated"] = times.bytes_allocated;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("n_threads") = 1,
+        py::arg("variance_reduction") = 0,
+        py::arg("precision") = 0,
+        "mc_price_european_parallel with per-stage timings (seconds summed "
+        "over blocks), threads used and kernel scratch bytes."
+    );
+
+    m.def(
+        "mc_price_european_rqmc",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           std::size_t n_randomizations,
+           unsigned int n_threads,
+           int variance_reduction) {
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_rqmc(
+                    S0, K, r, sigma, T, n_paths, seed, is_call,
+                    n_randomizations, n_threads, vr);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("n_randomizations") = 16,
+        py::arg("n_threads") = 1,
+        py::arg("variance_reduction") = 0,
+        "Randomised QMC (scrambled Sobol) price with error bars from "
+        "independent randomisations."
+    );
+
+    m.def(
+        "mc_price_european_greeks",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           unsigned int n_threads,
+           bool antithetic) {
+            MCGreeksResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_greeks(
+                    S0, K, r, sigma, T, n_paths, seed, is_call, n_threads, antithetic);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["delta"] = res.delta;
+            out["delta_std_error"] = res.delta_std_error;
+            out["gamma"] = res.gamma;
+            out["gamma_std_error"] = res.gamma_std_error;
+            out["vega"] = res.vega;
+            out["vega_std_error"] = res.vega_std_error;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("n_threads") = 1,
+        py::arg("antithetic") = false,
+        "Price plus pathwise delta/vega and likelihood-ratio gamma in one pass."
+    );
+
+    m.def(
+        "mc_price_path_dependent",
+        [](double S0,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_steps,
+           int payoff,
+           bool is_call,
+           double K,
+           double barrier,
+           int barrier_kind,
+           bool floating_strike,
+           std::size_t n_paths,
+           unsigned int seed,
+           unsigned int n_threads,
+           int variance_reduction) {
+            PathProduct product;
+            product.kind = static_cast<PathPayoff>(payoff);
+            product.is_call = is_call;
+            product.strike = K;
+            product.barrier = barrier;
+            product.barrier_kind = static_cast<BarrierKind>(barrier_kind);
+            product.floating_strike = floating_strike;
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_path_dependent(
+                    S0, r, sigma, T, n_steps, product, n_paths, seed, n_threads, vr);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_steps"),
+        py::arg("payoff"),
+        py::arg("is_call"),
+        py::arg("K") = 0.0,
+        py::arg("barrier") = 0.0,
+        py::arg("barrier_kind") = 0,
+        py::arg("floating_strike") = false,
+        py::arg("n_paths") = 100000,
+        py::arg("seed") = 42,
+        py::arg("n_threads") = 1,
+        py::arg("variance_reduction") = 0,
+        "Monte Carlo price for an Asian (payoff=0), barrier (1) or lookback (2) "
+        "option with a time-stepped GBM simulation and O(1) state per path."
+    );
+
+    m.def(
+        "mc_price_american_lsm",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           std::size_t n_exercise,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           std::size_t n_basis,
+           unsigned int n_threads) {
+            MCAmericanResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_american_lsm(
+                    S0, K, r, sigma, T, n_exercise, n_paths, seed, is_call, n_basis, n_threads);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["european_price"] = res.european_price;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("K"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("T"),
+        py::arg("n_exercise"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("is_call"),
+        py::arg("n_basis") = 4,
+        py::arg("n_threads") = 1,
+        "Longstaff-Schwartz Monte Carlo price of an American option under GBM."
+    );
+
+    m.def(
+        "mc_price_heston",
+        [](double S0,
+           double r,
+           double v0,
+           double kappa,
+           double theta,
+           double xi,
+           double rho,
+           double T,
+           std::size_t n_steps,
+           int payoff,
+           bool is_call,
+           double K,
+           double barrier,
+           int barrier_kind,
+           bool floating_strike,
+           std::size_t n_paths,
+           unsigned int seed,
+           unsigned int n_threads,
+           int variance_reduction) {
+            PathProduct product;
+            product.kind = static_cast<PathPayoff>(payoff);
+            product.is_call = is_call;
+            product.strike = K;
+            product.barrier = barrier;
+            product.barrier_kind = static_cast<BarrierKind>(barrier_kind);
+            product.floating_strike = floating_strike;
+            const HestonParams heston{v0, kappa, theta, xi, rho};
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_heston(
+                    S0, r, heston, T, n_steps, product, n_paths, seed, n_threads, vr);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("r"),
+        py::arg("v0"),
+        py::arg("kappa"),
+        py::arg("theta"),
+        py::arg("xi"),
+        py::arg("rho"),
+        py::arg("T"),
+        py::arg("n_steps"),
+        py::arg("payoff"),
+        py::arg("is_call"),
+        py::arg("K") = 0.0,
+        py::arg("barrier") = 0.0,
+        py::arg("barrier_kind") = 0,
+        py::arg("floating_strike") = false,
+        py::arg("n_paths") = 100000,
+        py::arg("seed") = 42,
+        py::arg("n_threads") = 1,
+        py::arg("variance_reduction") = 0,
+        "Monte Carlo price under Heston (Andersen QE scheme) for a European (payoff=3), "
+        "Asian (0), barrier (1) or lookback (2) option."
+    );
+
+    m.def(
+        "mc_price_multi_asset",
+        [](const std::vector<double>& S0,
+           const std::vector<double>& sigma,
+           const std::vector<double>& cholesky,
+           double r,
+           double T,
+           int payoff,
+           bool is_call,
+           double K,
+           const std::vector<double>& weights,
+           std::size_t n_paths,
+           unsigned int seed,
+           unsigned int n_threads,
+           int variance_reduction) {
+            MultiAssetProduct product;
+            product.kind = static_cast<MultiAssetPayoff>(payoff);
+            product.is_call = is_call;
+            product.strike = K;
+            product.weights = weights;
+            const auto vr = static_cast<VarianceReduction>(variance_reduction);
+
+            MCResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_multi_asset(
+                    S0, sigma, cholesky, r, T, product, n_paths, seed, n_threads, vr);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            out["vr_factor"] = res.vr_factor;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("sigma"),
+        py::arg("cholesky"),
+        py::arg("r"),
+        py::arg("T"),
+        py::arg("payoff"),
+        py::arg("is_call"),
+        py::arg("K"),
+        py::arg("weights") = std::vector<double>{},
+        py::arg("n_paths") = 100000,
+        py::arg("seed") = 42,
+        py::arg("n_threads") = 1,
+        py::arg("variance_reduction") = 0,
+        "Monte Carlo price for a basket/spread (payoff=0, signed weights) or "
+        "best-of (1) option under correlated multi-asset GBM. cholesky is the "
+        "row-major lower-triangular factor of the correlation matrix."
+    );
+
+    m.def(
+        "mc_price_european_arrays",
+        [](const carray<double>& S0,
+           const carray<double>& K,
+           const carray<double>& r,
+           const carray<double>& sigma,
+           const carray<double>& T,
+           const carray<bool>& is_call,
+           std::size_t n_paths,
+           unsigned int seed,
+           carray<double> price_out,
+           carray<double> std_error_out,
+           unsigned int n_threads) {
+            const py::ssize_t n_rows = S0.ndim() == 1 ? S0.shape(0) : -1;
+            check_column(S0, "S0", n_rows);
+            check_column(K, "K", n_rows);
+            check_column(r, "r", n_rows);
+            check_column(sigma, "sigma", n_rows);
+            check_column(T, "T", n_rows);
+            check_column(is_call, "is_call", n_rows);
+            check_column(price_out, "price_out", n_rows);
+            check_column(std_error_out, "std_error_out", n_rows);
+
+            // Raw pointers are taken with the GIL held, then the kernel runs without it
+            const double* s0_ptr = S0.data();
+            const double* k_ptr = K.data();
+            const double* r_ptr = r.data();
+            const double* sigma_ptr = sigma.data();
+            const double* t_ptr = T.data();
+            const bool* call_ptr = is_call.data();
+            double* price_ptr = price_out.mutable_data();
+            double* se_ptr = std_error_out.mutable_data();
+            {
+                py::gil_scoped_release release;
+                mc_price_european_rows(
+                    s0_ptr, k_ptr, r_ptr, sigma_ptr, t_ptr, call_ptr,
+                    static_cast<std::size_t>(n_rows), n_paths, seed,
+                    price_ptr, se_ptr, n_threads);
+            }
+        },
+        py::arg("S0").noconvert(),
+        py::arg("K").noconvert(),
+        py::arg("r").noconvert(),
+        py::arg("sigma").noconvert(),
+        py::arg("T").noconvert(),
+        py::arg("is_call").noconvert(),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("price_out").noconvert(),
+        py::arg("std_error_out").noconvert(),
+        py::arg("n_threads") = 1,
+        "Row-wise European MC prices over contiguous float64 columns (bool "
+        "is_call), written in place into preallocated float64 outputs."
+    );
+
+    m.def(
+        "mc_price_european_batch",
+        [](double S0,
+           double r,
+           double sigma,
+           const std::vector<double>& K,
+           const std::vector<double>& T,
+           const std::vector<bool>& is_call,
+           std::size_t n_paths,
+           unsigned int seed,
+           unsigned int n_threads) {
+            MCBatchResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_batch(S0, r, sigma, K, T, is_call, n_paths, seed,
+                                              n_threads);
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
+            return out;
+        },
+        py::arg("S0"),
+        py::arg("r"),
+        py::arg("sigma"),
+        py::arg("K"),
+        py::arg("T"),
+        py::arg("is_call"),
+        py::arg("n_paths"),
+        py::arg("seed"),
+        py::arg("n_threads") = 1,
+        "Monte Carlo prices for a book of European options sharing one simulation."
+    );
+
+    m.def(
+        "mc_price_european_ladder",
+        [](double S0,
+           double K,
+           double r,
+           double sigma,
+           double T,
+           const std::vector<double>& spot_bumps,
+           const std::vector<double>& vol_bumps,
+           std::size_t n_paths,
+           unsigned int seed,
+           bool is_call,
+           unsigned int n_threads,
+           int variance_reduction) {
+            MCBatchResult res;
+            {
+                py::gil_scoped_release release;
+                res = mc_price_european_ladder(
+                    S0, K, r, sigma, T, spot_bumps, vol_bumps, n_paths, seed, is_call,
+                    n_threads, static_cast<VarianceReduction>(variance_reduction));
+            }
+            py::dict out;
+            out["price"] = res.price;
+            out["std_error"] = res.std_error;
             return out;
         },
         py::arg("S0"),
@@ -30,9 +683,14 @@ PYBIND11_MODULE(_mc_core, m) {
         py::arg("r"),
         py::arg("sigma"),
         py::arg("T"),
+        py::arg("spot_bumps"),
+        py::arg("vol_bumps"),
         py::arg("n_paths"),
         py::arg("seed"),
         py::arg("is_call"),
-        "Monte Carlo price for a European option (call/put) under GBM."
+        py::arg("n_threads") = 0,
+        py::arg("variance_reduction") = 0,
+        "Monte Carlo prices of one European option over a spot x vol bump grid (row-major), "
+        "all cells sharing the same normals."
     );
 }
@@ -0,0 +1,333 @@
+#include "mc_core.hpp"
+#include "mc_detail.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+#include <vector>
+
+using namespace mc_detail;
+
+namespace {
+
+constexpr std::size_t kMaxBasis = 8;
+
+// Normal equations X'X c = X'y of one regression, accumulated per block
+// and merged in block order so the fit does not depend on threads
+struct NormalEquations {
+    double xx[kMaxBasis * kMaxBasis] = {};
+    double xy[kMaxBasis] = {};
+    std::size_t n = 0;
+
+    void merge(const NormalEquations& o) {
+        for (std::size_t i = 0; i < kMaxBasis * kMaxBasis; ++i) {
+            xx[i] += o.xx[i];
+        }
+        for (std::size_t i = 0; i < kMaxBasis; ++i) {
+            xy[i] += o.xy[i];
+        }
+        n += o.n;
+    }
+
+    // Gaussian elimination with partial pivoting on the symmetric system;
+    // false if it is (numerically) singular
+    bool solve(std::size_t n_basis, double* coef) const {
+        double a[kMaxBasis][kMaxBasis + 1];
+        for (std::size_t i = 0; i < n_basis; ++i) {
+            for (std::size_t j = 0; j < n_basis; ++j) {
+                a[i][j] = j <= i ? xx[i * kMaxBasis + j] : xx[j * kMaxBasis + i];
+            }
+            a[i][n_basis] = xy[i];
+        }
+        double scale = 0.0;
+        for (std::size_t i = 0; i < n_basis; ++i) {
+            scale = std::max(scale, std::fabs(a[i][i]));
+        }
+        for (std::size_t c = 0; c < n_basis; ++c) {
+            std::size_t pivot = c;
+            for (std::size_t i = c + 1; i < n_basis; ++i) {
+                if (std::fabs(a[i][c]) > std::fabs(a[pivot][c])) {
+                    pivot = i;
+                }
+            }
+            if (std::fabs(a[pivot][c]) <= 1e-13 * scale) {
+                return false;
+            }
+            std::swap(a[c], a[pivot]);
+            for (std::size_t i = c + 1; i < n_basis; ++i) {
+                const double f = a[i][c] / a[c][c];
+                for (std::size_t j = c; j <= n_basis; ++j) {
+                    a[i][j] -= f * a[c][j];
+                }
+            }
+        }
+        for (std::size_t c = n_basis; c-- > 0;) {
+            double v = a[c][n_basis];
+            for (std::size_t j = c + 1; j < n_basis; ++j) {
+                v -= a[c][j] * coef[j];
+            }
+            coef[c] = v / a[c][c];
+        }
+        return true;
+    }
+};
+
+// Paths per tile: normals are drawn into a buffer, then W, S and the
+// regression terms are updated in branch-free loops over the tile
+constexpr std::size_t kLSMTile = 256;
+
+// Per-block path state: Brownian motion W(t_k), spot at t_k and the cash
+// flow discounted to t_0
+struct LSMBlock {
+    ZigguratNormals normal;
+    std::vector<double> W;
+    std::vector<double> S;
+    std::vector<double> cash_flow;
+    NormalEquations eq;
+
+    LSMBlock(unsigned int seed, std::size_t b, std::size_t n)
+        : normal(seed, b), W(n), S(n), cash_flow(n) {}
+};
+
+// Indices (within the tile) of in-the-money paths, written without
+// branches; returns how many there are
+template <bool IsCall>
+inline std::size_t in_the_money(const double* S, std::size_t n, double K, std::size_t* idx) {
+    std::size_t m = 0;
+    for (std::size_t p = 0; p < n; ++p) {
+        idx[m] = p;
+        m += IsCall ? S[p] > K : S[p] < K;
+    }
+    return m;
+}
+
+// Laguerre polynomials L_0..L_{n_basis - 1} of S / K for the m compacted
+// paths, column-major: x[i * kLSMTile + q] (same recurrence as
+// laguerre_basis in mcengine/american.py)
+inline void tile_basis(
+    const double* S, const std::size_t* idx, std::size_t m, double inv_K,
+    std::size_t n_basis, double* x
+) {
+    for (std::size_t q = 0; q < m; ++q) {
+        const double u = S[idx[q]] * inv_K;
+        x[q] = 1.0;
+        x[kLSMTile + q] = 1.0 - u;
+    }
+    for (std::size_t k = 1; k + 1 < n_basis; ++k) {
+        const double kd = static_cast<double>(k);
+        const double* prev = x + (k - 1) * kLSMTile;
+        const double* cur = x + k * kLSMTile;
+        double* next = x + (k + 1) * kLSMTile;
+        for (std::size_t q = 0; q < m; ++q) {
+            const double u = S[idx[q]] * inv_K;
+            next[q] = ((2.0 * kd + 1.0 - u) * cur[q] - kd * prev[q]) / (kd + 1.0);
+        }
+    }
+}
+
+// One date of the backward pass for a block: bridge W back to t, refresh
+// S and add the in-the-money regression terms to block.eq
+template <bool IsCall, bool PolyExp>
+void lsm_forward_block(
+    LSMBlock& block, double shrink, double sd, double log_S0_drift, double sigma,
+    double K, double inv_K, std::size_t n_basis
+) {
+    block.eq = NormalEquations{};
+    double z[kLSMTile];
+    std::size_t idx[kLSMTile];
+    double x[kMaxBasis * kLSMTile];
+    const std::size_t n_block = block.W.size();
+
+    for (std::size_t begin = 0; begin < n_block; begin += kLSMTile) {
+        const std::size_t n = std::min(kLSMTile, n_block - begin);
+        double* W = block.W.data() + begin;
+        double* S = block.S.data() + begin;
+        const double* cf = block.cash_flow.data() + begin;
+
+        for (std::size_t p = 0; p < n; ++p) {
+            z[p] = block.normal();
+        }
+        for (std::size_t p = 0; p < n; ++p) {
+            W[p] = shrink * W[p] + sd * z[p];
+            const double arg = log_S0_drift + sigma * W[p];
+            S[p] = PolyExp ? exp_poly(arg) : std::exp(arg);
+        }
+
+        const std::size_t m = in_the_money<IsCall>(S, n, K, idx);
+        tile_basis(S, idx, m, inv_K, n_basis, x);
+        for (std::size_t i = 0; i < n_basis; ++i) {
+            const double* xi = x + i * kLSMTile;
+            for (std::size_t j = 0; j <= i; ++j) {
+                const double* xj = x + j * kLSMTile;
+                double acc = 0.0;
+                for (std::size_t q = 0; q < m; ++q) {
+                    acc += xi[q] * xj[q];
+                }
+                block.eq.xx[i * kMaxBasis + j] += acc;
+            }
+            double acc = 0.0;
+            for (std::size_t q = 0; q < m; ++q) {
+                acc += xi[q] * cf[idx[q]];
+            }
+            block.eq.xy[i] += acc;
+        }
+        block.eq.n += m;
+    }
+}
+
+// Exercise where the discounted exercise value beats the fitted
+// continuation value
+template <bool IsCall>
+void lsm_exercise_block(
+    LSMBlock& block, const double* coef, double disc, double K, double inv_K,
+    std::size_t n_basis
+) {
+    std::size_t idx[kLSMTile];
+    double x[kMaxBasis * kLSMTile];
+    double continuation[kLSMTile];
+    const std::size_t n_block = block.S.size();
+
+    for (std::size_t begin = 0; begin < n_block; begin += kLSMTile) {
+        const std::size_t n = std::min(kLSMTile, n_block - begin);
+        const double* S = block.S.data() + begin;
+        double* cf = block.cash_flow.data() + begin;
+
+        const std::size_t m = in_the_money<IsCall>(S, n, K, idx);
+        tile_basis(S, idx, m, inv_K, n_basis, x);
+        for (std::size_t q = 0; q < m; ++q) {
+            continuation[q] = coef[0];
+        }
+        for (std::size_t i = 1; i < n_basis; ++i) {
+            const double* xi = x + i * kLSMTile;
+            for (std::size_t q = 0; q < m; ++q) {
+                continuation[q] += coef[i] * xi[q];
+            }
+        }
+        for (std::size_t q = 0; q < m; ++q) {
+            const std::size_t p = idx[q];
+            const double exercise = disc * (IsCall ? S[p] - K : K - S[p]);
+            cf[p] = exercise > continuation[q] ? exercise : cf[p];
+        }
+    }
+}
+
+inline double exercise_value(bool is_call, double S, double K) {
+    return std::max(is_call ? S - K : K - S, 0.0);
+}
+
+}  // namespace
+
+MCAmericanResult mc_price_american_lsm(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_exercise,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    std::size_t n_basis,
+    unsigned int n_threads
+) {
+    if (n_exercise < 1 || n_paths < 2) {
+        throw std::invalid_argument("need n_exercise >= 1 and n_paths >= 2");
+    }
+    if (n_basis < 2 || n_basis > kMaxBasis) {
+        throw std::invalid_argument("n_basis must be in [2, 8]");
+    }
+
+    const std::size_t n_blocks = (n_paths + kBlockPaths - 1) / kBlockPaths;
+    std::vector<LSMBlock> blocks;
+    blocks.reserve(n_blocks);
+    for (std::size_t b = 0; b < n_blocks; ++b) {
+        blocks.emplace_back(seed, b, std::min(kBlockPaths, n_paths - b * kBlockPaths));
+    }
+
+    const double dt = T / static_cast<double>(n_exercise);
+    const double drift = r - 0.5 * sigma * sigma;
+    const double inv_K = 1.0 / K;
+
+    // Maturity: W_T and the discounted terminal payoff
+    const double T_grid = dt * static_cast<double>(n_exercise);
+    const double disc_T = std::exp(-r * T_grid);
+    parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+        LSMBlock& block = blocks[b];
+        const double sd = std::sqrt(T_grid);
+        for (std::size_t p = 0; p < block.W.size(); ++p) {
+            block.W[p] = sd * block.normal();
+            const double S = S0 * std::exp(drift * T_grid + sigma * block.W[p]);
+            block.cash_flow[p] = disc_T * exercise_value(is_call, S, K);
+        }
+    });
+    double european = 0.0;
+    for (const LSMBlock& block : blocks) {
+        for (double v : block.cash_flow) {
+            european += v;
+        }
+    }
+
+    // Backward induction, bridging W from t_{k+1} back to t_k. |W(t_k)|
+    // is at most kZigguratMaxAbs times the summed step deviations, which
+    // bounds the exponent for exp_poly
+    double w_bound = std::sqrt(T_grid);
+    for (std::size_t k = 1; k < n_exercise; ++k) {
+        const double kd = static_cast<double>(k);
+        w_bound += std::sqrt(dt * kd / (kd + 1.0));
+    }
+    const bool poly = std::fabs(std::log(S0)) + std::fabs(drift) * T_grid +
+                          kZigguratMaxAbs * std::fabs(sigma) * w_bound <
+                      kPolyExpLimit;
+
+    double coef[kMaxBasis];
+    for (std::size_t k = n_exercise - 1; k >= 1; --k) {
+        const double kd = static_cast<double>(k);
+        const double t = kd * dt;
+        const double shrink = kd / (kd + 1.0);
+        const double sd = std::sqrt(dt * shrink);
+        const double disc = std::exp(-r * t);
+        const double log_S0_drift = std::log(S0) + drift * t;
+
+        parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+            auto run = [&](auto kernel) {
+                kernel(blocks[b], shrink, sd, log_S0_drift, sigma, K, inv_K, n_basis);
+            };
+            if (is_call) {
+                poly ? run(lsm_forward_block<true, true>) : run(lsm_forward_block<true, false>);
+            } else {
+                poly ? run(lsm_forward_block<false, true>) : run(lsm_forward_block<false, false>);
+            }
+        });
+
+        NormalEquations eq;
+        for (const LSMBlock& block : blocks) {
+            eq.merge(block.eq);
+        }
+        if (eq.n < n_basis || !eq.solve(n_basis, coef)) {
+            continue;
+        }
+
+        parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+            if (is_call) {
+                lsm_exercise_block<true>(blocks[b], coef, disc, K, inv_K, n_basis);
+            } else {
+                lsm_exercise_block<false>(blocks[b], coef, disc, K, inv_K, n_basis);
+            }
+        });
+    }
+
+    double sum = 0.0;
+    double sum_sq = 0.0;
+    for (const LSMBlock& block : blocks) {
+        for (double v : block.cash_flow) {
+            sum += v;
+            sum_sq += v * v;
+        }
+    }
+    const double n = static_cast<double>(n_paths);
+    MCAmericanResult out;
+    out.price = sum / n;
+    out.std_error = std::sqrt(std::max(sum_sq / n - out.price * out.price, 0.0) / n);
+    out.european_price = european / n;
+    return out;
+}
@@ -1,8 +1,276 @@
 #include "mc_core.hpp"
+#include "mc_detail.hpp"
+#include "mc_summaries.hpp"
+#include "sobol.hpp"
 
 #include <algorithm>
 #include <cmath>
+#include <numeric>
 #include <random>
+#include <stdexcept>
+#include <type_traits>
+
+using namespace mc_detail;
+
+namespace {
+
+// Maps one standard normal draw to (discounted payoff, discounted S_T).
+// Real is the precision of the per-path arithmetic; the PathValue handed
+// to the (double) accumulators is widened back to double.
+template <class Real = double>
+struct EuropeanEval {
+    Real S0;
+    Real K;
+    Real disc_factor;
+    Real drift;
+    Real diffusion_scale;
+    bool is_call;
+
+    EuropeanEval(double S0_, double K_, double r, double sigma, double T, bool is_call_)
+        : S0(static_cast<Real>(S0_)),
+          K(static_cast<Real>(K_)),
+          disc_factor(static_cast<Real>(std::exp(-r * T))),
+          drift(static_cast<Real>((r - 0.5 * sigma * sigma) * T)),
+          diffusion_scale(static_cast<Real>(sigma * std::sqrt(T))),
+          is_call(is_call_) {}
+
+    PathValue operator()(const double* z) const {
+        const Real ST = S0 * std::exp(drift + diffusion_scale * static_cast<Real>(z[0]));
+        const Real payoff = is_call ? std::max(ST - K, Real(0))
+                                    : std::max(K - ST, Real(0));
+        return PathValue{static_cast<double>(disc_factor * payoff),
+                         static_cast<double>(disc_factor * ST)};
+    }
+};
+
+// Tile evaluator of the European block kernel (see simulate_tiles): S_T
+// and the discounted payoff over a contiguous run of normals. Call/put is
+// a template parameter and exp is exp_poly, so the loop has no branches
+// or libm calls and the compiler vectorises it.
+template <class Real, bool IsCall>
+struct EuropeanTileEval {
+    EuropeanEval<Real> params;
+
+    void operator()(const double* z, std::size_t n, PathValue* out) const {
+        const Real S0 = params.S0;
+        const Real K = params.K;
+        const Real disc_factor = params.disc_factor;
+        const Real drift = params.drift;
+        const Real scale = params.diffusion_scale;
+
+        for (std::size_t i = 0; i < n; ++i) {
+            const Real ST = S0 * exp_poly(drift + scale * static_cast<Real>(z[i]));
+            const Real intrinsic = IsCall ? ST - K : K - ST;
+            const Real payoff = intrinsic > Real(0) ? intrinsic : Real(0);
+            out[i] = PathValue{static_cast<double>(disc_factor * payoff),
+                               static_cast<double>(disc_factor * ST)};
+        }
+    }
+};
+
+// Moment sums of the European block kernel: per-block ZigguratNormals
+// streams, drawn and evaluated a tile at a time.
+template <class Real>
+PathSums european_block_sums(
+    const EuropeanEval<Real>& eval,
+    unsigned int seed,
+    std::size_t n_units,
+    VarianceReduction vr,
+    unsigned int n_threads
+) {
+    const double limit = std::is_same<Real, float>::value ? kPolyExpLimitF : kPolyExpLimit;
+    const double max_arg = std::fabs(static_cast<double>(eval.drift)) +
+                           kZigguratMaxAbs * std::fabs(static_cast<double>(eval.diffusion_scale));
+    if (!(max_arg < limit)) {
+        // exp_poly could overflow: same normals, scalar std::exp
+        return simulate_blocks<ZigguratNormals>(seed, 1, n_units, eval, vr, n_threads);
+    }
+    if (eval.is_call) {
+        return simulate_tile_blocks<ZigguratNormals>(
+            seed, 1, n_units, EuropeanTileEval<Real, true>{eval}, vr, n_threads);
+    }
+    return simulate_tile_blocks<ZigguratNormals>(
+        seed, 1, n_units, EuropeanTileEval<Real, false>{eval}, vr, n_threads);
+}
+
+// Scalar EuropeanEval (std::exp) presented as a tile evaluator
+template <class Real>
+struct EuropeanScalarTileEval {
+    EuropeanEval<Real> params;
+
+    void operator()(const double* z, std::size_t n, PathValue* out) const {
+        for (std::size_t i = 0; i < n; ++i) {
+            out[i] = params(z + i);
+        }
+    }
+};
+
+// european_block_sums with streaming summaries. simulate_tiles draws the
+// same normals in the same order as simulate_paths, so the sums match the
+// plain kernel, fallback included.
+template <class Real>
+PathSums european_summarised_sums(
+    const EuropeanEval<Real>& eval,
+    unsigned int seed,
+    std::size_t n_units,
+    VarianceReduction vr,
+    unsigned int n_threads,
+    const SummarySpec& spec,
+    BlockSummaries& summaries
+) {
+    const double terminal_scale = 1.0 / static_cast<double>(eval.disc_factor);
+    const double limit = std::is_same<Real, float>::value ? kPolyExpLimitF : kPolyExpLimit;
+    const double max_arg = std::fabs(static_cast<double>(eval.drift)) +
+                           kZigguratMaxAbs * std::fabs(static_cast<double>(eval.diffusion_scale));
+    auto run = [&](auto&& eval_tile) {
+        return simulate_summarised_tile_blocks<ZigguratNormals>(
+            seed, 1, n_units, eval_tile, vr, n_threads, terminal_scale, summaries, spec);
+    };
+    if (!(max_arg < limit)) {
+        return run(EuropeanScalarTileEval<Real>{eval});
+    }
+    if (eval.is_call) {
+        return run(EuropeanTileEval<Real, true>{eval});
+    }
+    return run(EuropeanTileEval<Real, false>{eval});
+}
+
+PathSums european_sums(
+    double S0, double K, double r, double sigma, double T, bool is_call,
+    Precision precision, unsigned int seed, std::size_t n_units,
+    VarianceReduction vr, unsigned int n_threads
+) {
+    if (precision == Precision::Single) {
+        return european_block_sums(
+            EuropeanEval<float>(S0, K, r, sigma, T, is_call), seed, n_units, vr, n_threads);
+    }
+    return european_block_sums(
+        EuropeanEval<double>(S0, K, r, sigma, T, is_call), seed, n_units, vr, n_threads);
+}
+
+// Paths per tile of the ladder kernel and accumulator lanes per cell.
+// Lanes give the reduction independent partial sums the compiler can
+// vectorise without reassociating; they are folded in a fixed order.
+constexpr std::size_t kLadderTile = 256;
+constexpr std::size_t kLadderLanes = 8;
+
+// Per-cell sums of the ladder kernel, cells row-major (spot, vol); the
+// batch kernel uses one cell per product
+struct LadderSums {
+    double n = 0.0;
+    std::vector<double> sum;
+    std::vector<double> sum_sq;
+
+    explicit LadderSums(std::size_t n_cells = 0) : sum(n_cells, 0.0), sum_sq(n_cells, 0.0) {}
+
+    void merge(const LadderSums& o) {
+        n += o.n;
+        for (std::size_t c = 0; c < sum.size(); ++c) {
+            sum[c] += o.sum[c];
+            sum_sq[c] += o.sum_sq[c];
+        }
+    }
+};
+
+// One block of the ladder: each tile of normals is mapped to the unit-spot
+// growth factor exp(drift_j + scale_j z) once per vol, then rescaled to
+// every spot. With antithetic pairs, `down` holds the growth for -z.
+template <bool IsCall, bool Antithetic, bool PolyExp>
+void ladder_block(
+    ZigguratNormals& normal,
+    std::size_t n_units,
+    double K,
+    double disc_factor,
+    const std::vector<double>& spots,
+    const std::vector<double>& drifts,
+    const std::vector<double>& scales,
+    LadderSums& out
+) {
+    const std::size_t n_vols = drifts.size();
+    double z[kLadderTile];
+    double up[kLadderTile];
+    double down[kLadderTile];
+
+    for (std::size_t begin = 0; begin < n_units; begin += kLadderTile) {
+        const std::size_t n = std::min(kLadderTile, n_units - begin);
+        for (std::size_t p = 0; p < n; ++p) {
+            z[p] = normal();
+        }
+
+        for (std::size_t j = 0; j < n_vols; ++j) {
+            const double drift = drifts[j];
+            const double scale = scales[j];
+            for (std::size_t p = 0; p < n; ++p) {
+                up[p] = PolyExp ? exp_poly(drift + scale * z[p]) : std::exp(drift + scale * z[p]);
+                if (Antithetic) {
+                    down[p] = PolyExp ? exp_poly(drift - scale * z[p])
+                                      : std::exp(drift - scale * z[p]);
+                }
+            }
+
+            for (std::size_t i = 0; i < spots.size(); ++i) {
+                const double S = spots[i];
+                auto value = [&](std::size_t p) {
+                    const double a = IsCall ? S * up[p] - K : K - S * up[p];
+                    double v = a > 0.0 ? a : 0.0;
+                    if (Antithetic) {
+                        const double b = IsCall ? S * down[p] - K : K - S * down[p];
+                        v = 0.5 * (v + (b > 0.0 ? b : 0.0));
+                    }
+                    return disc_factor * v;
+                };
+
+                double sum[kLadderLanes] = {};
+                double sum_sq[kLadderLanes] = {};
+                std::size_t p = 0;
+                for (; p + kLadderLanes <= n; p += kLadderLanes) {
+                    for (std::size_t k = 0; k < kLadderLanes; ++k) {
+                        const double v = value(p + k);
+                        sum[k] += v;
+                        sum_sq[k] += v * v;
+                    }
+                }
+                for (; p < n; ++p) {
+                    const double v = value(p);
+                    sum[0] += v;
+                    sum_sq[0] += v * v;
+                }
+
+                const std::size_t c = i * n_vols + j;
+                for (std::size_t k = 0; k < kLadderLanes; ++k) {
+                    out.sum[c] += sum[k];
+                    out.sum_sq[c] += sum_sq[k];
+                }
+            }
+        }
+        out.n += static_cast<double>(n);
+    }
+}
+
+// Sums and sums of squares for (discounted payoff, delta, gamma, vega)
+struct GreekSums {
+    double n = 0.0;
+    double sum[4]    = {0.0, 0.0, 0.0, 0.0};
+    double sum_sq[4] = {0.0, 0.0, 0.0, 0.0};
+
+    void add(const double (&x)[4]) {
+        n += 1.0;
+        for (int k = 0; k < 4; ++k) {
+            sum[k] += x[k];
+            sum_sq[k] += x[k] * x[k];
+        }
+    }
+
+    void merge(const GreekSums& o) {
+        n += o.n;
+        for (int k = 0; k < 4; ++k) {
+            sum[k] += o.sum[k];
+            sum_sq[k] += o.sum_sq[k];
+        }
+    }
+};
+
+}  // namespace
 
 MCResult mc_price_european(
     double S0,
@@ -12,46 +280,478 @@ MCResult mc_price_european(
     double T,
     std::size_t n_paths,
     unsigned int seed,
-    bool is_call
+    bool is_call,
+    VarianceReduction vr,
+    Precision precision
 ) {
-    std::mt19937 rng(seed);
-    std::normal_distribution<double> normal(0.0, 1.0);
+    const PathSums sums = european_sums(
+        S0, K, r, sigma, T, is_call, precision, seed, units_for(n_paths, vr), vr, 1);
+    return finalize(sums, S0, vr);
+}
+
+MCResult mc_price_european_parallel(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    VarianceReduction vr,
+    Precision precision
+) {
+    // Blocks are sized in estimator units (paths, or antithetic pairs)
+    const PathSums sums = european_sums(
+        S0, K, r, sigma, T, is_call, precision, seed, units_for(n_paths, vr), vr, n_threads);
+    return finalize(sums, S0, vr);
+}
+
+MCResult mc_price_european_summarised(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    const SummarySpec& spec,
+    MCSummaries& summaries,
+    VarianceReduction vr,
+    Precision precision
+) {
+    if (spec.n_bins == 0 || !(spec.high > spec.low) || spec.sample_size == 0 ||
+        spec.max_buckets == 0 || !(spec.relative_accuracy > 0.0 && spec.relative_accuracy < 1.0)) {
+        throw std::invalid_argument("invalid SummarySpec");
+    }
+    const std::size_t n_units = units_for(n_paths, vr);
+    BlockSummaries merged(spec);
+    const PathSums sums =
+        precision == Precision::Single
+            ? european_summarised_sums(EuropeanEval<float>(S0, K, r, sigma, T, is_call),
+                                       seed, n_units, vr, n_threads, spec, merged)
+            : european_summarised_sums(EuropeanEval<double>(S0, K, r, sigma, T, is_call),
+                                       seed, n_units, vr, n_threads, spec, merged);
+    merged.export_to(summaries);
+    return finalize(sums, S0, vr);
+}
 
-    const double disc_factor      = std::exp(-r * T);
-    const double drift            = (r - 0.5 * sigma * sigma) * T;
-    const double diffusion_scale  = sigma * std::sqrt(T);
+MCBatchResult mc_price_european_ladder(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    const std::vector<double>& spot_bumps,
+    const std::vector<double>& vol_bumps,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    VarianceReduction vr
+) {
+    if (vr == VarianceReduction::ControlVariate) {
+        throw std::invalid_argument("the ladder kernel supports no variance reduction or antithetic");
+    }
+    const std::size_t n_spots = spot_bumps.size();
+    const std::size_t n_vols = vol_bumps.size();
 
-    double sum    = 0.0;
-    double sum_sq = 0.0;
+    std::vector<double> spots(n_spots);
+    for (std::size_t i = 0; i < n_spots; ++i) {
+        spots[i] = S0 * (1.0 + spot_bumps[i]);
+    }
+    std::vector<double> drifts(n_vols);
+    std::vector<double> scales(n_vols);
+    double max_arg = 0.0;
+    for (std::size_t j = 0; j < n_vols; ++j) {
+        const double vol = sigma + vol_bumps[j];
+        if (vol < 0.0) {
+            throw std::invalid_argument("bumped vols must be >= 0");
+        }
+        drifts[j] = (r - 0.5 * vol * vol) * T;
+        scales[j] = vol * std::sqrt(T);
+        max_arg = std::max(max_arg, std::fabs(drifts[j]) + kZigguratMaxAbs * scales[j]);
+    }
+    const double disc_factor = std::exp(-r * T);
+    const bool antithetic = vr == VarianceReduction::Antithetic;
+    const bool poly = max_arg < kPolyExpLimit;
 
-    for (std::size_t i = 0; i < n_paths; ++i) {
-        const double Z  = normal(rng);
-        const double ST = S0 * std::exp(drift + diffusion_scale * Z);
+    // Same per-block streams as mc_price_european_parallel
+    const std::size_t n_units = units_for(n_paths, vr);
+    const std::size_t n_blocks = (n_units + kBlockPaths - 1) / kBlockPaths;
+    std::vector<LadderSums> block_sums(n_blocks, LadderSums(n_spots * n_vols));
 
-        double payoff = 0.0;
+    parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+        ZigguratNormals normal(seed, b);
+        const std::size_t n = std::min(kBlockPaths, n_units - b * kBlockPaths);
+        auto run = [&](auto kernel) {
+            kernel(normal, n, K, disc_factor, spots, drifts, scales, block_sums[b]);
+        };
+        // Dispatch the compile-time variants once per block
         if (is_call) {
-            payoff = std::max(ST - K, 0.0);
+            if (antithetic) {
+                poly ? run(ladder_block<true, true, true>) : run(ladder_block<true, true, false>);
+            } else {
+                poly ? run(ladder_block<true, false, true>) : run(ladder_block<true, false, false>);
+            }
         } else {
-            payoff = std::max(K - ST, 0.0);
+            if (antithetic) {
+                poly ? run(ladder_block<false, true, true>) : run(ladder_block<false, true, false>);
+            } else {
+                poly ? run(ladder_block<false, false, true>) : run(ladder_block<false, false, false>);
+            }
+        }
+    });
+
+    LadderSums sums(n_spots * n_vols);
+    for (const LadderSums& block : block_sums) {
+        sums.merge(block);
+    }
+
+    MCBatchResult out;
+    out.price.assign(n_spots * n_vols, 0.0);
+    out.std_error.assign(n_spots * n_vols, 0.0);
+    if (sums.n <= 0.0) {
+        return out;
+    }
+    for (std::size_t c = 0; c < n_spots * n_vols; ++c) {
+        const double mean = sums.sum[c] / sums.n;
+        const double variance = std::max(sums.sum_sq[c] / sums.n - mean * mean, 0.0);
+        out.price[c] = mean;
+        out.std_error[c] = std::sqrt(variance / sums.n);
+    }
+    return out;
+}
+
+MCResult mc_price_european_scalar(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    VarianceReduction vr
+) {
+    std::mt19937 rng(seed);
+    std::normal_distribution<double> normal(0.0, 1.0);
+
+    const EuropeanEval<> eval(S0, K, r, sigma, T, is_call);
+
+    PathSums sums;
+    simulate_paths([&] { return normal(rng); }, 1, units_for(n_paths, vr), eval, vr, sums);
+
+    return finalize(sums, S0, vr);
+}
+
+MCGreeksResult mc_price_european_greeks(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    bool antithetic
+) {
+    const EuropeanEval<> eval(S0, K, r, sigma, T, is_call);
+    const double sqrt_T   = std::sqrt(T);
+    const double lr_scale = 1.0 / (sigma * sqrt_T);
+
+    // (discounted payoff, delta, gamma, vega) for one normal draw
+    auto greeks = [&](double Z, double (&out)[4]) {
+        const PathValue v = eval(&Z);
+        const double ST   = v.control / eval.disc_factor;
+        const bool itm    = is_call ? (ST > K) : (ST < K);
+        const double pathwise = itm ? (is_call ? v.control : -v.control) : 0.0;
+
+        out[0] = v.discounted;
+        out[1] = pathwise / S0;
+        out[2] = out[1] * (Z * lr_scale - 1.0) / S0;
+        out[3] = pathwise * (sqrt_T * Z - sigma * T);
+    };
+
+    const std::size_t n_units  = antithetic ? n_paths / 2 : n_paths;
+    const std::size_t n_blocks = (n_units + kBlockPaths - 1) / kBlockPaths;
+    std::vector<GreekSums> block_sums(n_blocks);
+
+    parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+        ZigguratNormals normal(seed, b);
+
+        const std::size_t begin = b * kBlockPaths;
+        const std::size_t end   = std::min(begin + kBlockPaths, n_units);
+        double x[4], y[4];
+        for (std::size_t i = begin; i < end; ++i) {
+            const double Z = normal();
+            greeks(Z, x);
+            if (antithetic) {
+                greeks(-Z, y);
+                for (int k = 0; k < 4; ++k) {
+                    x[k] = 0.5 * (x[k] + y[k]);
+                }
+            }
+            block_sums[b].add(x);
+        }
+    });
+
+    GreekSums sums;
+    for (const GreekSums& block : block_sums) {
+        sums.merge(block);
+    }
+
+    double mean[4] = {0.0, 0.0, 0.0, 0.0};
+    double se[4]   = {0.0, 0.0, 0.0, 0.0};
+    if (sums.n > 0.0) {
+        for (int k = 0; k < 4; ++k) {
+            mean[k] = sums.sum[k] / sums.n;
+            const double var = std::max(sums.sum_sq[k] / sums.n - mean[k] * mean[k], 0.0);
+            se[k] = std::sqrt(var / sums.n);
+        }
+    }
+
+    return MCGreeksResult{mean[0], se[0], mean[1], se[1], mean[2], se[2], mean[3], se[3]};
+}
+
+void mc_price_european_rows(
+    const double* S0,
+    const double* K,
+    const double* r,
+    const double* sigma,
+    const double* T,
+    const bool* is_call,
+    std::size_t n_rows,
+    std::size_t n_paths,
+    unsigned int seed,
+    double* price_out,
+    double* std_error_out,
+    unsigned int n_threads
+) {
+    parallel_for(n_rows, n_threads, [&](std::size_t i) {
+        Xoshiro256pp rng(seed, i);
+        std::normal_distribution<double> normal(0.0, 1.0);
+        const EuropeanEval<> eval(S0[i], K[i], r[i], sigma[i], T[i], is_call[i]);
+
+        PathSums sums;
+        simulate_paths([&] { return normal(rng); }, 1, n_paths, eval, VarianceReduction::None, sums);
+        const MCResult res = finalize(sums, S0[i], VarianceReduction::None);
+
+        price_out[i]     = res.price;
+        std_error_out[i] = res.std_error;
+    });
+}
+
+MCResult mc_price_european_rqmc(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    std::size_t n_randomizations,
+    unsigned int n_threads,
+    VarianceReduction vr
+) {
+    if (n_randomizations < 2) {
+        throw std::invalid_argument("n_randomizations must be >= 2");
+    }
+    const EuropeanEval<> eval(S0, K, r, sigma, T, is_call);
+    const std::size_t n_units = units_for(n_paths / n_randomizations, vr);
+    if (n_units == 0) {
+        return MCResult{0.0, 0.0};
+    }
+
+    // One independent scramble per randomisation, seeded like the
+    // parallel blocks so results do not depend on n_threads
+    std::vector<PathSums> rand_sums(n_randomizations);
+    std::vector<double> estimates(n_randomizations, 0.0);
+
+    parallel_for(n_randomizations, n_threads, [&](std::size_t k) {
+        std::mt19937 rng = make_block_rng(seed, k);
+        sobol::SobolSequence seq(1, rng);
+        simulate_paths([&] { return seq.next_normal(); }, 1, n_units, eval, vr, rand_sums[k]);
+        estimates[k] = finalize(rand_sums[k], S0, vr).price;
+    });
+
+    // Price and error bars from the spread of independent randomisations
+    const double R = static_cast<double>(n_randomizations);
+    double mean = 0.0;
+    for (double e : estimates) {
+        mean += e;
+    }
+    mean /= R;
+    double ss = 0.0;
+    for (double e : estimates) {
+        ss += (e - mean) * (e - mean);
+    }
+    const double std_error = std::sqrt(ss / (R - 1.0) / R);
+
+    PathSums total;
+    for (const PathSums& s : rand_sums) {
+        total.merge(s);
+    }
+    const double vr_factor = (std_error > 0.0)
+        ? crude_var_of_mean(total) / (std_error * std_error)
+        : 1.0;
+
+    return MCResult{mean, std_error, vr_factor};
+}
+
+namespace {
+
+// Products of a batch that share one maturity, with its GBM constants
+struct BatchGroup {
+    double disc_factor;
+    double drift;
+    double scale;
+    std::vector<std::size_t> products;  // indices into K / is_call
+};
+
+// Add the discounted payoffs of one strike over a run of S_T to its sums,
+// in kLadderLanes independent partial sums as in ladder_block
+template <bool IsCall>
+void add_payoff_sums(const double* ST, std::size_t n, double K, double disc_factor,
+                     double& sum_out, double& sum_sq_out) {
+    auto value = [&](std::size_t p) {
+        const double a = IsCall ? ST[p] - K : K - ST[p];
+        return disc_factor * (a > 0.0 ? a : 0.0);
+    };
+    double sum[kLadderLanes] = {};
+    double sum_sq[kLadderLanes] = {};
+    std::size_t p = 0;
+    for (; p + kLadderLanes <= n; p += kLadderLanes) {
+        for (std::size_t k = 0; k < kLadderLanes; ++k) {
+            const double v = value(p + k);
+            sum[k] += v;
+            sum_sq[k] += v * v;
+        }
+    }
+    for (; p < n; ++p) {
+        const double v = value(p);
+        sum[0] += v;
+        sum_sq[0] += v * v;
+    }
+    for (std::size_t k = 0; k < kLadderLanes; ++k) {
+        sum_out += sum[k];
+        sum_sq_out += sum_sq[k];
+    }
+}
+
+// One block of the batch kernel: the block's normals, then S_T once per
+// maturity group and the payoff sums of every strike in the group. Memory
+// is two kBlockPaths buffers, whatever n_paths is.
+template <bool PolyExp>
+void batch_block(
+    ZigguratNormals& normal,
+    std::size_t n,
+    double S0,
+    const std::vector<double>& K,
+    const std::vector<bool>& is_call,
+    const std::vector<BatchGroup>& groups,
+    LadderSums& out
+) {
+    std::vector<double> z(n);
+    std::vector<double> ST(n);
+    for (std::size_t p = 0; p < n; ++p) {
+        z[p] = normal();
+    }
+
+    for (const BatchGroup& g : groups) {
+        for (std::size_t p = 0; p < n; ++p) {
+            const double x = g.drift + g.scale * z[p];
+            ST[p] = S0 * (PolyExp ? exp_poly(x) : std::exp(x));
         }
+        for (const std::size_t idx : g.products) {
+            is_call[idx] ? add_payoff_sums<true>(ST.data(), n, K[idx], g.disc_factor,
+                                                 out.sum[idx], out.sum_sq[idx])
+                         : add_payoff_sums<false>(ST.data(), n, K[idx], g.disc_factor,
+                                                  out.sum[idx], out.sum_sq[idx]);
+        }
+    }
+    out.n += static_cast<double>(n);
+}
 
-        const double discounted = disc_factor * payoff;
+}  // namespace
 
-        sum    += discounted;
-        sum_sq += discounted * discounted;
+MCBatchResult mc_price_european_batch(
+    double S0,
+    double r,
+    double sigma,
+    const std::vector<double>& K,
+    const std::vector<double>& T,
+    const std::vector<bool>& is_call,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads
+) {
+    const std::size_t n_products = K.size();
+    if (T.size() != n_products || is_call.size() != n_products) {
+        throw std::invalid_argument("K, T and is_call must have the same length");
     }
 
-    const double n    = static_cast<double>(n_paths);
-    const double mean = sum / n;
+    MCBatchResult out;
+    out.price.assign(n_products, 0.0);
+    out.std_error.assign(n_products, 0.0);
+    if (n_products == 0 || n_paths == 0) {
+        return out;
+    }
 
-    const double mean_sq  = sum_sq / n;
-    double variance       = mean_sq - mean * mean;
-    if (variance < 0.0) {
-        variance = 0.0;  // guard against tiny negative due to FP error
+    // 1) Group product indices by maturity, in order of first appearance
+    std::vector<BatchGroup> groups;
+    std::vector<double> group_T;
+    double max_arg = 0.0;
+    for (std::size_t idx = 0; idx < n_products; ++idx) {
+        const auto it = std::find(group_T.begin(), group_T.end(), T[idx]);
+        if (it != group_T.end()) {
+            groups[it - group_T.begin()].products.push_back(idx);
+            continue;
+        }
+        const double Tg = T[idx];
+        group_T.push_back(Tg);
+        groups.push_back(BatchGroup{
+            std::exp(-r * Tg),
+            (r - 0.5 * sigma * sigma) * Tg,
+            sigma * std::sqrt(Tg),
+            {idx},
+        });
+        max_arg = std::max(max_arg, std::fabs(groups.back().drift) +
+                                        kZigguratMaxAbs * std::fabs(groups.back().scale));
     }
+    const bool poly = max_arg < kPolyExpLimit;
+
+    // 2) Per-block sums over the per-block streams of mc_price_european, so
+    //    memory is O(kBlockPaths) per thread and the result does not depend
+    //    on n_threads
+    const std::size_t n_blocks = (n_paths + kBlockPaths - 1) / kBlockPaths;
+    std::vector<LadderSums> block_sums(n_blocks, LadderSums(n_products));
+    parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+        ZigguratNormals normal(seed, b);
+        const std::size_t n = std::min(kBlockPaths, n_paths - b * kBlockPaths);
+        poly ? batch_block<true>(normal, n, S0, K, is_call, groups, block_sums[b])
+             : batch_block<false>(normal, n, S0, K, is_call, groups, block_sums[b]);
+    });
 
-    const double std_dev   = (variance > 0.0) ? std::sqrt(variance) : 0.0;
-    const double std_error = (n_paths > 0) ? std_dev / std::sqrt(n) : 0.0;
+    // 3) Merge in block order and finalise per product
+    LadderSums sums(n_products);
+    for (const LadderSums& block : block_sums) {
+        sums.merge(block);
+    }
+    for (std::size_t idx = 0; idx < n_products; ++idx) {
+        const double mean = sums.sum[idx] / sums.n;
+        double variance   = sums.sum_sq[idx] / sums.n - mean * mean;
+        if (variance < 0.0) {
+            variance = 0.0;
+        }
+        out.price[idx]     = mean;
+        out.std_error[idx] = std::sqrt(variance) / std::sqrt(sums.n);
+    }
 
-    return MCResult{mean, std_error};
+    return out;
 }
@@ -1,16 +1,64 @@
 #pragma once
 
 #include <cstddef>
+#include <cstdint>
+#include <vector>
+
+// Variance-reduction schemes shared by the European kernels.
+//
+// None           -> crude Monte Carlo.
+// Antithetic     -> each normal Z is paired with -Z; n_paths is rounded
+//                   down to an even number of paths (n_paths / 2 pairs).
+// ControlVariate -> discounted S_T is used as a control with known mean S0;
+//                   the optimal coefficient is estimated from the same paths.
+enum class VarianceReduction : int {
+    None = 0,
+    Antithetic = 1,
+    ControlVariate = 2,
+};
+
+// Floating-point type of the per-path arithmetic in the European kernels.
+// Single halves the width of every intermediate (S_T, payoff); the moment
+// sums are accumulated in double either way.
+enum class Precision : int {
+    Double = 0,
+    Single = 1,
+};
 
 struct MCResult {
     double price;
     double std_error;
+    // Crude-MC variance of the mean divided by the variance of the reported
+    // estimator; 1.0 for crude Monte Carlo.
+    double vr_factor = 1.0;
+};
+
+struct MCGreeksResult {
+    double price;
+    double std_error;
+    double delta;
+    double delta_std_error;
+    double gamma;
+    double gamma_std_error;
+    double vega;
+    double vega_std_error;
+};
+
+struct MCBatchResult {
+    std::vector<double> price;
+    std::vector<double> std_error;
 };
 
 // Monte Carlo price for a European call or put under risk–neutral GBM.
 //
 // If is_call is true  -> payoff = max(S_T - K, 0)
 // If is_call is false -> payoff = max(K - S_T, 0)
+//
+// Block kernel: normals come a batch at a time from per-block ziggurat
+// streams (as in mc_price_european_parallel), and S_T and the payoff are
+// computed over each batch in a branch-free, vectorisable loop. Runs on
+// the calling thread and returns the same result as
+// mc_price_european_parallel for any n_threads.
 MCResult mc_price_european(
     double S0,
     double K,
@@ -19,5 +67,367 @@ MCResult mc_price_european(
     double T,
     std::size_t n_paths,
     unsigned int seed,
-    bool is_call
+    bool is_call,
+    VarianceReduction vr = VarianceReduction::None,
+    Precision precision = Precision::Double
+);
+
+// Multithreaded variant of mc_price_european.
+//
+// Paths are split into fixed-size blocks; block b draws from its own
+// xoshiro256++ ziggurat stream seeded from (seed, b), and per-block sums
+// are reduced in block order. The result therefore depends only on
+// (seed, n_paths), never on n_threads. n_threads == 0 uses
+// std::thread::hardware_concurrency().
+MCResult mc_price_european_parallel(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    VarianceReduction vr = VarianceReduction::None,
+    Precision precision = Precision::Double
+);
+
+// The original one-path-at-a-time loop (single mt19937 stream,
+// std::normal_distribution, std::exp). Kept as the reference for the
+// block kernel's benchmark and to reproduce results seeded before it.
+MCResult mc_price_european_scalar(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    VarianceReduction vr = VarianceReduction::None
+);
+
+// Bins and sizes of the streaming summaries collected by
+// mc_price_european_summarised (see mcengine/summaries.py).
+struct SummarySpec {
+    double low;                        // S_T histogram range [low, high)
+    double high;
+    std::size_t n_bins;
+    double relative_accuracy = 0.01;   // payoff quantile sketch
+    std::size_t max_buckets = 2048;
+    std::size_t sample_size = 1000;    // payoff reservoir
+};
+
+// Summaries of every simulated path (both halves of antithetic pairs).
+struct MCSummaries {
+    std::vector<std::int64_t> histogram;  // S_T counts per bin
+    std::int64_t underflow = 0;
+    std::int64_t overflow = 0;
+    std::int64_t zero_count = 0;          // zero discounted payoffs
+    std::int64_t bucket_offset = 0;       // index of buckets[0]
+    std::vector<std::int64_t> buckets;    // log-spaced payoff buckets
+    std::vector<double> sample_keys;      // reservoir (bottom-k keys)
+    std::vector<double> sample_values;    // sampled discounted payoffs
+};
+
+// mc_price_european_parallel that also fills `summaries` during the same
+// pass: a histogram of S_T, a quantile sketch of the discounted payoffs
+// and a uniform reservoir sample of them. Price fields are identical to
+// mc_price_european_parallel for the same arguments; the summaries, like
+// the price, depend only on (seed, n_paths).
+MCResult mc_price_european_summarised(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    const SummarySpec& spec,
+    MCSummaries& summaries,
+    VarianceReduction vr = VarianceReduction::None,
+    Precision precision = Precision::Double
+);
+
+// Where an instrumented run spent its time. Stage times are summed over
+// blocks (CPU seconds across threads); reduction and wall are elapsed
+// time on the calling thread.
+struct MCStageTimes {
+    double rng = 0.0;         // normal draws
+    double exp = 0.0;         // S_T = S0 exp(...)
+    double payoff = 0.0;      // discounted payoff and control
+    double accumulate = 0.0;  // per-path moment sums
+    double reduction = 0.0;   // block merge and finalize
+    double wall = 0.0;
+    unsigned int n_threads = 0;       // threads actually used
+    std::size_t n_blocks = 0;
+    std::size_t bytes_allocated = 0;  // heap scratch of the kernel
+};
+
+// mc_price_european_parallel with per-stage timing written to `times`
+// (cpp/mc_instrumented.cpp). A separate entry point, so the plain kernels
+// carry no timing code at all. S_T and the payoff are evaluated in two
+// passes over each tile so they can be timed apart; the arithmetic, and
+// hence the result, is identical to mc_price_european_parallel. Stage
+// times are sampled on one tile in kStageSampleEvery, which keeps the run
+// time within noise of the plain kernel.
+MCResult mc_price_european_instrumented(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    MCStageTimes& times,
+    VarianceReduction vr = VarianceReduction::None,
+    Precision precision = Precision::Double
+);
+
+// Prices of one European option over a grid of spot and vol bumps.
+//
+// Cell (i, j), stored row-major at i * vol_bumps.size() + j, uses spot
+// S0 * (1 + spot_bumps[i]) and vol sigma + vol_bumps[j]. Every cell reuses
+// the same normals (common random numbers): per tile, the unit-spot
+// growth exp(drift_j + scale_j z) is computed once per vol and rescaled to
+// each spot. Uses the per-block streams of mc_price_european_parallel, so
+// the result is independent of n_threads. vr: None or Antithetic.
+MCBatchResult mc_price_european_ladder(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    const std::vector<double>& spot_bumps,
+    const std::vector<double>& vol_bumps,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    VarianceReduction vr = VarianceReduction::None
+);
+
+// Price, delta, gamma and vega of a European option in one kernel pass.
+//
+// Delta and vega are pathwise derivatives of the discounted payoff; gamma
+// is the pathwise delta times the likelihood-ratio score
+// (Z / (sigma sqrt(T)) - 1) / S0. All four share the same normals and get
+// their own standard errors. Uses the block-parallel, thread-count
+// invariant streams of mc_price_european_parallel; with antithetic = true
+// n_paths / 2 antithetic pairs are simulated.
+MCGreeksResult mc_price_european_greeks(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    bool antithetic = false
+);
+
+// Randomised quasi-Monte Carlo price using scrambled Sobol points.
+//
+// n_paths is split across n_randomizations independent scrambles (each
+// seeded from (seed, k)); price is the mean of the per-scramble estimates
+// and std_error is their sample standard deviation / sqrt(n_randomizations),
+// since the CLT error over QMC points is not valid. Scrambles run in
+// parallel over n_threads (0 = all hardware threads).
+MCResult mc_price_european_rqmc(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    std::size_t n_randomizations,
+    unsigned int n_threads,
+    VarianceReduction vr = VarianceReduction::None
+);
+
+// Path-dependent payoffs priced by the time-stepping kernel.
+enum class PathPayoff : int {
+    Asian = 0,     // arithmetic average over t_1..t_n
+    Barrier = 1,   // discretely monitored over t_0..t_n
+    Lookback = 2,  // extremes over t_0..t_n
+    European = 3,  // vanilla on S_T (for models without closed-form S_T)
+};
+
+enum class BarrierKind : int {
+    UpAndOut = 0,
+    DownAndOut = 1,
+    UpAndIn = 2,
+    DownAndIn = 3,
+};
+
+struct PathProduct {
+    PathPayoff kind;
+    bool is_call;
+    double strike;                  // unused for floating-strike lookbacks
+    double barrier = 0.0;           // Barrier only
+    BarrierKind barrier_kind = BarrierKind::UpAndOut;
+    bool floating_strike = false;   // Lookback only
+};
+
+// Monte Carlo price for an Asian, barrier or lookback option under GBM.
+//
+// Each path is stepped through n_steps equally spaced dates keeping only
+// running state (S, running sum, min, max), so memory is O(n_steps) per
+// thread rather than O(n_paths * n_steps). Paths are stepped in tiles of
+// 64 with exp_poly, over per-block ziggurat streams (as the European
+// block kernel), with the same thread-count invariant blocks and
+// variance-reduction modes as mc_price_european_parallel.
+MCResult mc_price_path_dependent(
+    double S0,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_steps,
+    const PathProduct& product,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads,
+    VarianceReduction vr = VarianceReduction::None
+);
+
+// European payoffs on several correlated GBM underlyings.
+enum class MultiAssetPayoff : int {
+    Basket = 0,  // call/put on sum_i w_i S_T^i (spreads use signed weights)
+    BestOf = 1,  // call/put on max_i S_T^i
+};
+
+struct MultiAssetProduct {
+    MultiAssetPayoff kind;
+    bool is_call;
+    double strike;
+    std::vector<double> weights;  // Basket only, one per asset
+};
+
+// Monte Carlo price for a basket, spread or best-of option under
+// correlated multi-asset GBM.
+//
+// `cholesky` is the lower-triangular factor of the correlation matrix,
+// row-major n_assets x n_assets, computed (and cached) by the caller.
+// Each path draws n_assets independent normals and correlates them with
+// one triangular mat-vec. The control variate is the discounted mean of
+// the assets' S_T, with known mean mean(S0). Uses the same block-parallel,
+// thread-count invariant streams as mc_price_european_parallel.
+MCResult mc_price_multi_asset(
+    const std::vector<double>& S0,
+    const std::vector<double>& sigma,
+    const std::vector<double>& cholesky,
+    double r,
+    double T,
+    const MultiAssetProduct& product,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads,
+    VarianceReduction vr = VarianceReduction::None
+);
+
+struct MCAmericanResult {
+    double price;
+    double std_error;
+    double european_price;  // hold to T, same paths
+};
+
+// Longstaff-Schwartz price of an American option exercisable at
+// t_k = k T / n_exercise, k = 1..n_exercise, under GBM.
+//
+// W is generated backwards with the Brownian bridge, so each path keeps
+// only W, S and its discounted cash flow. At each date the cash flows of
+// in-the-money paths are regressed on the Laguerre polynomials
+// L_0..L_{n_basis - 1} of S / K (normal equations, accumulated per block
+// and merged in block order). Per-block streams as in
+// mc_price_european_parallel; the result is independent of n_threads.
+MCAmericanResult mc_price_american_lsm(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_exercise,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    std::size_t n_basis,
+    unsigned int n_threads
+);
+
+// Heston stochastic-volatility parameters (variance process v_t).
+struct HestonParams {
+    double v0;     // initial variance
+    double kappa;  // mean-reversion speed
+    double theta;  // long-run variance
+    double xi;     // volatility of variance
+    double rho;    // spot/variance correlation
+};
+
+// Monte Carlo price for a European, Asian, barrier or lookback option
+// under Heston, time-stepped with Andersen's QE scheme and the
+// martingale-corrected log-price step (two normals per step). Keeps O(1)
+// state per path and uses the same block-parallel, thread-count invariant
+// streams and variance-reduction modes as mc_price_path_dependent.
+MCResult mc_price_heston(
+    double S0,
+    double r,
+    const HestonParams& heston,
+    double T,
+    std::size_t n_steps,
+    const PathProduct& product,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads,
+    VarianceReduction vr = VarianceReduction::None
+);
+
+// Row-wise Monte Carlo prices for n_rows independent European options.
+//
+// Inputs are contiguous per-row columns; results are written into the
+// caller's price_out / std_error_out buffers (no allocation, no copies).
+// Row i uses its own small-state xoshiro256++ stream seeded from (seed, i),
+// so per-row setup is cheap and each row's result is independent of
+// n_threads; rows are spread over n_threads (0 = all hardware threads).
+void mc_price_european_rows(
+    const double* S0,
+    const double* K,
+    const double* r,
+    const double* sigma,
+    const double* T,
+    const bool* is_call,
+    std::size_t n_rows,
+    std::size_t n_paths,
+    unsigned int seed,
+    double* price_out,
+    double* std_error_out,
+    unsigned int n_threads
+);
+
+// Monte Carlo prices for a book of European options on the same GBM
+// underlying. One set of normals is drawn for the whole batch, a
+// kBlockPaths block at a time from the per-block streams of
+// mc_price_european; per block, S_T is computed once per distinct maturity
+// and reused across all strikes with that maturity. Blocks run on up to
+// n_threads threads and merge in block order, so memory is O(kBlockPaths)
+// per thread and the result does not depend on n_threads. K, T and
+// is_call must have the same length; results are returned in input order.
+MCBatchResult mc_price_european_batch(
+    double S0,
+    double r,
+    double sigma,
+    const std::vector<double>& K,
+    const std::vector<double>& T,
+    const std::vector<bool>& is_call,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads = 1
 );
@@ -0,0 +1,670 @@
+#pragma once
+
+// Internal building blocks shared by the Monte Carlo kernels
+// (mc_core.cpp, mc_paths.cpp, mc_multi_asset.cpp, mc_heston.cpp). Not part
+// of the Python-facing API.
+
+#include "mc_core.hpp"
+
+#include <algorithm>
+#include <atomic>
+#include <chrono>
+#include <cmath>
+#include <cstdint>
+#include <cstring>
+#include <random>
+#include <thread>
+#include <vector>
+
+namespace mc_detail {
+
+// Estimator units per independent RNG stream in the parallel kernels.
+// Fixed so the block decomposition (and hence the result) does not
+// depend on threads.
+constexpr std::size_t kBlockPaths = std::size_t{1} << 16;
+
+// Independent generator for one block: seed_seq mixes (seed, block index)
+// so neighbouring blocks do not produce correlated streams.
+inline std::mt19937 make_block_rng(unsigned int seed, std::uint64_t block) {
+    std::seed_seq seq{
+        seed,
+        static_cast<unsigned int>(block & 0xffffffffu),
+        static_cast<unsigned int>(block >> 32),
+    };
+    return std::mt19937(seq);
+}
+
+// Small-state generator (xoshiro256++, Blackman & Vigna) for tiny tasks
+// where mt19937's 2.5 KB state setup would dominate, e.g. one row of a
+// few hundred paths. Seeded from (seed, index) through splitmix64, so
+// each task gets an independent, cheap-to-create stream. Satisfies
+// UniformRandomBitGenerator, so it plugs into std::normal_distribution.
+class Xoshiro256pp {
+public:
+    using result_type = std::uint64_t;
+
+    Xoshiro256pp(unsigned int seed, std::uint64_t index) {
+        std::uint64_t x = (static_cast<std::uint64_t>(seed) << 32) ^ index;
+        for (auto& word : s_) {
+            word = splitmix64(x);
+        }
+    }
+
+    static constexpr result_type min() { return 0; }
+    static constexpr result_type max() { return ~result_type{0}; }
+
+    result_type operator()() {
+        const std::uint64_t result = rotl(s_[0] + s_[3], 23) + s_[0];
+        const std::uint64_t t = s_[1] << 17;
+        s_[2] ^= s_[0];
+        s_[3] ^= s_[1];
+        s_[1] ^= s_[2];
+        s_[0] ^= s_[3];
+        s_[2] ^= t;
+        s_[3] = rotl(s_[3], 45);
+        return result;
+    }
+
+private:
+    static std::uint64_t rotl(std::uint64_t x, int k) {
+        return (x << k) | (x >> (64 - k));
+    }
+
+    static std::uint64_t splitmix64(std::uint64_t& x) {
+        std::uint64_t z = (x += 0x9e3779b97f4a7c15ull);
+        z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ull;
+        z = (z ^ (z >> 27)) * 0x94d049bb133111ebull;
+        return z ^ (z >> 31);
+    }
+
+    std::uint64_t s_[4];
+};
+
+// Per-block N(0, 1) sources for simulate_blocks, constructed from
+// (seed, block index).
+//
+// Mt19937Normals is the original mt19937 + std::normal_distribution
+// stream. ZigguratNormals runs the Marsaglia-Tsang ziggurat over
+// xoshiro256++ output: one 64-bit draw and a table lookup for ~99% of
+// normals, several times cheaper than either Box-Muller or
+// normal_distribution. Kernels bound by normal generation (many draws per
+// path) opt into it.
+struct Mt19937Normals {
+    std::mt19937 rng;
+    std::normal_distribution<double> normal{0.0, 1.0};
+
+    Mt19937Normals(unsigned int seed, std::uint64_t block) : rng(make_block_rng(seed, block)) {}
+
+    double operator()() { return normal(rng); }
+};
+
+// 128-layer ziggurat tables (Marsaglia & Tsang 2000), built once.
+struct ZigguratTables {
+    static constexpr double kR = 3.442619855899;           // start of the tail
+    static constexpr double kV = 9.91256303526217e-3;      // area of each layer
+
+    double k[128];  // acceptance thresholds on |hz|
+    double w[128];  // hz -> x scale per layer
+    double f[128];  // density at the layer edges
+
+    ZigguratTables() {
+        const double m1 = 2147483648.0;  // 2^31
+        double dn = kR;
+        double tn = dn;
+        const double q = kV / std::exp(-0.5 * dn * dn);
+
+        k[0] = (dn / q) * m1;
+        k[1] = 0.0;
+        w[0] = q / m1;
+        w[127] = dn / m1;
+        f[0] = 1.0;
+        f[127] = std::exp(-0.5 * dn * dn);
+        for (int i = 126; i >= 1; --i) {
+            dn = std::sqrt(-2.0 * std::log(kV / dn + std::exp(-0.5 * dn * dn)));
+            k[i + 1] = (dn / tn) * m1;
+            tn = dn;
+            f[i] = std::exp(-0.5 * dn * dn);
+            w[i] = dn / m1;
+        }
+    }
+
+    static const ZigguratTables& get() {
+        static const ZigguratTables tables;
+        return tables;
+    }
+};
+
+class ZigguratNormals {
+public:
+    ZigguratNormals(unsigned int seed, std::uint64_t block)
+        : rng_(seed, block), t_(ZigguratTables::get()) {}
+
+    double operator()() {
+        // Layer index from the low bits, signed 32-bit abscissa from the
+        // high bits, so the two are independent
+        const std::uint64_t bits = rng_();
+        const auto hz = static_cast<std::int32_t>(bits >> 32);
+        const auto iz = static_cast<unsigned int>(bits & 127u);
+        if (std::fabs(static_cast<double>(hz)) < t_.k[iz]) {
+            return hz * t_.w[iz];
+        }
+        return slow_path(hz, iz);
+    }
+
+private:
+    double uniform() { return (static_cast<double>(rng_() >> 11) + 0.5) * 0x1p-53; }
+
+    // Wedge and tail rejection steps (~1% of draws)
+    double slow_path(std::int32_t hz, unsigned int iz) {
+        for (;;) {
+            double x = hz * t_.w[iz];
+            if (iz == 0) {
+                double y;
+                do {
+                    x = -std::log(uniform()) / ZigguratTables::kR;
+                    y = -std::log(uniform());
+                } while (y + y < x * x);
+                return hz > 0 ? ZigguratTables::kR + x : -ZigguratTables::kR - x;
+            }
+            if (t_.f[iz] + uniform() * (t_.f[iz - 1] - t_.f[iz]) < std::exp(-0.5 * x * x)) {
+                return x;
+            }
+            const std::uint64_t bits = rng_();
+            hz = static_cast<std::int32_t>(bits >> 32);
+            iz = static_cast<unsigned int>(bits & 127u);
+            if (std::fabs(static_cast<double>(hz)) < t_.k[iz]) {
+                return hz * t_.w[iz];
+            }
+        }
+    }
+
+    Xoshiro256pp rng_;
+    const ZigguratTables& t_;
+};
+
+// Branch-free exp for batch loops the compiler can vectorise (std::exp is
+// an opaque libm call). Cody-Waite reduction x = k ln2 + r, |r| <= ln2 / 2,
+// a Taylor polynomial for e^r and 2^k assembled in the exponent bits.
+// Accurate to ~1 ulp, but there is no range check: callers must keep x
+// inside kPolyExpLimit (no overflow / denormal handling).
+constexpr double kPolyExpLimit  = 700.0;
+constexpr float  kPolyExpLimitF = 80.0f;
+
+inline double exp_poly(double x) {
+    constexpr double kLog2e = 1.4426950408889634;
+    constexpr double kLn2Hi = 0.6931471803691238;
+    constexpr double kLn2Lo = 1.9082149292705877e-10;
+    constexpr double kShift = 0x1.8p52;  // rounds x log2(e) to an integer
+
+    double kd = x * kLog2e + kShift;
+    std::uint64_t ki;
+    std::memcpy(&ki, &kd, sizeof ki);
+    kd -= kShift;
+    const double r = (x - kd * kLn2Hi) - kd * kLn2Lo;
+
+    double p = 1.0 / 6227020800.0;
+    p = p * r + 1.0 / 479001600.0;
+    p = p * r + 1.0 / 39916800.0;
+    p = p * r + 1.0 / 3628800.0;
+    p = p * r + 1.0 / 362880.0;
+    p = p * r + 1.0 / 40320.0;
+    p = p * r + 1.0 / 5040.0;
+    p = p * r + 1.0 / 720.0;
+    p = p * r + 1.0 / 120.0;
+    p = p * r + 1.0 / 24.0;
+    p = p * r + 1.0 / 6.0;
+    p = p * r + 0.5;
+    p = p * r + 1.0;
+    p = p * r + 1.0;
+
+    const std::uint64_t bits = (ki + 1023) << 52;  // 2^k
+    double scale;
+    std::memcpy(&scale, &bits, sizeof scale);
+    return p * scale;
+}
+
+inline float exp_poly(float x) {
+    constexpr float kLog2e = 1.44269504f;
+    constexpr float kLn2Hi = 0.693359375f;
+    constexpr float kLn2Lo = -2.12194440e-4f;
+    constexpr float kShift = 0x1.8p23f;
+
+    float kd = x * kLog2e + kShift;
+    std::uint32_t ki;
+    std::memcpy(&ki, &kd, sizeof ki);
+    kd -= kShift;
+    const float r = (x - kd * kLn2Hi) - kd * kLn2Lo;
+
+    float p = 1.0f / 5040.0f;
+    p = p * r + 1.0f / 720.0f;
+    p = p * r + 1.0f / 120.0f;
+    p = p * r + 1.0f / 24.0f;
+    p = p * r + 1.0f / 6.0f;
+    p = p * r + 0.5f;
+    p = p * r + 1.0f;
+    p = p * r + 1.0f;
+
+    const std::uint32_t bits = (ki + 127) << 23;
+    float scale;
+    std::memcpy(&scale, &bits, sizeof scale);
+    return p * scale;
+}
+
+// Bound on |Z| from ZigguratNormals: the tail sampler returns at most
+// R + 37.5 / R (53-bit uniforms), about 14.3.
+constexpr double kZigguratMaxAbs = 16.0;
+
+inline unsigned int resolve_threads(unsigned int n_threads, std::size_t n_blocks) {
+    if (n_threads == 0) {
+        n_threads = std::max(1u, std::thread::hardware_concurrency());
+    }
+    return static_cast<unsigned int>(
+        std::max<std::size_t>(1, std::min<std::size_t>(n_threads, n_blocks)));
+}
+
+// Run fn(task_index) for task_index in [0, n_tasks) on up to n_threads
+// threads (the calling thread included). Tasks are handed out dynamically;
+// callers write results into per-task slots so the outcome is independent
+// of scheduling.
+template <class TaskFn>
+void parallel_for(std::size_t n_tasks, unsigned int n_threads, TaskFn&& fn) {
+    std::atomic<std::size_t> next{0};
+    auto worker = [&]() {
+        for (std::size_t k = next++; k < n_tasks; k = next++) {
+            fn(k);
+        }
+    };
+
+    const unsigned int threads = resolve_threads(n_threads, n_tasks);
+    std::vector<std::thread> pool;
+    pool.reserve(threads - 1);
+    for (unsigned int t = 1; t < threads; ++t) {
+        pool.emplace_back(worker);
+    }
+    worker();
+    for (auto& th : pool) {
+        th.join();
+    }
+}
+
+// Raw moment sums for one run or one block. Everything is additive, so
+// per-block sums can be merged in a fixed order.
+struct PathSums {
+    double n      = 0.0;  // estimator units (paths, or antithetic pairs)
+    double sum    = 0.0;  // units: discounted payoff or pair mean
+    double sum_sq = 0.0;
+    double sum_c  = 0.0;  // control: discounted S_T
+    double sum_cc = 0.0;
+    double sum_xc = 0.0;
+    double n_crude      = 0.0;  // individual discounted payoffs, for the
+    double crude_sum    = 0.0;  // variance-reduction factor
+    double crude_sum_sq = 0.0;
+
+    void merge(const PathSums& o) {
+        n += o.n;
+        sum += o.sum;
+        sum_sq += o.sum_sq;
+        sum_c += o.sum_c;
+        sum_cc += o.sum_cc;
+        sum_xc += o.sum_xc;
+        n_crude += o.n_crude;
+        crude_sum += o.crude_sum;
+        crude_sum_sq += o.crude_sum_sq;
+    }
+};
+
+// Discounted payoff and control (discounted S_T) of one simulated path
+struct PathValue {
+    double discounted;
+    double control;
+};
+
+inline std::size_t units_for(std::size_t n_paths, VarianceReduction vr) {
+    return vr == VarianceReduction::Antithetic ? n_paths / 2 : n_paths;
+}
+
+// Payoff of a path-dependent product from one path's running state:
+// terminal S, arithmetic average over t_1..t_n, and extremes over t_0..t_n.
+inline double path_payoff(
+    const PathProduct& product, double S, double average, double s_min, double s_max
+) {
+    const double K = product.strike;
+    const bool call = product.is_call;
+
+    switch (product.kind) {
+        case PathPayoff::Asian:
+            return call ? std::max(average - K, 0.0) : std::max(K - average, 0.0);
+        case PathPayoff::Barrier: {
+            const bool up = product.barrier_kind == BarrierKind::UpAndOut ||
+                            product.barrier_kind == BarrierKind::UpAndIn;
+            const bool knock_in = product.barrier_kind == BarrierKind::UpAndIn ||
+                                  product.barrier_kind == BarrierKind::DownAndIn;
+            const bool touched = up ? (s_max >= product.barrier) : (s_min <= product.barrier);
+            if (touched != knock_in) {
+                return 0.0;
+            }
+            return call ? std::max(S - K, 0.0) : std::max(K - S, 0.0);
+        }
+        case PathPayoff::Lookback:
+            if (product.floating_strike) {
+                return call ? S - s_min : s_max - S;
+            }
+            return call ? std::max(s_max - K, 0.0) : std::max(K - s_min, 0.0);
+        case PathPayoff::European:
+            return call ? std::max(S - K, 0.0) : std::max(K - S, 0.0);
+    }
+    return 0.0;
+}
+
+// Moment sums over estimator units, accumulated in locals and flushed
+// into a PathSums once per run or block.
+struct UnitAccumulator {
+    VarianceReduction vr;
+    double n = 0.0;
+    double sum = 0.0, sum_sq = 0.0;
+    double sum_c = 0.0, sum_cc = 0.0, sum_xc = 0.0;
+    double crude_sum = 0.0, crude_sum_sq = 0.0;
+
+    explicit UnitAccumulator(VarianceReduction vr_) : vr(vr_) {}
+
+    // One path (plain or control-variate mode)
+    void add(const PathValue& v) {
+        n += 1.0;
+        sum    += v.discounted;
+        sum_sq += v.discounted * v.discounted;
+        if (vr == VarianceReduction::ControlVariate) {
+            sum_c  += v.control;
+            sum_cc += v.control * v.control;
+            sum_xc += v.discounted * v.control;
+        }
+    }
+
+    // One antithetic pair
+    void add_pair(const PathValue& v, const PathValue& w) {
+        n += 1.0;
+        const double pair = 0.5 * (v.discounted + w.discounted);
+        sum          += pair;
+        sum_sq       += pair * pair;
+        crude_sum    += v.discounted + w.discounted;
+        crude_sum_sq += v.discounted * v.discounted + w.discounted * w.discounted;
+    }
+
+    void flush_into(PathSums& sums) const {
+        sums.n      += n;
+        sums.sum    += sum;
+        sums.sum_sq += sum_sq;
+        sums.sum_c  += sum_c;
+        sums.sum_cc += sum_cc;
+        sums.sum_xc += sum_xc;
+        if (vr == VarianceReduction::Antithetic) {
+            sums.n_crude      += 2.0 * n;
+            sums.crude_sum    += crude_sum;
+            sums.crude_sum_sq += crude_sum_sq;
+        } else {
+            sums.n_crude      += n;
+            sums.crude_sum    += sum;
+            sums.crude_sum_sq += sum_sq;
+        }
+    }
+};
+
+// Simulate n_units estimator units and add their moments to `sums`.
+//
+// Each path consumes n_dims normals from `next_normal` (any callable
+// returning one N(0, 1) draw) into a scratch buffer; `eval(z)` maps the
+// buffer to a PathValue. Antithetic pairs re-evaluate the negated buffer.
+template <class NormalGen, class PathEval>
+void simulate_paths(
+    NormalGen&& next_normal,
+    std::size_t n_dims,
+    std::size_t n_units,
+    PathEval&& eval,
+    VarianceReduction vr,
+    PathSums& sums
+) {
+    std::vector<double> z(n_dims);
+    UnitAccumulator acc(vr);
+
+    for (std::size_t i = 0; i < n_units; ++i) {
+        for (std::size_t d = 0; d < n_dims; ++d) {
+            z[d] = next_normal();
+        }
+        const PathValue v = eval(z.data());
+
+        if (vr == VarianceReduction::Antithetic) {
+            for (std::size_t d = 0; d < n_dims; ++d) {
+                z[d] = -z[d];
+            }
+            acc.add_pair(v, eval(z.data()));
+        } else {
+            acc.add(v);
+        }
+    }
+    acc.flush_into(sums);
+}
+
+// Paths per tile in simulate_tiles
+constexpr std::size_t kTilePaths = 64;
+
+// Stages timed by instrumented kernels
+enum class Stage : std::size_t {
+    Rng = 0,     // normal draws (and antithetic negation)
+    Exp,         // S_T / path evolution, when the evaluator times it apart
+    Payoff,      // the rest of the tile evaluator
+    Accumulate,  // per-path moment accumulation
+    Count,
+};
+
+// Clock policy of simulate_tiles. Its laps are empty inline calls, so the
+// uninstrumented kernels compile to exactly the code they had without it.
+struct NoStageClock {
+    void lap(Stage) {}
+};
+
+// Tiles between the ones a StageClock times
+constexpr std::size_t kStageSampleEvery = 16;
+
+// Charges the time between laps to stages, one instance per block (no
+// synchronisation). Reading the clock stalls the pipeline, which at
+// several laps per 64-path tile would double the cost of a cheap kernel,
+// so only every kStageSampleEvery-th tile is timed (a Stage::Accumulate
+// lap ends a tile). finish() scales the sampled times up to the block's
+// elapsed time, splitting it in the sampled proportions.
+class StageClock {
+public:
+    using clock = std::chrono::steady_clock;
+
+    StageClock() : start_(clock::now()), last_(start_) {}
+
+    void lap(Stage stage) {
+        if (timing_) {
+            const auto now = clock::now();
+            seconds[static_cast<std::size_t>(stage)] +=
+                std::chrono::duration<double>(now - last_).count();
+            last_ = now;
+        }
+        if (stage == Stage::Accumulate) {
+            timing_ = ++tiles_ % kStageSampleEvery == 0;
+            if (timing_) {
+                last_ = clock::now();
+            }
+        }
+    }
+
+    void finish() {
+        double sampled = 0.0;
+        for (double s : seconds) {
+            sampled += s;
+        }
+        if (sampled > 0.0) {
+            const double scale =
+                std::chrono::duration<double>(clock::now() - start_).count() / sampled;
+            for (double& s : seconds) {
+                s *= scale;
+            }
+        }
+    }
+
+    double seconds[static_cast<std::size_t>(Stage::Count)] = {};
+
+private:
+    clock::time_point start_;
+    clock::time_point last_;
+    std::size_t tiles_ = 0;
+    bool timing_ = true;
+};
+
+// Tiled counterpart of simulate_paths for kernels with long serial
+// recurrences (many time steps). A path's steps depend on each other, so
+// evaluating one path at a time is latency-bound; stepping a tile of
+// independent paths in lockstep lets the CPU overlap them.
+//
+// Normals are drawn path by path in the same order as simulate_paths but
+// stored dimension-major, z[d * n + p] for the n paths of the tile, and
+// `eval_tile(z, n, out)` writes one PathValue per path. `clock` is lapped
+// after each stage of a tile (see StageClock); evaluation is charged to
+// Stage::Payoff, after any Stage::Exp lap the evaluator makes itself.
+template <class NormalGen, class TileEval, class Clock = NoStageClock>
+void simulate_tiles(
+    NormalGen&& next_normal,
+    std::size_t n_dims,
+    std::size_t n_units,
+    TileEval&& eval_tile,
+    VarianceReduction vr,
+    PathSums& sums,
+    Clock&& clock = Clock{}
+) {
+    std::vector<double> z(n_dims * kTilePaths);
+    PathValue v[kTilePaths];
+    PathValue w[kTilePaths];
+    UnitAccumulator acc(vr);
+
+    for (std::size_t begin = 0; begin < n_units; begin += kTilePaths) {
+        const std::size_t n = std::min(kTilePaths, n_units - begin);
+        for (std::size_t p = 0; p < n; ++p) {
+            for (std::size_t d = 0; d < n_dims; ++d) {
+                z[d * n + p] = next_normal();
+            }
+        }
+        clock.lap(Stage::Rng);
+        eval_tile(z.data(), n, v);
+        clock.lap(Stage::Payoff);
+
+        if (vr == VarianceReduction::Antithetic) {
+            for (std::size_t i = 0; i < n_dims * n; ++i) {
+                z[i] = -z[i];
+            }
+            clock.lap(Stage::Rng);
+            eval_tile(z.data(), n, w);
+            clock.lap(Stage::Payoff);
+            for (std::size_t p = 0; p < n; ++p) {
+                acc.add_pair(v[p], w[p]);
+            }
+        } else {
+            for (std::size_t p = 0; p < n; ++p) {
+                acc.add(v[p]);
+            }
+        }
+        clock.lap(Stage::Accumulate);
+    }
+    acc.flush_into(sums);
+    clock.lap(Stage::Accumulate);
+}
+
+// Split n_units into fixed kBlockPaths blocks, run
+// block_fn(block, n_block_units, sums) for each on up to n_threads
+// threads, and merge the block sums in block order.
+template <class BlockFn>
+PathSums reduce_blocks(std::size_t n_units, unsigned int n_threads, BlockFn&& block_fn) {
+    const std::size_t n_blocks = (n_units + kBlockPaths - 1) / kBlockPaths;
+    std::vector<PathSums> block_sums(n_blocks);
+
+    parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+        const std::size_t begin = b * kBlockPaths;
+        const std::size_t end   = std::min(begin + kBlockPaths, n_units);
+        block_fn(b, end - begin, block_sums[b]);
+    });
+
+    // Reduce in block order so the floating-point sum is thread-count invariant
+    PathSums sums;
+    for (const PathSums& block : block_sums) {
+        sums.merge(block);
+    }
+    return sums;
+}
+
+// Block-parallel driver: each block of simulate_paths gets its own
+// (seed, block) stream from NormalSource.
+template <class NormalSource = Mt19937Normals, class PathEval>
+PathSums simulate_blocks(
+    unsigned int seed,
+    std::size_t n_dims,
+    std::size_t n_units,
+    PathEval&& eval,
+    VarianceReduction vr,
+    unsigned int n_threads
+) {
+    return reduce_blocks(n_units, n_threads, [&](std::size_t b, std::size_t n, PathSums& sums) {
+        NormalSource normal(seed, b);
+        simulate_paths([&] { return normal(); }, n_dims, n, eval, vr, sums);
+    });
+}
+
+// As simulate_blocks, with simulate_tiles inside each block
+template <class NormalSource = Mt19937Normals, class TileEval>
+PathSums simulate_tile_blocks(
+    unsigned int seed,
+    std::size_t n_dims,
+    std::size_t n_units,
+    TileEval&& eval_tile,
+    VarianceReduction vr,
+    unsigned int n_threads
+) {
+    return reduce_blocks(n_units, n_threads, [&](std::size_t b, std::size_t n, PathSums& sums) {
+        NormalSource normal(seed, b);
+        simulate_tiles([&] { return normal(); }, n_dims, n, eval_tile, vr, sums);
+    });
+}
+
+// Variance of a crude MC mean over the same number of simulated paths
+inline double crude_var_of_mean(const PathSums& s) {
+    const double crude_mean = s.crude_sum / s.n_crude;
+    const double crude_var  = s.crude_sum_sq / s.n_crude - crude_mean * crude_mean;
+    return std::max(crude_var, 0.0) / s.n_crude;
+}
+
+// Price, std error and VR factor from merged sums. `control_mean` is the
+// known expectation of the control (S0 for discounted S_T).
+inline MCResult finalize(const PathSums& s, double control_mean, VarianceReduction vr) {
+    if (s.n <= 0.0) {
+        return MCResult{0.0, 0.0};
+    }
+
+    const double mean = s.sum / s.n;
+    double price      = mean;
+    double variance   = s.sum_sq / s.n - mean * mean;
+
+    if (vr == VarianceReduction::ControlVariate) {
+        const double mean_c = s.sum_c / s.n;
+        const double var_c  = s.sum_cc / s.n - mean_c * mean_c;
+        const double cov_xc = s.sum_xc / s.n - mean * mean_c;
+        if (var_c > 0.0) {
+            const double beta = cov_xc / var_c;
+            price    = mean - beta * (mean_c - control_mean);
+            variance = variance - cov_xc * cov_xc / var_c;
+        }
+    }
+    if (variance < 0.0) {
+        variance = 0.0;  // guard against tiny negative due to FP error
+    }
+
+    const double std_error = std::sqrt(variance / s.n);
+
+    const double vr_factor = (vr != VarianceReduction::None && std_error > 0.0)
+        ? crude_var_of_mean(s) / (std_error * std_error)
+        : 1.0;
+
+    return MCResult{price, std_error, vr_factor};
+}
+
+}  // namespace mc_detail
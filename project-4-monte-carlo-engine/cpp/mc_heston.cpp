@@ -0,0 +1,145 @@
+#include "mc_core.hpp"
+#include "mc_detail.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+
+using namespace mc_detail;
+
+namespace {
+
+// Above this psi the QE scheme switches from the quadratic to the
+// exponential branch (Andersen 2008).
+constexpr double kPsiCritical = 1.5;
+
+// Time-steps a tile of Heston paths in lockstep with the QE scheme. For
+// the n paths of the tile, z[(2t) n + p] drives the variance of path p at
+// step t and z[(2t + 1) n + p] its log-price (see simulate_tiles); see
+// HestonModel in mcengine/models.py for the derivation of the constants.
+struct HestonEval {
+    PathProduct product;
+    double S0;
+    double v0;
+    double disc_factor;
+    std::size_t n_steps;
+    double theta;
+    double e;          // exp(-kappa dt)
+    double c1, c2;     // conditional variance: s^2 = v c1 + c2
+    double k0, k1, k2, k3, k4;
+    double A;          // k2 + k4 / 2
+    double r_dt;
+
+    void operator()(const double* z, std::size_t n, PathValue* out) const {
+        double v[kTilePaths], X[kTilePaths], S[kTilePaths];
+        double total[kTilePaths], s_min[kTilePaths], s_max[kTilePaths];
+        for (std::size_t p = 0; p < n; ++p) {
+            v[p]     = v0;
+            X[p]     = std::log(S0);
+            S[p]     = S0;
+            total[p] = 0.0;
+            s_min[p] = S0;
+            s_max[p] = S0;
+        }
+
+        for (std::size_t t = 0; t < n_steps; ++t) {
+            const double* z_v = z + (2 * t) * n;
+            const double* z_s = z_v + n;
+
+            // The paths of a tile are independent, so their (long-latency)
+            // sqrt / log / exp chains overlap across iterations of this loop
+            for (std::size_t p = 0; p < n; ++p) {
+                const double m   = theta + (v[p] - theta) * e;
+                const double psi = (v[p] * c1 + c2) / (m * m);
+
+                double v_next;
+                double correction;  // -log E[exp(A v_next)] (martingale correction)
+                if (psi <= kPsiCritical) {
+                    const double inv = 2.0 / psi;
+                    const double b2  = inv - 1.0 + std::sqrt(inv * (inv - 1.0));
+                    const double a   = m / (1.0 + b2);
+                    const double b   = std::sqrt(b2) + z_v[p];
+                    v_next = a * b * b;
+                    const double one_minus = 1.0 - 2.0 * A * a;
+                    correction = -A * b2 * a / one_minus + 0.5 * std::log(one_minus);
+                } else {
+                    const double prob = (psi - 1.0) / (psi + 1.0);
+                    const double beta = (1.0 - prob) / m;
+                    const double u    = 0.5 * std::erfc(-z_v[p] * M_SQRT1_2);
+                    v_next = (u <= prob) ? 0.0 : std::log((1.0 - prob) / (1.0 - u)) / beta;
+                    correction = -std::log(prob + beta * (1.0 - prob) / (beta - A));
+                }
+                if (!std::isfinite(correction)) {
+                    correction = k0 + (k1 + 0.5 * k3) * v[p];  // uncorrected drift
+                }
+
+                X[p] += r_dt + correction - 0.5 * k3 * v[p] + k2 * v_next +
+                        std::sqrt(k3 * v[p] + k4 * v_next) * z_s[p];
+                v[p] = v_next;
+
+                S[p] = std::exp(X[p]);
+                total[p] += S[p];
+                s_min[p] = std::min(s_min[p], S[p]);
+                s_max[p] = std::max(s_max[p], S[p]);
+            }
+        }
+
+        for (std::size_t p = 0; p < n; ++p) {
+            const double average = total[p] / static_cast<double>(n_steps);
+            const double payoff  = path_payoff(product, S[p], average, s_min[p], s_max[p]);
+            out[p] = PathValue{disc_factor * payoff, disc_factor * S[p]};
+        }
+    }
+};
+
+}  // namespace
+
+MCResult mc_price_heston(
+    double S0,
+    double r,
+    const HestonParams& heston,
+    double T,
+    std::size_t n_steps,
+    const PathProduct& product,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads,
+    VarianceReduction vr
+) {
+    if (n_steps == 0) {
+        throw std::invalid_argument("n_steps must be >= 1");
+    }
+    if (heston.kappa <= 0.0 || heston.xi <= 0.0) {
+        throw std::invalid_argument("kappa and xi must be > 0");
+    }
+
+    const double dt    = T / static_cast<double>(n_steps);
+    const double kappa = heston.kappa;
+    const double xi    = heston.xi;
+    const double rho   = heston.rho;
+    const double e     = std::exp(-kappa * dt);
+
+    HestonEval eval;
+    eval.product     = product;
+    eval.S0          = S0;
+    eval.v0          = heston.v0;
+    eval.disc_factor = std::exp(-r * T);
+    eval.n_steps     = n_steps;
+    eval.theta       = heston.theta;
+    eval.e           = e;
+    eval.c1          = xi * xi * e * (1.0 - e) / kappa;
+    eval.c2          = heston.theta * xi * xi * (1.0 - e) * (1.0 - e) / (2.0 * kappa);
+    eval.k0          = -rho * kappa * heston.theta * dt / xi;
+    eval.k1          = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi;
+    eval.k2          = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi;
+    eval.k3          = 0.5 * dt * (1.0 - rho * rho);
+    eval.k4          = eval.k3;
+    eval.A           = eval.k2 + 0.5 * eval.k4;
+    eval.r_dt        = r * dt;
+
+    // Two normals per step and a serial variance recurrence: draw from the
+    // ziggurat source and step paths in tiles
+    const PathSums sums = simulate_tile_blocks<ZigguratNormals>(
+        seed, 2 * n_steps, units_for(n_paths, vr), eval, vr, n_threads);
+    return finalize(sums, S0, vr);
+}
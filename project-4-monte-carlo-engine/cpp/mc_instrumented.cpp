@@ -0,0 +1,167 @@
+#include "mc_core.hpp"
+#include "mc_detail.hpp"
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <type_traits>
+#include <vector>
+
+// Instrumented European kernel. It lives in its own translation unit so
+// that the extra instantiations cannot change how the compiler inlines
+// the production kernels in mc_core.cpp.
+
+using namespace mc_detail;
+
+namespace {
+
+using clock = std::chrono::steady_clock;
+
+double seconds_since(clock::time_point start) {
+    return std::chrono::duration<double>(clock::now() - start).count();
+}
+
+// Tile evaluator of mc_price_european_parallel split in two passes, S_T
+// for the whole tile and then the payoffs, with a Stage::Exp lap in
+// between. The constants are computed exactly as EuropeanEval does in
+// mc_core.cpp, so each path gets the same values. PolyExp selects
+// exp_poly (the block kernel) or std::exp (its overflow fallback).
+template <class Real, bool IsCall, bool PolyExp>
+struct TimedEuropeanTileEval {
+    Real S0;
+    Real K;
+    Real disc_factor;
+    Real drift;
+    Real scale;
+    StageClock* clock;
+
+    void operator()(const double* z, std::size_t n, PathValue* out) const {
+        Real ST[kTilePaths];
+        for (std::size_t i = 0; i < n; ++i) {
+            const Real x = drift + scale * static_cast<Real>(z[i]);
+            ST[i] = S0 * (PolyExp ? exp_poly(x) : std::exp(x));
+        }
+        clock->lap(Stage::Exp);
+        for (std::size_t i = 0; i < n; ++i) {
+            const Real intrinsic = IsCall ? ST[i] - K : K - ST[i];
+            const Real payoff = intrinsic > Real(0) ? intrinsic : Real(0);
+            out[i] = PathValue{static_cast<double>(disc_factor * payoff),
+                               static_cast<double>(disc_factor * ST[i])};
+        }
+    }
+};
+
+// One block: simulate_tiles with a StageClock, as in simulate_tile_blocks
+template <class Real, bool IsCall, bool PolyExp>
+void timed_block(
+    TimedEuropeanTileEval<Real, IsCall, PolyExp> eval,
+    unsigned int seed,
+    std::size_t block,
+    std::size_t n,
+    VarianceReduction vr,
+    PathSums& sums,
+    StageClock& clock
+) {
+    clock = StageClock();
+    eval.clock = &clock;
+    ZigguratNormals normal(seed, block);
+    simulate_tiles([&] { return normal(); }, 1, n, eval, vr, sums, clock);
+    clock.finish();
+}
+
+template <class Real, bool IsCall, bool PolyExp>
+PathSums timed_sums(
+    double S0, double K, double r, double sigma, double T,
+    unsigned int seed, std::size_t n_units, VarianceReduction vr,
+    unsigned int n_threads, MCStageTimes& times
+) {
+    const TimedEuropeanTileEval<Real, IsCall, PolyExp> eval{
+        static_cast<Real>(S0),
+        static_cast<Real>(K),
+        static_cast<Real>(std::exp(-r * T)),
+        static_cast<Real>((r - 0.5 * sigma * sigma) * T),
+        static_cast<Real>(sigma * std::sqrt(T)),
+        nullptr,
+    };
+
+    // As reduce_blocks, with the merge timed
+    const std::size_t n_blocks = (n_units + kBlockPaths - 1) / kBlockPaths;
+    std::vector<PathSums> block_sums(n_blocks);
+    std::vector<StageClock> clocks(n_blocks);
+    parallel_for(n_blocks, n_threads, [&](std::size_t b) {
+        const std::size_t begin = b * kBlockPaths;
+        const std::size_t end   = std::min(begin + kBlockPaths, n_units);
+        timed_block(eval, seed, b, end - begin, vr, block_sums[b], clocks[b]);
+    });
+
+    const auto merge_start = clock::now();
+    PathSums sums;
+    for (const PathSums& block : block_sums) {
+        sums.merge(block);
+    }
+    times.reduction += seconds_since(merge_start);
+
+    for (const StageClock& c : clocks) {
+        times.rng += c.seconds[static_cast<std::size_t>(Stage::Rng)];
+        times.exp += c.seconds[static_cast<std::size_t>(Stage::Exp)];
+        times.payoff += c.seconds[static_cast<std::size_t>(Stage::Payoff)];
+        times.accumulate += c.seconds[static_cast<std::size_t>(Stage::Accumulate)];
+    }
+    times.n_threads = resolve_threads(n_threads, n_blocks);
+    times.n_blocks = n_blocks;
+    // Block sums and clocks, plus simulate_tiles' normals buffer per block
+    times.bytes_allocated =
+        n_blocks * (sizeof(PathSums) + sizeof(StageClock) + kTilePaths * sizeof(double));
+    return sums;
+}
+
+template <class Real>
+PathSums dispatch_timed_sums(
+    double S0, double K, double r, double sigma, double T, bool is_call,
+    unsigned int seed, std::size_t n_units, VarianceReduction vr,
+    unsigned int n_threads, MCStageTimes& times
+) {
+    // Same exp_poly range check as european_block_sums
+    const double limit = std::is_same<Real, float>::value ? kPolyExpLimitF : kPolyExpLimit;
+    const double drift = static_cast<Real>((r - 0.5 * sigma * sigma) * T);
+    const double scale = static_cast<Real>(sigma * std::sqrt(T));
+    const bool poly = std::fabs(drift) + kZigguratMaxAbs * std::fabs(scale) < limit;
+    if (is_call) {
+        return poly ? timed_sums<Real, true, true>(S0, K, r, sigma, T, seed, n_units, vr, n_threads, times)
+                    : timed_sums<Real, true, false>(S0, K, r, sigma, T, seed, n_units, vr, n_threads, times);
+    }
+    return poly ? timed_sums<Real, false, true>(S0, K, r, sigma, T, seed, n_units, vr, n_threads, times)
+                : timed_sums<Real, false, false>(S0, K, r, sigma, T, seed, n_units, vr, n_threads, times);
+}
+
+}  // namespace
+
+MCResult mc_price_european_instrumented(
+    double S0,
+    double K,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_paths,
+    unsigned int seed,
+    bool is_call,
+    unsigned int n_threads,
+    MCStageTimes& times,
+    VarianceReduction vr,
+    Precision precision
+) {
+    const auto start = clock::now();
+    times = MCStageTimes{};
+    const std::size_t n_units = units_for(n_paths, vr);
+    const PathSums sums =
+        precision == Precision::Single
+            ? dispatch_timed_sums<float>(S0, K, r, sigma, T, is_call, seed, n_units, vr,
+                                         n_threads, times)
+            : dispatch_timed_sums<double>(S0, K, r, sigma, T, is_call, seed, n_units, vr,
+                                          n_threads, times);
+    const auto finalize_start = clock::now();
+    const MCResult res = finalize(sums, S0, vr);
+    times.reduction += seconds_since(finalize_start);
+    times.wall = seconds_since(start);
+    return res;
+}
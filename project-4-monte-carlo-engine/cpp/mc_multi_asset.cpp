@@ -0,0 +1,85 @@
+#include "mc_core.hpp"
+#include "mc_detail.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <numeric>
+#include <stdexcept>
+
+using namespace mc_detail;
+
+namespace {
+
+// Correlates one path's independent normals with the Cholesky factor,
+// maps them to S_T per asset and evaluates the payoff on the fly, so no
+// per-path buffer is needed (the functor is shared across threads).
+struct MultiAssetEval {
+    const MultiAssetProduct& product;
+    const std::vector<double>& S0;
+    const std::vector<double>& cholesky;  // row-major, lower-triangular
+    std::vector<double> drift;            // (r - sigma_i^2 / 2) T
+    std::vector<double> scale;            // sigma_i sqrt(T)
+    double disc_factor;
+
+    PathValue operator()(const double* z) const {
+        const std::size_t n = S0.size();
+        const bool basket = product.kind == MultiAssetPayoff::Basket;
+
+        double underlying = basket ? 0.0 : -std::numeric_limits<double>::infinity();
+        double total = 0.0;
+        for (std::size_t i = 0; i < n; ++i) {
+            const double* row = cholesky.data() + i * n;
+            double w = 0.0;
+            for (std::size_t j = 0; j <= i; ++j) {
+                w += row[j] * z[j];
+            }
+            const double S = S0[i] * std::exp(drift[i] + scale[i] * w);
+            total += S;
+            if (basket) {
+                underlying += product.weights[i] * S;
+            } else {
+                underlying = std::max(underlying, S);
+            }
+        }
+
+        const double K = product.strike;
+        const double payoff = product.is_call ? std::max(underlying - K, 0.0)
+                                              : std::max(K - underlying, 0.0);
+        return PathValue{disc_factor * payoff, disc_factor * total / static_cast<double>(n)};
+    }
+};
+
+}  // namespace
+
+MCResult mc_price_multi_asset(
+    const std::vector<double>& S0,
+    const std::vector<double>& sigma,
+    const std::vector<double>& cholesky,
+    double r,
+    double T,
+    const MultiAssetProduct& product,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads,
+    VarianceReduction vr
+) {
+    const std::size_t n = S0.size();
+    if (n == 0 || sigma.size() != n || cholesky.size() != n * n) {
+        throw std::invalid_argument("S0, sigma and cholesky (n x n) sizes must agree");
+    }
+    if (product.kind == MultiAssetPayoff::Basket && product.weights.size() != n) {
+        throw std::invalid_argument("basket weights must have one entry per asset");
+    }
+
+    MultiAssetEval eval{product, S0, cholesky, std::vector<double>(n), std::vector<double>(n),
+                        std::exp(-r * T)};
+    for (std::size_t i = 0; i < n; ++i) {
+        eval.drift[i] = (r - 0.5 * sigma[i] * sigma[i]) * T;
+        eval.scale[i] = sigma[i] * std::sqrt(T);
+    }
+
+    const PathSums sums = simulate_blocks(seed, n, units_for(n_paths, vr), eval, vr, n_threads);
+    const double control_mean = std::accumulate(S0.begin(), S0.end(), 0.0) / static_cast<double>(n);
+    return finalize(sums, control_mean, vr);
+}
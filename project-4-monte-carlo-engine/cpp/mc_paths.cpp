@@ -0,0 +1,91 @@
+#include "mc_core.hpp"
+#include "mc_detail.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <stdexcept>
+
+using namespace mc_detail;
+
+namespace {
+
+// Time-steps a tile of GBM paths in lockstep, keeping only running state
+// (S, sum, min, max) per path, and maps each to (discounted payoff,
+// control). For the n paths of the tile, z[t n + p] drives path p at step
+// t (see simulate_tiles). With PolyExp the step loop has no libm calls,
+// so the compiler vectorises it across the tile.
+template <bool PolyExp>
+struct PathDependentTileEval {
+    PathProduct product;
+    double S0;
+    double disc_factor;
+    double drift_dt;
+    double scale_dt;
+    std::size_t n_steps;
+
+    void operator()(const double* z, std::size_t n, PathValue* out) const {
+        double S[kTilePaths], total[kTilePaths], s_min[kTilePaths], s_max[kTilePaths];
+        for (std::size_t p = 0; p < n; ++p) {
+            S[p]     = S0;
+            total[p] = 0.0;
+            s_min[p] = S0;
+            s_max[p] = S0;
+        }
+
+        for (std::size_t t = 0; t < n_steps; ++t) {
+            const double* z_t = z + t * n;
+            for (std::size_t p = 0; p < n; ++p) {
+                const double x = drift_dt + scale_dt * z_t[p];
+                S[p] *= PolyExp ? exp_poly(x) : std::exp(x);
+                total[p] += S[p];
+                s_min[p] = std::min(s_min[p], S[p]);
+                s_max[p] = std::max(s_max[p], S[p]);
+            }
+        }
+
+        for (std::size_t p = 0; p < n; ++p) {
+            const double average = total[p] / static_cast<double>(n_steps);
+            const double payoff  = path_payoff(product, S[p], average, s_min[p], s_max[p]);
+            out[p] = PathValue{disc_factor * payoff, disc_factor * S[p]};
+        }
+    }
+};
+
+}  // namespace
+
+MCResult mc_price_path_dependent(
+    double S0,
+    double r,
+    double sigma,
+    double T,
+    std::size_t n_steps,
+    const PathProduct& product,
+    std::size_t n_paths,
+    unsigned int seed,
+    unsigned int n_threads,
+    VarianceReduction vr
+) {
+    if (n_steps == 0) {
+        throw std::invalid_argument("n_steps must be >= 1");
+    }
+
+    const double dt       = T / static_cast<double>(n_steps);
+    const double drift_dt = (r - 0.5 * sigma * sigma) * dt;
+    const double scale_dt = sigma * std::sqrt(dt);
+    const std::size_t n_units = units_for(n_paths, vr);
+
+    // One normal per step, so generation dominates: draw from the ziggurat
+    // source and step paths in tiles. Each step's exponent is bounded by
+    // the ziggurat's largest |Z|; past exp_poly's range use std::exp.
+    const bool poly = std::fabs(drift_dt) + kZigguratMaxAbs * std::fabs(scale_dt) < kPolyExpLimit;
+    const PathSums sums =
+        poly ? simulate_tile_blocks<ZigguratNormals>(
+                   seed, n_steps, n_units,
+                   PathDependentTileEval<true>{product, S0, std::exp(-r * T), drift_dt, scale_dt, n_steps},
+                   vr, n_threads)
+             : simulate_tile_blocks<ZigguratNormals>(
+                   seed, n_steps, n_units,
+                   PathDependentTileEval<false>{product, S0, std::exp(-r * T), drift_dt, scale_dt, n_steps},
+                   vr, n_threads);
+    return finalize(sums, S0, vr);
+}
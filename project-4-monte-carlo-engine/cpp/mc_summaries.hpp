@@ -0,0 +1,184 @@
+#pragma once
+
+// Streaming summaries for the block kernels: a fixed-bin histogram of S_T,
+// a DDSketch of the discounted payoffs and a bottom-k reservoir sample.
+// Mirrors mcengine/summaries.py (same bin and bucket formulas), so the
+// arrays returned to Python load straight into PricingSummaries. Internal,
+// like mc_detail.hpp.
+
+#include "mc_detail.hpp"
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <utility>
+#include <vector>
+
+namespace mc_detail {
+
+// Stream index bit for the reservoir keys, so they never share a
+// (seed, block) stream with the block's normals
+constexpr std::uint64_t kSummaryStreamTag = std::uint64_t{1} << 63;
+
+// Summaries of one block (or, after merging, one run)
+class BlockSummaries {
+public:
+    explicit BlockSummaries(const SummarySpec& spec)
+        : spec_(spec),
+          bin_width_((spec.high - spec.low) / static_cast<double>(spec.n_bins)),
+          log_gamma_(std::log((1.0 + spec.relative_accuracy) /
+                              (1.0 - spec.relative_accuracy))),
+          histogram_(spec.n_bins, 0) {
+        heap_.reserve(spec.sample_size);
+    }
+
+    void add(double terminal, double discounted, Xoshiro256pp& keys) {
+        // Histogram of S_T
+        const double bin = std::floor((terminal - spec_.low) / bin_width_);
+        if (bin < 0.0) {
+            ++underflow_;
+        } else if (bin >= static_cast<double>(spec_.n_bins)) {
+            ++overflow_;
+        } else {
+            ++histogram_[static_cast<std::size_t>(bin)];
+        }
+
+        // Payoff sketch
+        if (discounted > 0.0) {
+            add_bucket(static_cast<std::int64_t>(std::ceil(std::log(discounted) / log_gamma_)), 1);
+        } else {
+            ++zero_count_;
+        }
+
+        // Reservoir: keep the sample_size smallest uniform keys
+        const double key = static_cast<double>(keys() >> 11) * 0x1.0p-53;
+        offer(key, discounted);
+    }
+
+    // Merge in a fixed (block) order so the sample and counts do not
+    // depend on threads
+    void merge(const BlockSummaries& o) {
+        for (std::size_t i = 0; i < histogram_.size(); ++i) {
+            histogram_[i] += o.histogram_[i];
+        }
+        underflow_ += o.underflow_;
+        overflow_ += o.overflow_;
+        zero_count_ += o.zero_count_;
+        for (std::size_t i = 0; i < o.buckets_.size(); ++i) {
+            if (o.buckets_[i] != 0) {
+                add_bucket(o.offset_ + static_cast<std::int64_t>(i), o.buckets_[i]);
+            }
+        }
+        for (const auto& entry : o.heap_) {
+            offer(entry.first, entry.second);
+        }
+    }
+
+    void export_to(MCSummaries& out) const {
+        out.histogram = histogram_;
+        out.underflow = underflow_;
+        out.overflow = overflow_;
+        out.zero_count = zero_count_;
+        out.bucket_offset = offset_;
+        out.buckets = buckets_;
+        out.sample_keys.clear();
+        out.sample_values.clear();
+        for (const auto& entry : heap_) {
+            out.sample_keys.push_back(entry.first);
+            out.sample_values.push_back(entry.second);
+        }
+    }
+
+private:
+    // Dense buckets from offset_; past max_buckets the lowest are folded
+    // into one, as QuantileSketch does
+    void add_bucket(std::int64_t index, std::int64_t count) {
+        if (buckets_.empty()) {
+            offset_ = index;
+            buckets_.assign(1, count);
+            return;
+        }
+        if (index < offset_) {
+            buckets_.insert(buckets_.begin(), static_cast<std::size_t>(offset_ - index), 0);
+            offset_ = index;
+        } else if (index >= offset_ + static_cast<std::int64_t>(buckets_.size())) {
+            buckets_.resize(static_cast<std::size_t>(index - offset_ + 1), 0);
+        }
+        buckets_[static_cast<std::size_t>(index - offset_)] += count;
+
+        if (buckets_.size() > spec_.max_buckets) {
+            const std::size_t excess = buckets_.size() - spec_.max_buckets;
+            std::int64_t folded = 0;
+            for (std::size_t i = 0; i <= excess; ++i) {
+                folded += buckets_[i];
+            }
+            buckets_.erase(buckets_.begin(), buckets_.begin() + excess);
+            buckets_[0] = folded;
+            offset_ += static_cast<std::int64_t>(excess);
+        }
+    }
+
+    // heap_ is a max-heap on the key
+    void offer(double key, double value) {
+        if (heap_.size() < spec_.sample_size) {
+            heap_.emplace_back(key, value);
+            std::push_heap(heap_.begin(), heap_.end());
+        } else if (key < heap_.front().first) {
+            std::pop_heap(heap_.begin(), heap_.end());
+            heap_.back() = {key, value};
+            std::push_heap(heap_.begin(), heap_.end());
+        }
+    }
+
+    SummarySpec spec_;
+    double bin_width_;
+    double log_gamma_;
+    std::vector<std::int64_t> histogram_;
+    std::int64_t underflow_ = 0;
+    std::int64_t overflow_ = 0;
+    std::int64_t zero_count_ = 0;
+    std::int64_t offset_ = 0;
+    std::vector<std::int64_t> buckets_;
+    std::vector<std::pair<double, double>> heap_;
+};
+
+// simulate_tile_blocks that also feeds every simulated path (both halves
+// of an antithetic pair) into per-block summaries. S_T is recovered as
+// control * terminal_scale (1 / discount factor). Blocks are merged into
+// `summaries` in block order, so the result is thread-count invariant.
+template <class NormalSource, class TileEval>
+PathSums simulate_summarised_tile_blocks(
+    unsigned int seed,
+    std::size_t n_dims,
+    std::size_t n_units,
+    TileEval&& eval_tile,
+    VarianceReduction vr,
+    unsigned int n_threads,
+    double terminal_scale,
+    BlockSummaries& summaries,
+    const SummarySpec& spec
+) {
+    const std::size_t n_blocks = (n_units + kBlockPaths - 1) / kBlockPaths;
+    std::vector<BlockSummaries> block_summaries(n_blocks, BlockSummaries(spec));
+
+    const PathSums sums =
+        reduce_blocks(n_units, n_threads, [&](std::size_t b, std::size_t n, PathSums& block) {
+            NormalSource normal(seed, b);
+            Xoshiro256pp keys(seed, b | kSummaryStreamTag);
+            BlockSummaries& s = block_summaries[b];
+            auto tap = [&](const double* z, std::size_t m, PathValue* out) {
+                eval_tile(z, m, out);
+                for (std::size_t p = 0; p < m; ++p) {
+                    s.add(out[p].control * terminal_scale, out[p].discounted, keys);
+                }
+            };
+            simulate_tiles([&] { return normal(); }, n_dims, n, tap, vr, block);
+        });
+
+    for (const BlockSummaries& block : block_summaries) {
+        summaries.merge(block);
+    }
+    return sums;
+}
+
+}  // namespace mc_detail
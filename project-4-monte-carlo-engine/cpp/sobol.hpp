@@ -0,0 +1,178 @@
+#pragma once
+
+#include <array>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <random>
+#include <stdexcept>
+#include <vector>
+
+// Scrambled Sobol sequence and inverse normal CDF for randomised QMC.
+//
+// Direction numbers follow Joe & Kuo (new-joe-kuo-6.21201), matching
+// mcengine/samplers.py. Each SobolSequence carries one randomisation:
+// a random linear matrix scramble of the direction numbers plus a random
+// digital shift.
+
+namespace sobol {
+
+constexpr int kBits = 32;
+
+struct Poly {
+    unsigned int s;
+    unsigned int a;
+    std::array<std::uint32_t, 7> m;
+};
+
+// Dimensions 2..21; dimension 1 is van der Corput (all m_k = 1).
+constexpr Poly kJoeKuo[] = {
+    {1, 0, {1}},
+    {2, 1, {1, 3}},
+    {3, 1, {1, 3, 1}},
+    {3, 2, {1, 1, 1}},
+    {4, 1, {1, 1, 3, 3}},
+    {4, 4, {1, 3, 5, 13}},
+    {5, 2, {1, 1, 5, 5, 17}},
+    {5, 4, {1, 1, 5, 5, 5}},
+    {5, 7, {1, 1, 7, 11, 19}},
+    {5, 11, {1, 1, 5, 1, 1}},
+    {5, 13, {1, 1, 1, 3, 11}},
+    {5, 14, {1, 3, 5, 5, 31}},
+    {6, 1, {1, 3, 3, 9, 7, 49}},
+    {6, 13, {1, 1, 1, 15, 21, 21}},
+    {6, 16, {1, 3, 1, 13, 27, 49}},
+    {6, 19, {1, 1, 1, 15, 7, 5}},
+    {6, 22, {1, 3, 1, 15, 13, 25}},
+    {6, 25, {1, 1, 5, 5, 19, 61}},
+    {7, 1, {1, 3, 7, 11, 23, 15, 103}},
+    {7, 4, {1, 3, 7, 13, 13, 15, 69}},
+};
+
+constexpr std::size_t kMaxDim = sizeof(kJoeKuo) / sizeof(kJoeKuo[0]) + 1;
+
+inline std::uint32_t parity(std::uint32_t x) {
+    x ^= x >> 16;
+    x ^= x >> 8;
+    x ^= x >> 4;
+    x ^= x >> 2;
+    x ^= x >> 1;
+    return x & 1u;
+}
+
+// Acklam's rational approximation; relative error < 1.2e-9 on (0, 1).
+inline double inverse_normal_cdf(double u) {
+    static constexpr double a[] = {-3.969683028665376e+01, 2.209460984245205e+02,
+                                   -2.759285104469687e+02, 1.383577518672690e+02,
+                                   -3.066479806614716e+01, 2.506628277459239e+00};
+    static constexpr double b[] = {-5.447609879822406e+01, 1.615858368580409e+02,
+                                   -1.556989798598866e+02, 6.680131188771972e+01,
+                                   -1.328068155288572e+01};
+    static constexpr double c[] = {-7.784894002430293e-03, -3.223964580411365e-01,
+                                   -2.400758277161838e+00, -2.549732539343734e+00,
+                                   4.374664141464968e+00, 2.938163982698783e+00};
+    static constexpr double d[] = {7.784695709041462e-03, 3.224671290700398e-01,
+                                   2.445134137142996e+00, 3.754408661907416e+00};
+    constexpr double p_low = 0.02425;
+
+    const double tail = u < 0.5 ? u : 1.0 - u;
+    if (tail < p_low) {
+        const double q = std::sqrt(-2.0 * std::log(tail));
+        const double x = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) /
+                         ((((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0);
+        return u < 0.5 ? x : -x;
+    }
+    const double q = u - 0.5;
+    const double r = q * q;
+    return (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q /
+           (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0);
+}
+
+class SobolSequence {
+public:
+    SobolSequence(std::size_t dim, std::mt19937& rng) : dim_(dim), V_(dim), x_(dim) {
+        if (dim == 0 || dim > kMaxDim) {
+            throw std::invalid_argument("Sobol dimension out of range");
+        }
+        std::uniform_int_distribution<std::uint32_t> bits(0, 0xffffffffu);
+
+        for (std::size_t j = 0; j < dim; ++j) {
+            std::array<std::uint32_t, kBits> v = direction_numbers(j);
+
+            // Random lower-triangular binary matrix with unit diagonal;
+            // row i is a mask over output bits counted from the MSB.
+            std::array<std::uint32_t, kBits> rows{};
+            for (int i = 0; i < kBits; ++i) {
+                const std::uint32_t below = (i == 0) ? 0u : (bits(rng) >> (kBits - i)) << (kBits - i);
+                rows[i] = below | (0x80000000u >> i);
+            }
+            for (int k = 0; k < kBits; ++k) {
+                std::uint32_t scrambled = 0;
+                for (int i = 0; i < kBits; ++i) {
+                    scrambled |= parity(v[k] & rows[i]) << (kBits - 1 - i);
+                }
+                V_[j][k] = scrambled;
+            }
+            x_[j] = bits(rng);  // digital shift; point 0 is the shift itself
+        }
+    }
+
+    std::size_t dim() const { return dim_; }
+
+    // Write the next point, mapped to N(0, 1), into out[0..dim).
+    void next_normals(double* out) {
+        for (std::size_t j = 0; j < dim_; ++j) {
+            out[j] = inverse_normal_cdf((static_cast<double>(x_[j]) + 0.5) * 0x1p-32);
+        }
+        advance();
+    }
+
+    double next_normal() {
+        double z;
+        next_normals(&z);
+        return z;
+    }
+
+private:
+    // Gray-code update: flip the direction number of the lowest zero bit
+    void advance() {
+        int c = 0;
+        for (std::uint64_t i = index_; i & 1u; i >>= 1) {
+            ++c;
+        }
+        ++index_;
+        for (std::size_t j = 0; j < dim_; ++j) {
+            x_[j] ^= V_[j][c];
+        }
+    }
+
+    static std::array<std::uint32_t, kBits> direction_numbers(std::size_t j) {
+        std::array<std::uint32_t, kBits> v{};
+        if (j == 0) {
+            for (int k = 0; k < kBits; ++k) {
+                v[k] = 1u << (kBits - 1 - k);
+            }
+            return v;
+        }
+        const Poly& p = kJoeKuo[j - 1];
+        for (unsigned int k = 0; k < p.s; ++k) {
+            v[k] = p.m[k] << (kBits - 1 - k);
+        }
+        for (unsigned int k = p.s; k < static_cast<unsigned int>(kBits); ++k) {
+            v[k] = v[k - p.s] ^ (v[k - p.s] >> p.s);
+            for (unsigned int i = 1; i < p.s; ++i) {
+                if ((p.a >> (p.s - 1 - i)) & 1u) {
+                    v[k] ^= v[k - i];
+                }
+            }
+        }
+        return v;
+    }
+
+    std::size_t dim_;
+    std::vector<std::array<std::uint32_t, kBits>> V_;
+    std::vector<std::uint32_t> x_;
+    std::uint64_t index_ = 0;
+};
+
+}  // namespace sobol
@@ -1,16 +1,121 @@
-from .models import GBMModel
-from .products import EuropeanOption, OptionType
-from .engine import MonteCarloEngine, MonteCarloConfig
-from .analytics import black_scholes_price
-from .fast_engine import FastMCConfig, price_european_mc_cpp
+__version__ = "0.1.0"
+
+import importlib
+
+from .models import GBMModel, HestonModel, MultiAssetGBMModel
+from .products import (
+    EuropeanOption,
+    OptionType,
+    AsianOption,
+    BarrierOption,
+    BarrierType,
+    LookbackOption,
+    BasketOption,
+    SpreadOption,
+    BestOfOption,
+    AmericanOption,
+)
+
+# Everything else is imported on first access (PEP 562), so
+# ``import mcengine`` loads no pricing backend: NumPy engines, the process
+# pool, the server and the compiled _mc_core come in only when used.
+_LAZY_EXPORTS = {
+    "engine": ("MonteCarloEngine", "MonteCarloConfig"),
+    "summaries": ("PricingSummaries", "terminal_range"),
+    "analytics": (
+        "black_scholes_price",
+        "black_scholes_prices",
+        "black_scholes_greeks",
+        "implied_volatility",
+    ),
+    "cache": ("ResultCache", "cached_price", "cached_price_european_mc_cpp"),
+    "parallel": ("price_parallel", "price_portfolio"),
+    "scenarios": ("ScenarioCube", "write_scenario_cube"),
+    "mlmc": ("MLMCConfig", "price_mlmc"),
+    "american": ("LSMConfig", "price_american_lsm"),
+    "server": ("PricingClient", "PricingServer", "ServerConfig"),
+    "backends": ("BackendRegistry", "default_registry", "price_auto"),
+    "instrumentation": ("MetricsRegistry", "metrics_registry"),
+    "fast_engine": (
+        "FastMCConfig",
+        "price_european_mc_cpp",
+        "price_european_batch_mc_cpp",
+        "price_path_dependent_mc_cpp",
+        "price_european_greeks_mc_cpp",
+        "price_european_ladder_mc_cpp",
+        "price_european_arrays_mc_cpp",
+        "price_european_table_mc_cpp",
+        "price_multi_asset_mc_cpp",
+        "price_heston_mc_cpp",
+        "price_american_mc_cpp",
+    ),
+}
+_LAZY_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+
+def __getattr__(name: str):
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_MODULES))
+
 
 __all__ = [
     "GBMModel",
+    "MultiAssetGBMModel",
+    "HestonModel",
     "EuropeanOption",
     "OptionType",
+    "AsianOption",
+    "BarrierOption",
+    "BarrierType",
+    "LookbackOption",
+    "BasketOption",
+    "SpreadOption",
+    "BestOfOption",
+    "AmericanOption",
     "MonteCarloEngine",
     "MonteCarloConfig",
+    "PricingSummaries",
+    "terminal_range",
     "black_scholes_price",
+    "black_scholes_prices",
+    "black_scholes_greeks",
+    "implied_volatility",
+    "price_parallel",
+    "ResultCache",
+    "cached_price",
+    "cached_price_european_mc_cpp",
+    "price_portfolio",
+    "ScenarioCube",
+    "write_scenario_cube",
+    "MLMCConfig",
+    "price_mlmc",
+    "LSMConfig",
+    "price_american_lsm",
+    "PricingServer",
+    "PricingClient",
+    "ServerConfig",
+    "BackendRegistry",
+    "default_registry",
+    "price_auto",
+    "MetricsRegistry",
+    "metrics_registry",
     "FastMCConfig",
     "price_european_mc_cpp",
+    "price_european_batch_mc_cpp",
+    "price_path_dependent_mc_cpp",
+    "price_european_greeks_mc_cpp",
+    "price_european_ladder_mc_cpp",
+    "price_european_arrays_mc_cpp",
+    "price_european_table_mc_cpp",
+    "price_multi_asset_mc_cpp",
+    "price_heston_mc_cpp",
+    "price_american_mc_cpp",
 ]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import math
+import time
+
+import numpy as np
+
+from .models import GBMModel
+from .products import AmericanOption
+
+# Largest basis the C++ kernel supports (Laguerre degrees 0..7)
+MAX_BASIS_DEGREE = 7
+
+
+@dataclass
+class LSMConfig:
+    """Settings for ``price_american_lsm``."""
+
+    n_paths: int = 100_000
+    seed: int | None = None
+    # Regression on Laguerre polynomials L_0..L_degree of S / K
+    basis_degree: int = 3
+
+
+def laguerre_basis(x: np.ndarray, degree: int) -> np.ndarray:
+    """Laguerre polynomials L_0..L_degree at ``x``, shape (len(x), degree + 1).
+
+    Uses the three-term recurrence
+    L_{k+1} = ((2k + 1 - x) L_k - k L_{k-1}) / (k + 1).
+    """
+    out = np.empty((x.shape[0], degree + 1))
+    out[:, 0] = 1.0
+    if degree >= 1:
+        out[:, 1] = 1.0 - x
+    for k in range(1, degree):
+        out[:, k + 1] = ((2 * k + 1 - x) * out[:, k] - k * out[:, k - 1]) / (k + 1)
+    return out
+
+
+def _check_inputs(model: GBMModel, option: AmericanOption, n_paths: int, degree: int) -> None:
+    if not isinstance(model, GBMModel):
+        raise TypeError("American options are priced under GBMModel only")
+    if option.n_exercise < 1:
+        raise ValueError("n_exercise must be >= 1")
+    if n_paths < 2:
+        raise ValueError("n_paths must be >= 2")
+    if not 1 <= degree <= MAX_BASIS_DEGREE:
+        raise ValueError(f"basis_degree must be in [1, {MAX_BASIS_DEGREE}]")
+
+
+def price_american_lsm(
+    model: GBMModel,
+    option: AmericanOption,
+    config: LSMConfig,
+) -> dict:
+    """Longstaff-Schwartz (2001) price of an American option under GBM.
+
+    Paths are generated backwards in time with the Brownian bridge: W_T
+    is drawn first, then W(t_k) given W(t_{k+1}) has mean
+    W(t_{k+1}) t_k / t_{k+1} and variance t_k (t_{k+1} - t_k) / t_{k+1}.
+    The induction therefore only keeps W and the discounted cash flow of
+    each path, O(n_paths) memory for any number of exercise dates.
+
+    At each date the cash flows of in-the-money paths are regressed on
+    the Laguerre basis of S / K. The normal equations (a
+    (degree + 1)^2 system) are built with one matrix product and solved
+    directly. A path exercises when its exercise value beats the fitted
+    continuation value. The estimate uses the same paths as the
+    regression, so it carries the usual small in-sample bias.
+
+    Returns
+    -------
+    dict
+        ``price``, ``std_error``, ``conf_int_95``, ``n_paths``, plus
+        ``european_price`` (hold to T, same paths), ``exercise_premium``
+        and ``elapsed`` (seconds).
+    """
+    _check_inputs(model, option, config.n_paths, config.basis_degree)
+    start = time.perf_counter()
+    rng = np.random.default_rng(config.seed)
+    n = int(config.n_paths)
+    n_dates = option.n_exercise
+    dt = option.maturity / n_dates
+    K = float(option.strike)
+    sigma = float(model.vol)
+    drift = float(model.rate) - 0.5 * sigma * sigma
+    spot = float(model.spot)
+
+    # Maturity: W_T and the discounted terminal payoff
+    T = n_dates * dt
+    W = math.sqrt(T) * rng.standard_normal(n)
+    cash_flow = math.exp(-model.rate * T) * option.payoff(spot * np.exp(drift * T + sigma * W))
+    european = float(cash_flow.mean())
+
+    for k in range(n_dates - 1, 0, -1):
+        t = k * dt
+        # Bridge back from t_{k+1} = t + dt
+        W *= k / (k + 1)
+        W += math.sqrt(dt * k / (k + 1)) * rng.standard_normal(n)
+        S = spot * np.exp(drift * t + sigma * W)
+
+        exercise = math.exp(-model.rate * t) * option.payoff(S)
+        itm = np.flatnonzero(exercise > 0.0)
+        if itm.size <= config.basis_degree:
+            continue
+        X = laguerre_basis(S[itm] / K, config.basis_degree)
+        try:
+            coef = np.linalg.solve(X.T @ X, X.T @ cash_flow[itm])
+        except np.linalg.LinAlgError:
+            continue
+        exercised = itm[exercise[itm] > X @ coef]
+        cash_flow[exercised] = exercise[exercised]
+
+    price = float(cash_flow.mean())
+    std_error = float(cash_flow.std()) / math.sqrt(n)
+    z = 1.96
+    return {
+        "price": price,
+        "std_error": std_error,
+        "conf_int_95": (price - z * std_error, price + z * std_error),
+        "n_paths": n,
+        "european_price": european,
+        "exercise_premium": price - european,
+        "elapsed": time.perf_counter() - start,
+    }
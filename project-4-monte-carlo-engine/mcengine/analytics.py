@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import math
+from typing import Any
+
+import numpy as np
 
 from .models import GBMModel
 from .products import EuropeanOption, OptionType
+from .samplers import normal_cdf
 
 
 def _norm_cdf(x: float) -> float:
@@ -39,3 +43,184 @@ def black_scholes_price(model: GBMModel, option: EuropeanOption) -> float:
         price = K * math.exp(-r * T) * _norm_cdf(-d2) - S0 * _norm_cdf(-d1)
 
     return float(price)
+
+
+def _norm_pdf(x: np.ndarray) -> np.ndarray:
+    return np.exp(-0.5 * x * x) / math.sqrt(2.0 * math.pi)
+
+
+def _bs_inputs(S0, K, r, sigma, T, is_call):
+    *floats, calls = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S0, K, r, sigma, T)),
+        np.asarray(is_call, dtype=bool),
+    )
+    return (*floats, calls)
+
+
+def _bs_d1_d2(S0, K, r, sigma, T):
+    """d1, d2 and sigma * sqrt(T); rows with no diffusion (T <= 0 or
+    sigma <= 0) get d1 = d2 = +/-inf from the sign of the forward
+    moneyness, which makes the prices collapse to discounted intrinsic."""
+    sqrt_var = sigma * np.sqrt(np.maximum(T, 0.0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d1 = (np.log(S0 / K) + (r + 0.5 * sigma**2) * T) / sqrt_var
+        d2 = d1 - sqrt_var
+    degenerate = sqrt_var <= 0.0
+    if np.any(degenerate):
+        moneyness = np.log(S0 / K) + r * np.maximum(T, 0.0)
+        limit = np.where(moneyness > 0.0, np.inf, -np.inf)
+        d1 = np.where(degenerate, limit, d1)
+        d2 = np.where(degenerate, limit, d2)
+    return d1, d2, sqrt_var
+
+
+def black_scholes_prices(
+    S0: Any,
+    K: Any,
+    r: Any,
+    sigma: Any,
+    T: Any,
+    is_call: Any = True,
+) -> np.ndarray:
+    """Black–Scholes prices over arrays.
+
+    Inputs broadcast against each other (scalars or arrays of any common
+    shape), like ``price_european_arrays_mc_cpp``. Matches
+    ``black_scholes_price`` row by row, including the intrinsic value at
+    ``T <= 0``.
+    """
+    S0, K, r, sigma, T, calls = _bs_inputs(S0, K, r, sigma, T, is_call)
+    d1, d2, _ = _bs_d1_d2(S0, K, r, sigma, T)
+    df = np.exp(-r * np.maximum(T, 0.0))
+
+    call = S0 * normal_cdf(d1) - K * df * normal_cdf(d2)
+    put = K * df * normal_cdf(-d2) - S0 * normal_cdf(-d1)
+    return np.where(calls, call, put)
+
+
+def black_scholes_greeks(
+    S0: Any,
+    K: Any,
+    r: Any,
+    sigma: Any,
+    T: Any,
+    is_call: Any = True,
+) -> dict:
+    """Closed-form price and Greeks over arrays (same broadcasting as
+    ``black_scholes_prices``).
+
+    Returns
+    -------
+    dict of np.ndarray with keys ``"price"``, ``"delta"``, ``"gamma"``,
+    ``"vega"`` (per unit of vol), ``"theta"`` (per year) and ``"rho"``
+    (per unit of rate). Rows without diffusion get zero gamma and vega.
+    """
+    S0, K, r, sigma, T, calls = _bs_inputs(S0, K, r, sigma, T, is_call)
+    d1, d2, sqrt_var = _bs_d1_d2(S0, K, r, sigma, T)
+    T = np.maximum(T, 0.0)
+    df = np.exp(-r * T)
+    pdf = _norm_pdf(d1)
+    Nd1, Nd2 = normal_cdf(d1), normal_cdf(d2)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gamma = np.where(sqrt_var > 0.0, pdf / (S0 * sqrt_var), 0.0)
+        decay = np.where(T > 0.0, -S0 * pdf * sigma / (2.0 * np.sqrt(T)), 0.0)
+    vega = S0 * pdf * np.sqrt(T)
+
+    call_price = S0 * Nd1 - K * df * Nd2
+    put_price = call_price - S0 + K * df  # put-call parity
+
+    return {
+        "price": np.where(calls, call_price, put_price),
+        "delta": np.where(calls, Nd1, Nd1 - 1.0),
+        "gamma": gamma,
+        "vega": vega,
+        "theta": np.where(
+            calls,
+            decay - r * K * df * Nd2,
+            decay + r * K * df * (1.0 - Nd2),
+        ),
+        "rho": np.where(calls, K * T * df * Nd2, -K * T * df * (1.0 - Nd2)),
+    }
+
+
+def implied_volatility(
+    price: Any,
+    S0: Any,
+    K: Any,
+    r: Any,
+    T: Any,
+    is_call: Any = True,
+    tol: float = 1e-10,
+    max_iter: int = 100,
+    vol_bounds: tuple[float, float] = (1e-6, 5.0),
+) -> np.ndarray:
+    """Batched Black–Scholes implied volatility.
+
+    Every row runs a safeguarded Newton iteration at once: each step keeps
+    a per-row bracket [lo, hi] around the root (the price is increasing in
+    vol), takes the Newton step when it stays inside the bracket and
+    bisects otherwise, e.g. where vega is tiny deep in or out of the money.
+    Rows that have converged (price error below ``tol`` or a collapsed
+    bracket) are masked out, so later iterations only touch the rows still
+    working.
+
+    Returns an array of vols with the broadcast shape of the inputs. Rows
+    whose price violates the no-arbitrage bounds, whose time value (price
+    minus intrinsic) is within ``tol`` of zero, whose root lies outside
+    ``vol_bounds``, or which do not converge in ``max_iter`` iterations,
+    are NaN. A time value below ``tol`` is matched by any small vol, so
+    it does not determine one.
+    """
+    shape = np.broadcast_shapes(*(np.shape(x) for x in (price, S0, K, r, T, is_call)))
+    target, S0, K, r, T, calls = (
+        np.ravel(x) for x in _bs_inputs(price, S0, K, r, T, is_call)
+    )
+    n = target.shape[0]
+
+    # Bracket [lo, hi] per row, starting from the Manaster–Koehler guess
+    lo = np.full(n, vol_bounds[0])
+    hi = np.full(n, vol_bounds[1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        guess = np.sqrt(2.0 * np.abs(np.log(S0 / K) + r * T) / T)
+    vol = np.clip(np.where(np.isfinite(guess) & (guess > 0.0), guess, 0.2), lo, hi)
+
+    # Prices outside (intrinsic + tol, upper bound) have no implied vol;
+    # nor do prices beyond the bracket ends
+    df = np.exp(-r * T)
+    lower = np.where(calls, np.maximum(S0 - K * df, 0.0), np.maximum(K * df - S0, 0.0))
+    upper = np.where(calls, S0, K * df)
+    valid = (T > 0.0) & (target - lower > tol) & (target < upper)
+    valid &= black_scholes_prices(S0, K, r, lo, T, calls) <= target + tol
+    valid &= black_scholes_prices(S0, K, r, hi, T, calls) >= target - tol
+
+    converged = np.zeros(n, dtype=bool)
+    active = np.flatnonzero(valid)
+    for _ in range(max_iter):
+        if active.size == 0:
+            break
+        greeks = black_scholes_greeks(
+            S0[active], K[active], r[active], vol[active], T[active], calls[active]
+        )
+        diff = greeks["price"] - target[active]
+
+        a_lo = np.where(diff < 0.0, vol[active], lo[active])
+        a_hi = np.where(diff > 0.0, vol[active], hi[active])
+        lo[active], hi[active] = a_lo, a_hi
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = vol[active] - diff / greeks["vega"]
+        inside = np.isfinite(newton) & (newton > a_lo) & (newton < a_hi)
+        step = np.where(inside, newton, 0.5 * (a_lo + a_hi))
+
+        # Converged once the vol itself is pinned: a price error below tol
+        # alone is not enough where vega is tiny
+        vol_tol = tol * np.maximum(1.0, a_hi)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pinned = (np.abs(diff) <= tol) & (np.abs(diff) <= vol_tol * greeks["vega"])
+        done = pinned | (diff == 0.0) | (a_hi - a_lo <= vol_tol)
+        vol[active] = np.where(done, vol[active], step)
+        converged[active[done]] = True
+        active = active[~done]
+
+    return np.where(converged, vol, np.nan).reshape(shape)
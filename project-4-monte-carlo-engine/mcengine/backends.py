@@ -0,0 +1,559 @@
+"""Backend registry with auto-dispatch by measured throughput.
+
+Every backend is registered as a loader plus a ``supports`` predicate, so
+nothing is imported until a backend is first used or calibrated. A short
+calibration measures each available backend once per host and caches the
+fit in a JSON file. ``BackendRegistry.select`` then routes a request to the
+backend with the lowest predicted wall time:
+
+    from mcengine import price_auto
+    result = price_auto(model, option, n_paths=1_000_000, seed=1)
+    result["backend"]   # e.g. "cpp" for short jobs, "cpp_threads" for long
+
+The cache lives in ``$MCENGINE_CACHE_DIR`` (default ``~/.cache/mcengine``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import math
+import os
+import platform
+import tempfile
+import time
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+from . import __version__
+from .models import GBMModel, HestonModel, MultiAssetGBMModel
+from .products import (
+    AmericanOption,
+    AsianOption,
+    BasketOption,
+    EuropeanOption,
+)
+
+# A loaded backend: price(model, product, n_paths, seed) -> result dict and
+# an optional batch(model, options, n_paths, seed) -> columnar dict for a
+# book of European options
+PriceFn = Callable[[Any, Any, int, "int | None"], dict]
+BatchFn = Callable[[GBMModel, Sequence[EuropeanOption], int, "int | None"], dict]
+
+# Workload kinds the cost model distinguishes, each calibrated separately
+# since the backends' relative speed differs between them. Work is counted
+# in paths for "european", path-steps for the time-stepped kinds, paths x
+# assets for "multi_asset" and paths x options for "batch".
+WORKLOAD_KINDS = ("european", "path", "heston", "multi_asset", "american", "batch")
+
+CALIBRATION_FILE = "calibration.json"
+
+# Part of the cache key; bump when the measurement or fit changes
+_CALIBRATION_FORMAT = "2"
+
+
+@dataclass(frozen=True)
+class Backend:
+    """One registered backend.
+
+    ``load`` imports whatever the backend needs and returns its
+    ``(price, batch)`` functions. It raises ImportError or RuntimeError
+    when the backend cannot run on this host. ``supports(model, product)``
+    says whether it prices a given request. ``parallel`` backends only
+    pay off with more than one CPU, so single-CPU hosts never route to
+    them (they can still be named explicitly).
+    """
+
+    name: str
+    load: Callable[[], tuple[PriceFn, BatchFn | None]]
+    supports: Callable[[Any, Any], bool]
+    parallel: bool = False
+
+
+@dataclass
+class Calibration:
+    """Per-host cost model: predicted seconds = fixed + per_unit * work,
+    fitted for every backend and workload kind."""
+
+    host: str
+    created: str
+    # costs[backend][kind] = (fixed seconds, seconds per unit of work)
+    costs: dict[str, dict[str, tuple[float, float]]] = field(default_factory=dict)
+
+    def predict(self, backend: str, kind: str, work: float) -> float | None:
+        fit = self.costs.get(backend, {}).get(kind)
+        if fit is None:
+            return None
+        fixed, per_unit = fit
+        return fixed + per_unit * work
+
+
+def _workload(model: Any, product: Any, n_paths: int, batch_size: int) -> tuple[str, float]:
+    """Workload kind and amount of work for a request."""
+    if batch_size > 1:
+        return "batch", float(n_paths) * batch_size
+    if isinstance(product, AmericanOption):
+        return "american", float(n_paths) * product.n_exercise
+    if isinstance(model, HestonModel):
+        # Heston steps Europeans on the model's own grid
+        steps = model.n_steps if isinstance(product, EuropeanOption) else product.n_steps
+        return "heston", float(n_paths) * steps
+    if isinstance(model, MultiAssetGBMModel):
+        return "multi_asset", float(n_paths) * model.n_assets
+    if isinstance(product, EuropeanOption):
+        return "european", float(n_paths)
+    return "path", float(n_paths) * product.n_steps
+
+
+def _probes() -> dict[str, tuple[Any, Any, tuple[int, ...]]]:
+    """Calibration request per workload kind: (model, product, n_paths
+    values to time it at)."""
+    gbm = GBMModel(spot=100.0, rate=0.02, vol=0.2)
+    heston = HestonModel(
+        spot=100.0, rate=0.02, v0=0.04, kappa=1.5, theta=0.04, xi=0.5, rho=-0.7, n_steps=16
+    )
+    assets = MultiAssetGBMModel(
+        spots=[100.0, 100.0, 100.0],
+        rate=0.02,
+        vols=[0.2, 0.25, 0.3],
+        correlation=[[1.0, 0.5, 0.5], [0.5, 1.0, 0.5], [0.5, 0.5, 1.0]],
+    )
+    asian = AsianOption(strike=100.0, maturity=1.0, n_steps=16)
+    return {
+        "european": (
+            gbm, EuropeanOption(strike=100.0, maturity=1.0), (1 << 12, 1 << 15, 1 << 17)
+        ),
+        "path": (gbm, asian, (1 << 10, 1 << 12, 1 << 14)),
+        "heston": (heston, asian, (1 << 10, 1 << 12, 1 << 13)),
+        "multi_asset": (
+            assets,
+            BasketOption(strike=100.0, maturity=1.0, weights=[1 / 3, 1 / 3, 1 / 3]),
+            (1 << 11, 1 << 13, 1 << 15),
+        ),
+        "american": (
+            gbm,
+            AmericanOption(strike=100.0, maturity=1.0, n_exercise=16),
+            (1 << 10, 1 << 12, 1 << 14),
+        ),
+    }
+
+
+# Book and path counts of the "batch" calibration probe
+_BATCH_PROBE_SIZES = (1 << 10, 1 << 12, 1 << 14)
+
+
+# -- Built-in backends -------------------------------------------------------
+
+
+def _load_numpy() -> tuple[PriceFn, BatchFn]:
+    from .american import LSMConfig, price_american_lsm
+    from .engine import MonteCarloConfig, MonteCarloEngine
+
+    def price(model, product, n_paths, seed):
+        if isinstance(product, AmericanOption):
+            return price_american_lsm(model, product, LSMConfig(n_paths=n_paths, seed=seed))
+        return MonteCarloEngine(model, MonteCarloConfig(n_paths=n_paths, seed=seed)).price(product)
+
+    def batch(model, options, n_paths, seed):
+        config = MonteCarloConfig(n_paths=n_paths, seed=seed)
+        return MonteCarloEngine(model, config).price_batch(options)
+
+    return price, batch
+
+
+def _load_cpp(n_threads: int | None) -> Callable[[], tuple[PriceFn, BatchFn | None]]:
+    def load() -> tuple[PriceFn, BatchFn | None]:
+        from . import fast_engine
+
+        if fast_engine._mc_core is None:
+            raise ImportError("C++ backend (_mc_core) is not available.")
+
+        def price(model, product, n_paths, seed):
+            config = fast_engine.FastMCConfig(n_paths=n_paths, seed=seed, n_threads=n_threads)
+            if isinstance(product, AmericanOption):
+                return fast_engine.price_american_mc_cpp(model, product, config)
+            if isinstance(model, HestonModel):
+                return fast_engine.price_heston_mc_cpp(model, product, config)
+            if isinstance(model, MultiAssetGBMModel):
+                return fast_engine.price_multi_asset_mc_cpp(model, product, config)
+            if isinstance(product, EuropeanOption):
+                return fast_engine.price_european_mc_cpp(model, product, config)
+            return fast_engine.price_path_dependent_mc_cpp(model, product, config)
+
+        def batch(model, options, n_paths, seed):
+            config = fast_engine.FastMCConfig(n_paths=n_paths, seed=seed, n_threads=n_threads)
+            return fast_engine.price_european_batch_mc_cpp(model, options, config)
+
+        return price, batch
+
+    return load
+
+
+def _pool_chunk_size(n_paths: int) -> int:
+    """Paths per price_parallel chunk: one chunk per CPU, so every request
+    (calibration probes included) fans out over the whole pool, capped at
+    DEFAULT_CHUNK_SIZE to keep a chunk's memory bounded."""
+    from .engine import DEFAULT_CHUNK_SIZE
+
+    per_worker = -(-n_paths // (os.cpu_count() or 1))
+    return min(max(per_worker, 2), DEFAULT_CHUNK_SIZE)
+
+
+def _load_process_pool() -> tuple[PriceFn, BatchFn]:
+    from .engine import MonteCarloConfig
+    from .parallel import price_parallel, price_portfolio
+
+    def price(model, product, n_paths, seed):
+        config = MonteCarloConfig(
+            n_paths=n_paths, seed=seed, chunk_size=_pool_chunk_size(n_paths)
+        )
+        return price_parallel(model, product, config)
+
+    def batch(model, options, n_paths, seed):
+        results = price_portfolio(model, options, MonteCarloConfig(n_paths=n_paths, seed=seed))
+        prices = np.array([r["price"] for r in results])
+        std_errors = np.array([r["std_error"] for r in results])
+        z = 1.96
+        return {
+            "price": prices,
+            "std_error": std_errors,
+            "conf_int_95": (prices - z * std_errors, prices + z * std_errors),
+        }
+
+    return price, batch
+
+
+def _supports_engine(model: Any, product: Any) -> bool:
+    # MonteCarloEngine and the C++ kernels cover the same products;
+    # American options need GBM (Longstaff-Schwartz)
+    return not isinstance(product, AmericanOption) or isinstance(model, GBMModel)
+
+
+def _supports_process_pool(model: Any, product: Any) -> bool:
+    return isinstance(model, GBMModel) and not isinstance(product, AmericanOption)
+
+
+def _builtin_backends() -> list[Backend]:
+    # Registration order breaks ties in predicted time
+    return [
+        Backend("numpy", _load_numpy, _supports_engine),
+        Backend("cpp", _load_cpp(None), _supports_engine),
+        Backend("cpp_threads", _load_cpp(0), _supports_engine, parallel=True),
+        Backend("process_pool", _load_process_pool, _supports_process_pool, parallel=True),
+    ]
+
+
+# -- Calibration -------------------------------------------------------------
+
+
+def _cache_dir() -> str:
+    return os.environ.get("MCENGINE_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "mcengine"
+    )
+
+
+# Measurements of one workload kind before the calibration gives up on it
+_FIT_ATTEMPTS = 3
+
+
+def _time(fn: Callable[[], Any], repeats: int) -> float:
+    """Median wall time of ``repeats`` calls, after one untimed warm-up
+    call (first-call imports, lazily built tables, page faults)."""
+    fn()
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times))
+
+
+def _fit(points: Sequence[tuple[float, float]]) -> tuple[float, float] | None:
+    """Least-squares (fixed, per_unit) through (work, seconds) points, or
+    None when the slope is not positive (the timings were noise)."""
+    work, seconds = np.asarray(points, dtype=float).T
+    per_unit, fixed = np.polyfit(work, seconds, 1)
+    if not per_unit > 0.0:
+        return None
+    return max(float(fixed), 0.0), float(per_unit)
+
+
+class BackendRegistry:
+    """Named backends, loaded lazily and routed by calibrated cost.
+
+    Parameters
+    ----------
+    cache_dir:
+        Where the per-host calibration is stored; None uses
+        ``$MCENGINE_CACHE_DIR`` or ``~/.cache/mcengine``.
+    repeats:
+        Timings per calibration point (the median is kept).
+    """
+
+    def __init__(self, cache_dir: str | None = None, repeats: int = 3) -> None:
+        self.cache_dir = cache_dir
+        self.repeats = repeats
+        self._backends: dict[str, Backend] = {}
+        self._loaded: dict[str, tuple[PriceFn, BatchFn | None] | None] = {}
+        self._calibration: Calibration | None = None
+        for backend in _builtin_backends():
+            self.register(backend)
+
+    def register(self, backend: Backend) -> None:
+        """Add (or replace) a backend; the next ``calibrate`` measures it."""
+        self._backends[backend.name] = backend
+        self._loaded.pop(backend.name, None)
+        self._calibration = None
+
+    def names(self) -> list[str]:
+        return list(self._backends)
+
+    def _load(self, name: str) -> tuple[PriceFn, BatchFn | None] | None:
+        if name not in self._backends:
+            raise KeyError(f"unknown backend {name!r}; registered: {self.names()}")
+        if name not in self._loaded:
+            try:
+                self._loaded[name] = self._backends[name].load()
+            except (ImportError, RuntimeError):
+                self._loaded[name] = None
+        return self._loaded[name]
+
+    def available(self) -> list[str]:
+        """Backends that load on this host (loading them if needed)."""
+        return [name for name in self._backends if self._load(name) is not None]
+
+    def _routable(self) -> list[str]:
+        """Available backends worth calibrating and routing to here."""
+        single_cpu = (os.cpu_count() or 1) == 1
+        return [
+            name for name in self.available()
+            if not (single_cpu and self._backends[name].parallel)
+        ]
+
+    # -- calibration --
+
+    def _host_key(self) -> str:
+        from .cache import backend_version
+
+        # The build digests make a rebuilt kernel (or changed engine code)
+        # recalibrate instead of being routed on its predecessor's timings
+        return "|".join([
+            platform.node(),
+            platform.machine(),
+            str(os.cpu_count()),
+            __version__,
+            _CALIBRATION_FORMAT,
+            ",".join(self._routable()),
+            backend_version("numpy"),
+            backend_version("cpp"),
+        ])
+
+    def _cache_path(self) -> str:
+        return os.path.join(self.cache_dir or _cache_dir(), CALIBRATION_FILE)
+
+    def _read_cache(self) -> Calibration | None:
+        try:
+            with open(self._cache_path()) as f:
+                entry = json.load(f).get(self._host_key())
+        except (OSError, ValueError):
+            return None
+        if entry is None:
+            return None
+        costs = {
+            name: {kind: tuple(fit) for kind, fit in kinds.items()}
+            for name, kinds in entry["costs"].items()
+        }
+        return Calibration(host=entry["host"], created=entry["created"], costs=costs)
+
+    def _write_cache(self, calibration: Calibration) -> None:
+        """Merge this host's entry into the cache file, atomically; a
+        read-only cache directory just means recalibrating next time."""
+        path = self._cache_path()
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            try:
+                with open(path) as f:
+                    entries = json.load(f)
+            except (OSError, ValueError):
+                entries = {}
+            entries[self._host_key()] = {
+                "host": calibration.host,
+                "created": calibration.created,
+                "costs": calibration.costs,
+            }
+            fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+
+    def calibrate(self, force: bool = False) -> Calibration:
+        """Per-host cost model, from the cache unless ``force``.
+
+        Each available backend prices one small request per workload kind
+        (``_probes``) at three path counts, plus a 16-option European book
+        when it has a batch function. A least-squares line through the
+        points gives the start-up cost (thread or process spawn, Python
+        overhead) and the per-unit cost. A fit whose slope is not positive
+        is measured again, up to ``_FIT_ATTEMPTS`` times; if it never is,
+        the kind stays uncalibrated for that backend and ``select`` skips
+        it. The whole run takes a few seconds.
+        """
+        if self._calibration is not None and not force:
+            return self._calibration
+        if not force:
+            self._calibration = self._read_cache()
+            if self._calibration is not None:
+                return self._calibration
+
+        probes = _probes()
+        gbm = probes["european"][0]
+        book = [EuropeanOption(strike=k, maturity=1.0) for k in np.linspace(80.0, 120.0, 16)]
+
+        costs: dict[str, dict[str, tuple[float, float]]] = {}
+        for name in self._routable():
+            price, batch = self._load(name)
+            fits: dict[str, tuple[float, float]] = {}
+            for kind, (model, product, sizes) in probes.items():
+                if not self._backends[name].supports(model, product):
+                    continue
+                fit = self._measure(
+                    lambda n: price(model, product, n, 1),
+                    [(n, _workload(model, product, n, 1)[1]) for n in sizes],
+                )
+                if fit is not None:
+                    fits[kind] = fit
+            if batch is not None:
+                fit = self._measure(
+                    lambda n: batch(gbm, book, n, 1),
+                    [(n, float(n) * len(book)) for n in _BATCH_PROBE_SIZES],
+                )
+                if fit is not None:
+                    fits["batch"] = fit
+            costs[name] = fits
+
+        self._calibration = Calibration(
+            host=platform.node(),
+            created=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            costs=costs,
+        )
+        self._write_cache(self._calibration)
+        return self._calibration
+
+    def _measure(
+        self, run: Callable[[int], Any], sizes: Sequence[tuple[int, float]]
+    ) -> tuple[float, float] | None:
+        """Fit of ``run(n_paths)`` timed at each ``(n_paths, work)``,
+        re-measured while the slope comes out non-positive."""
+        for _ in range(_FIT_ATTEMPTS):
+            fit = _fit([(work, _time(lambda: run(n), self.repeats)) for n, work in sizes])
+            if fit is not None:
+                return fit
+        return None
+
+    # -- dispatch --
+
+    def select(self, model: Any, product: Any, n_paths: int, batch_size: int = 1) -> str:
+        """Name of the backend with the lowest predicted wall time.
+
+        For ``batch_size > 1`` ``product`` is any one option of the book;
+        backends without a batch function are costed as one call per
+        option. Backends the calibration did not cover are skipped.
+        """
+        calibration = self.calibrate()
+        kind, work = _workload(model, product, n_paths, batch_size)
+        best, best_time = None, math.inf
+        for name in self._routable():
+            if not self._backends[name].supports(model, product):
+                continue
+            if kind == "batch" and self._load(name)[1] is None:
+                single_kind, single_work = _workload(model, product, n_paths, 1)
+                single = calibration.predict(name, single_kind, single_work)
+                predicted = None if single is None else batch_size * single
+            else:
+                predicted = calibration.predict(name, kind, work)
+            if predicted is not None and predicted < best_time:
+                best, best_time = name, predicted
+        if best is None:
+            raise ValueError(
+                f"no calibrated backend prices {type(product).__name__} under "
+                f"{type(model).__name__}"
+            )
+        return best
+
+    def price(
+        self,
+        model: Any,
+        product: Any,
+        n_paths: int,
+        seed: int | None = None,
+        backend: str = "auto",
+    ) -> dict:
+        """Price one product on ``backend`` ("auto" routes with
+        ``select``). Returns that backend's result dict plus ``"backend"``."""
+        name = self.select(model, product, n_paths) if backend == "auto" else backend
+        loaded = self._load(name)
+        if loaded is None:
+            raise RuntimeError(f"backend {name!r} is not available")
+        result = loaded[0](model, product, n_paths, seed)
+        result["backend"] = name
+        return result
+
+    def price_batch(
+        self,
+        model: GBMModel,
+        options: Sequence[EuropeanOption],
+        n_paths: int,
+        seed: int | None = None,
+        backend: str = "auto",
+    ) -> dict:
+        """Price a book of European options; returns columnar ``price`` /
+        ``std_error`` / ``conf_int_95`` arrays plus ``"backend"``."""
+        if len(options) == 0:
+            raise ValueError("options must be non-empty")
+        name = (
+            self.select(model, options[0], n_paths, batch_size=len(options))
+            if backend == "auto"
+            else backend
+        )
+        loaded = self._load(name)
+        if loaded is None:
+            raise RuntimeError(f"backend {name!r} is not available")
+        price, batch = loaded
+        if batch is not None:
+            result = batch(model, options, n_paths, seed)
+        else:
+            children = np.random.SeedSequence(seed).spawn(len(options))
+            rows = [
+                price(model, o, n_paths, int(c.generate_state(1)[0]))
+                for o, c in zip(options, children)
+            ]
+            prices = np.array([r["price"] for r in rows])
+            std_errors = np.array([r["std_error"] for r in rows])
+            z = 1.96
+            result = {
+                "price": prices,
+                "std_error": std_errors,
+                "conf_int_95": (prices - z * std_errors, prices + z * std_errors),
+            }
+        result["backend"] = name
+        return result
+
+
+_default_registry: BackendRegistry | None = None
+
+
+def default_registry() -> BackendRegistry:
+    """The process-wide registry used by ``price_auto``."""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = BackendRegistry()
+    return _default_registry
+
+
+def price_auto(model: Any, product: Any, n_paths: int, seed: int | None = None) -> dict:
+    """Price ``product`` on the fastest calibrated backend for this request."""
+    return default_registry().price(model, product, n_paths, seed)
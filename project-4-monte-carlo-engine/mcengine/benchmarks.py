@@ -0,0 +1,594 @@
+"""Benchmark and convergence suite for the mcengine backends.
+
+Sweeps ``n_paths`` × moneyness × maturity for every registered backend and
+records wall time, paths/sec, peak RSS and the error against
+``black_scholes_price``. Results are written to JSON; ``compare`` checks a
+run against a stored baseline and flags regressions.
+
+    python -m mcengine.benchmarks run --out bench.json
+    python -m mcengine.benchmarks compare bench.json baseline.json
+    python -m mcengine.benchmarks heston --n-threads 0
+    python -m mcengine.benchmarks american
+    python -m mcengine.benchmarks kernel
+    python -m mcengine.benchmarks server
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+import json
+import math
+import os
+import platform
+import sys
+import time
+from typing import Callable, Sequence
+
+import numpy as np
+
+from . import fast_engine
+from .american import LSMConfig, price_american_lsm
+from .analytics import black_scholes_price
+from .engine import MonteCarloConfig, MonteCarloEngine
+from .fast_engine import (
+    FastMCConfig,
+    price_american_mc_cpp,
+    price_european_mc_cpp,
+    price_heston_mc_cpp,
+)
+from .models import GBMModel, HestonModel
+from .products import AmericanOption, AsianOption, EuropeanOption, OptionType
+from .server import PricingClient, PricingServer, ServerConfig
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# A backend prices one option with n_paths paths and a seed, returning the
+# usual result dict (at least "price", "std_error" and "n_paths").
+Backend = Callable[[GBMModel, EuropeanOption, int, int], dict]
+
+
+def _numpy_backend(model: GBMModel, option: EuropeanOption, n_paths: int, seed: int) -> dict:
+    return MonteCarloEngine(model, MonteCarloConfig(n_paths=n_paths, seed=seed)).price(option)
+
+
+def _cpp_backend(model: GBMModel, option: EuropeanOption, n_paths: int, seed: int) -> dict:
+    return price_european_mc_cpp(model, option, FastMCConfig(n_paths=n_paths, seed=seed))
+
+
+def _cpp_parallel_backend(
+    model: GBMModel, option: EuropeanOption, n_paths: int, seed: int
+) -> dict:
+    config = FastMCConfig(n_paths=n_paths, seed=seed, n_threads=0)
+    return price_european_mc_cpp(model, option, config)
+
+
+BACKENDS: dict[str, Backend] = {"numpy": _numpy_backend}
+if fast_engine._mc_core is not None:
+    BACKENDS["cpp"] = _cpp_backend
+    BACKENDS["cpp_parallel"] = _cpp_parallel_backend
+
+
+def register_backend(name: str, fn: Backend) -> None:
+    """Add (or replace) a backend so ``run_benchmarks`` sweeps it too."""
+    BACKENDS[name] = fn
+
+
+@dataclass
+class BenchmarkConfig:
+    n_paths: Sequence[int] = (10_000, 100_000, 1_000_000)
+    # Strike as a fraction of spot
+    moneyness: Sequence[float] = (0.8, 1.0, 1.2)
+    maturities: Sequence[float] = (0.25, 1.0, 2.0)
+    spot: float = 100.0
+    rate: float = 0.02
+    vol: float = 0.2
+    option_type: str = "call"
+    seed: int = 1
+    # Wall time is the best of `repeats` runs
+    repeats: int = 3
+    # None -> every registered backend
+    backends: Sequence[str] | None = None
+
+
+def _peak_rss_mb() -> float | None:
+    """Process peak resident set size in MB (a high-water mark, so it only
+    grows over a run), or None where ``resource`` is unavailable."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KB, macOS bytes
+    scale = 1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0
+    return peak / scale
+
+
+def _run_case(
+    backend: Backend,
+    model: GBMModel,
+    option: EuropeanOption,
+    n_paths: int,
+    seed: int,
+    repeats: int,
+    reference: float,
+) -> dict:
+    wall_times = []
+    for _ in range(max(1, repeats)):
+        start = time.perf_counter()
+        result = backend(model, option, n_paths, seed)
+        wall_times.append(time.perf_counter() - start)
+    wall_time = min(wall_times)
+
+    error = result["price"] - reference
+    std_error = result["std_error"]
+    return {
+        "wall_time": wall_time,
+        "paths_per_sec": result["n_paths"] / wall_time if wall_time > 0 else math.inf,
+        "peak_rss_mb": _peak_rss_mb(),
+        "price": result["price"],
+        "std_error": std_error,
+        "bs_price": reference,
+        "abs_error": abs(error),
+        "z_score": error / std_error if std_error > 0 else 0.0,
+        # Work-normalised variance (lower is better): halving it means the
+        # same accuracy in half the time
+        "efficiency": std_error**2 * wall_time,
+    }
+
+
+def _convergence(results: list[dict]) -> dict[str, list[dict]]:
+    """Error against time spent: per backend and n_paths, the mean wall time
+    and the RMS error against Black–Scholes over the moneyness/maturity grid."""
+    curves: dict[str, list[dict]] = {}
+    for backend in dict.fromkeys(r["backend"] for r in results):
+        points = []
+        rows = [r for r in results if r["backend"] == backend]
+        for n in sorted({r["n_paths"] for r in rows}):
+            group = [r for r in rows if r["n_paths"] == n]
+            points.append(
+                {
+                    "n_paths": n,
+                    "wall_time": float(np.mean([r["wall_time"] for r in group])),
+                    "rms_error": float(np.sqrt(np.mean([r["abs_error"] ** 2 for r in group]))),
+                    "rms_std_error": float(np.sqrt(np.mean([r["std_error"] ** 2 for r in group]))),
+                }
+            )
+        curves[backend] = points
+    return curves
+
+
+def _environment() -> dict:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "host": platform.node(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "cpu_count": os.cpu_count(),
+        "cpp_backend": fast_engine._mc_core is not None,
+    }
+
+
+def run_benchmarks(config: BenchmarkConfig | None = None) -> dict:
+    """Run the sweep and return a JSON-serialisable report:
+
+    {
+      "environment": {...},              # host, versions, timestamp
+      "config": {...},                   # the BenchmarkConfig used
+      "results": [...],                  # one row per backend/maturity/moneyness/n_paths
+      "convergence": {backend: [...]}    # RMS error vs wall time per n_paths
+    }
+    """
+    config = config or BenchmarkConfig()
+    names = list(config.backends) if config.backends is not None else list(BACKENDS)
+    unknown = [name for name in names if name not in BACKENDS]
+    if unknown:
+        raise ValueError(f"Unknown backends {unknown}; registered: {list(BACKENDS)}")
+
+    model = GBMModel(spot=config.spot, rate=config.rate, vol=config.vol)
+    option_type = OptionType(config.option_type)
+
+    results = []
+    for name in names:
+        backend = BACKENDS[name]
+        # Warm-up so one-off costs (imports, page faults) don't hit the first case
+        backend(model, EuropeanOption(config.spot, 1.0, option_type), 1_000, config.seed)
+        for maturity in config.maturities:
+            for moneyness in config.moneyness:
+                option = EuropeanOption(
+                    strike=config.spot * moneyness,
+                    maturity=maturity,
+                    option_type=option_type,
+                )
+                reference = black_scholes_price(model, option)
+                # Increasing n_paths, so peak RSS growth belongs to the largest case
+                for n_paths in sorted(config.n_paths):
+                    row = _run_case(
+                        backend, model, option, n_paths, config.seed, config.repeats, reference
+                    )
+                    results.append(
+                        {
+                            "backend": name,
+                            "n_paths": n_paths,
+                            "moneyness": moneyness,
+                            "maturity": maturity,
+                            **row,
+                        }
+                    )
+
+    return {
+        "environment": _environment(),
+        "config": {k: list(v) if isinstance(v, tuple) else v for k, v in asdict(config).items()},
+        "results": results,
+        "convergence": _convergence(results),
+    }
+
+
+def _case_key(row: dict) -> tuple:
+    return (row["backend"], row["n_paths"], row["moneyness"], row["maturity"])
+
+
+def compare(
+    current: dict,
+    baseline: dict,
+    tolerance: float = 0.10,
+    memory_tolerance: float = 0.25,
+    max_z: float = 4.0,
+) -> list[dict]:
+    """Flag regressions of ``current`` against ``baseline`` (both reports
+    from ``run_benchmarks``). Only cases present in both are compared.
+
+    - ``paths_per_sec``: throughput dropped by more than ``tolerance``;
+    - ``efficiency``: std_error² × wall time grew by more than ``tolerance``;
+    - ``peak_rss_mb``: peak RSS grew by more than ``memory_tolerance``;
+    - ``z_score``: the price sits more than ``max_z`` standard errors from
+      Black–Scholes (a bias, whatever the baseline says).
+
+    Returns one dict per flag, empty if nothing regressed.
+    """
+    base = {_case_key(row): row for row in baseline["results"]}
+    flags = []
+
+    def flag(row: dict, metric: str, old: float | None, new: float) -> None:
+        flags.append(
+            {
+                "backend": row["backend"],
+                "n_paths": row["n_paths"],
+                "moneyness": row["moneyness"],
+                "maturity": row["maturity"],
+                "metric": metric,
+                "baseline": old,
+                "current": new,
+                "change": (new / old - 1.0) if old else None,
+            }
+        )
+
+    for row in current["results"]:
+        if abs(row["z_score"]) > max_z:
+            flag(row, "z_score", None, row["z_score"])
+
+        old = base.get(_case_key(row))
+        if old is None:
+            continue
+        if row["paths_per_sec"] < old["paths_per_sec"] * (1.0 - tolerance):
+            flag(row, "paths_per_sec", old["paths_per_sec"], row["paths_per_sec"])
+        if row["efficiency"] > old["efficiency"] * (1.0 + tolerance):
+            flag(row, "efficiency", old["efficiency"], row["efficiency"])
+        if (
+            row["peak_rss_mb"] is not None
+            and old["peak_rss_mb"] is not None
+            and row["peak_rss_mb"] > old["peak_rss_mb"] * (1.0 + memory_tolerance)
+        ):
+            flag(row, "peak_rss_mb", old["peak_rss_mb"], row["peak_rss_mb"])
+    return flags
+
+
+def heston_speedup(
+    n_paths: int = 100_000,
+    n_steps: int = 252,
+    n_threads: int | None = None,
+    seed: int = 1,
+) -> dict:
+    """Time the NumPy and C++ Heston QE kernels on the same Asian option
+    (``n_steps`` monitoring dates) and report the C++ speedup.
+
+    ``n_threads`` is passed to the C++ kernel (None -> one thread).
+    """
+    model = HestonModel(spot=100.0, rate=0.02, v0=0.04, kappa=1.5, theta=0.04,
+                        xi=0.5, rho=-0.7, n_steps=n_steps)
+    option = AsianOption(strike=100.0, maturity=1.0, n_steps=n_steps)
+
+    start = time.perf_counter()
+    numpy_result = MonteCarloEngine(model, MonteCarloConfig(n_paths=n_paths, seed=seed)).price(option)
+    numpy_time = time.perf_counter() - start
+
+    config = FastMCConfig(n_paths=n_paths, seed=seed, n_threads=n_threads)
+    start = time.perf_counter()
+    cpp_result = price_heston_mc_cpp(model, option, config)
+    cpp_time = time.perf_counter() - start
+
+    return {
+        "n_paths": n_paths,
+        "n_steps": n_steps,
+        "n_threads": n_threads,
+        "numpy_time": numpy_time,
+        "cpp_time": cpp_time,
+        "speedup": numpy_time / cpp_time,
+        "numpy_price": numpy_result["price"],
+        "cpp_price": cpp_result["price"],
+        "std_error": max(numpy_result["std_error"], cpp_result["std_error"]),
+    }
+
+
+def american_speedup(
+    n_paths: int = 100_000,
+    n_exercise: int = 50,
+    basis_degree: int = 3,
+    n_threads: int | None = None,
+    seed: int = 1,
+) -> dict:
+    """Time the NumPy and C++ Longstaff-Schwartz pricers on the American
+    put of Longstaff and Schwartz (2001), Table 1 (S0 = 36, K = 40,
+    sigma = 0.2, T = 1, r = 0.06; 4.478 by finite differences).
+
+    ``n_threads`` is passed to the C++ kernel (None -> one thread).
+    """
+    model = GBMModel(spot=36.0, rate=0.06, vol=0.2)
+    option = AmericanOption(strike=40.0, maturity=1.0, n_exercise=n_exercise)
+
+    numpy_result = price_american_lsm(
+        model, option, LSMConfig(n_paths=n_paths, seed=seed, basis_degree=basis_degree)
+    )
+    config = FastMCConfig(n_paths=n_paths, seed=seed, n_threads=n_threads)
+    cpp_result = price_american_mc_cpp(model, option, config, basis_degree=basis_degree)
+
+    return {
+        "n_paths": n_paths,
+        "n_exercise": n_exercise,
+        "n_threads": n_threads,
+        "numpy_time": numpy_result["elapsed"],
+        "cpp_time": cpp_result["elapsed"],
+        "speedup": numpy_result["elapsed"] / cpp_result["elapsed"],
+        "numpy_price": numpy_result["price"],
+        "cpp_price": cpp_result["price"],
+        "std_error": max(numpy_result["std_error"], cpp_result["std_error"]),
+    }
+
+
+def kernel_speedup(
+    n_paths: int = 4_000_000,
+    repeats: int = 3,
+    seed: int = 1,
+) -> list[dict]:
+    """Single-thread paths/sec of the reference scalar European loop
+    (``mc_price_european_scalar``) against the block kernel
+    (``mc_price_european``) in double and single precision.
+
+    One row per kernel and option type, each the best of ``repeats``
+    runs, with ``speedup`` relative to the scalar loop.
+    """
+    if fast_engine._mc_core is None:
+        raise RuntimeError("C++ backend (_mc_core) is not available.")
+    core = fast_engine._mc_core
+    kernels = {
+        "scalar": core.mc_price_european_scalar,
+        "block": core.mc_price_european,
+        "block_float32": lambda **kw: core.mc_price_european(precision=1, **kw),
+    }
+
+    rows = []
+    for is_call in (True, False):
+        kwargs = dict(S0=100.0, K=100.0, r=0.02, sigma=0.2, T=1.0,
+                      n_paths=n_paths, seed=seed, is_call=is_call)
+        baseline = None
+        for name, kernel in kernels.items():
+            best = math.inf
+            for _ in range(repeats):
+                start = time.perf_counter()
+                raw = kernel(**kwargs)
+                best = min(best, time.perf_counter() - start)
+            baseline = baseline or best
+            rows.append({
+                "kernel": name,
+                "option_type": "call" if is_call else "put",
+                "wall_time": best,
+                "paths_per_sec": n_paths / best,
+                "speedup": baseline / best,
+                "price": raw["price"],
+                "std_error": raw["std_error"],
+            })
+    return rows
+
+
+def server_throughput(
+    n_requests: int = 2_000,
+    n_clients: int = 20,
+    n_paths: int = 20_000,
+    seed: int = 1,
+) -> dict:
+    """Requests/sec for many small European requests: one
+    ``price_european_mc_cpp`` call per request versus ``n_clients``
+    concurrent connections to a local ``PricingServer``, which coalesces
+    them into batched kernel calls. Also returns the server's metrics.
+    """
+    model = GBMModel(spot=100.0, rate=0.02, vol=0.2)
+    options = [
+        EuropeanOption(strike=80.0 + i % 41, maturity=(0.5, 1.0)[i % 2],
+                       option_type=(OptionType.CALL, OptionType.PUT)[i % 3 == 0])
+        for i in range(n_requests)
+    ]
+
+    config = FastMCConfig(n_paths=n_paths, seed=seed)
+    start = time.perf_counter()
+    for option in options:
+        price_european_mc_cpp(model, option, config)
+    direct_time = time.perf_counter() - start
+
+    async def via_server() -> tuple[float, dict]:
+        server = PricingServer(ServerConfig(n_paths=n_paths, seed=seed))
+        listener = await server.start_tcp()
+        port = listener.sockets[0].getsockname()[1]
+        clients = [await PricingClient.connect_tcp(port=port) for _ in range(n_clients)]
+        start = time.perf_counter()
+        await asyncio.gather(*[
+            clients[i % n_clients].price(model, option) for i, option in enumerate(options)
+        ])
+        elapsed = time.perf_counter() - start
+        metrics = await clients[0].metrics()
+        for client in clients:
+            await client.close()
+        listener.close()
+        await server.close()
+        return elapsed, metrics
+
+    server_time, metrics = asyncio.run(via_server())
+    return {
+        "n_requests": n_requests,
+        "n_clients": n_clients,
+        "n_paths": n_paths,
+        "direct_per_sec": n_requests / direct_time,
+        "server_per_sec": n_requests / server_time,
+        "speedup": direct_time / server_time,
+        "metrics": metrics,
+    }
+
+
+def _print_report(report: dict) -> None:
+    print(f"{'backend':<14}{'T':>6}{'K/S0':>7}{'n_paths':>11}{'wall [s]':>11}"
+          f"{'paths/s':>13}{'|err|':>10}{'z':>7}{'RSS [MB]':>10}")
+    for r in report["results"]:
+        rss = f"{r['peak_rss_mb']:.0f}" if r["peak_rss_mb"] is not None else "-"
+        print(f"{r['backend']:<14}{r['maturity']:>6.2f}{r['moneyness']:>7.2f}{r['n_paths']:>11,}"
+              f"{r['wall_time']:>11.4f}{r['paths_per_sec']:>13.3g}{r['abs_error']:>10.4f}"
+              f"{r['z_score']:>7.2f}{rss:>10}")
+
+
+def _floats(text: str) -> list[float]:
+    return [float(x) for x in text.split(",")]
+
+
+def _ints(text: str) -> list[int]:
+    return [int(float(x)) for x in text.split(",")]
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m mcengine.benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    defaults = BenchmarkConfig()
+    run = sub.add_parser("run", help="run the sweep and write a JSON report")
+    run.add_argument("--out", default="bench.json")
+    run.add_argument("--n-paths", type=_ints, default=list(defaults.n_paths))
+    run.add_argument("--moneyness", type=_floats, default=list(defaults.moneyness))
+    run.add_argument("--maturities", type=_floats, default=list(defaults.maturities))
+    run.add_argument("--backends", type=lambda s: s.split(","), default=None)
+    run.add_argument("--repeats", type=int, default=defaults.repeats)
+    run.add_argument("--seed", type=int, default=defaults.seed)
+    run.add_argument("--baseline", help="also compare against this report")
+
+    cmp = sub.add_parser("compare", help="flag regressions against a baseline report")
+    for p in (run, cmp):
+        p.add_argument("--tolerance", type=float, default=0.10)
+        p.add_argument("--memory-tolerance", type=float, default=0.25)
+    cmp.add_argument("current")
+    cmp.add_argument("baseline")
+
+    heston = sub.add_parser("heston", help="NumPy vs C++ Heston QE speedup")
+    heston.add_argument("--n-paths", type=int, default=100_000)
+    heston.add_argument("--n-steps", type=int, default=252)
+    heston.add_argument("--n-threads", type=int, default=None)
+
+    american = sub.add_parser("american", help="NumPy vs C++ Longstaff-Schwartz American put")
+    american.add_argument("--n-paths", type=int, default=100_000)
+    american.add_argument("--n-exercise", type=int, default=50)
+    american.add_argument("--basis-degree", type=int, default=3)
+    american.add_argument("--n-threads", type=int, default=None)
+
+    kernel = sub.add_parser("kernel", help="scalar vs block European kernel, one thread")
+    kernel.add_argument("--n-paths", type=int, default=4_000_000)
+    kernel.add_argument("--repeats", type=int, default=3)
+
+    server = sub.add_parser("server", help="direct calls vs the batching pricing server")
+    server.add_argument("--n-requests", type=int, default=2_000)
+    server.add_argument("--n-clients", type=int, default=20)
+    server.add_argument("--n-paths", type=int, default=20_000)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "server":
+        r = server_throughput(args.n_requests, args.n_clients, args.n_paths)
+        m = r["metrics"]
+        print(f"{r['n_requests']:,} requests x {r['n_paths']:,} paths, {r['n_clients']} clients")
+        print(f"  direct {r['direct_per_sec']:,.0f} req/s")
+        print(f"  server {r['server_per_sec']:,.0f} req/s  ({r['speedup']:.1f}x, "
+              f"{m['batches']} batches, mean size {m['mean_batch_size']:.0f})")
+        print(f"  latency p50/p90/p99 {m['latency_ms_p50']:.1f} / {m['latency_ms_p90']:.1f} / "
+              f"{m['latency_ms_p99']:.1f} ms")
+        return 0
+
+    if args.command == "kernel":
+        print(f"{'kernel':<15}{'type':>6}{'paths/s':>13}{'speedup':>9}{'price':>10}{'std err':>10}")
+        for r in kernel_speedup(args.n_paths, args.repeats):
+            print(f"{r['kernel']:<15}{r['option_type']:>6}{r['paths_per_sec']:>13.3g}"
+                  f"{r['speedup']:>8.1f}x{r['price']:>10.4f}{r['std_error']:>10.4f}")
+        return 0
+
+    if args.command == "heston":
+        r = heston_speedup(args.n_paths, args.n_steps, args.n_threads)
+        print(f"Heston QE, {r['n_paths']:,} paths x {r['n_steps']} steps "
+              f"(C++ n_threads={r['n_threads']})")
+        print(f"  NumPy {r['numpy_time']:.3f} s  price {r['numpy_price']:.4f}")
+        print(f"  C++   {r['cpp_time']:.3f} s  price {r['cpp_price']:.4f}")
+        print(f"  speedup {r['speedup']:.1f}x  (std error ~{r['std_error']:.4f})")
+        return 0
+
+    if args.command == "american":
+        r = american_speedup(args.n_paths, args.n_exercise, args.basis_degree, args.n_threads)
+        print(f"American put (LSM), {r['n_paths']:,} paths x {r['n_exercise']} exercise dates "
+              f"(C++ n_threads={r['n_threads']})")
+        print(f"  NumPy {r['numpy_time']:.3f} s  price {r['numpy_price']:.4f}")
+        print(f"  C++   {r['cpp_time']:.3f} s  price {r['cpp_price']:.4f}")
+        print(f"  speedup {r['speedup']:.1f}x  (std error ~{r['std_error']:.4f})")
+        return 0
+
+    if args.command == "run":
+        config = BenchmarkConfig(
+            n_paths=args.n_paths,
+            moneyness=args.moneyness,
+            maturities=args.maturities,
+            backends=args.backends,
+            repeats=args.repeats,
+            seed=args.seed,
+        )
+        report = run_benchmarks(config)
+        with open(args.out, "w") as f:
+            json.dump(report, f, indent=2)
+        _print_report(report)
+        print(f"\nwrote {args.out}")
+        if args.baseline is None:
+            return 0
+        current, baseline_path = report, args.baseline
+    else:
+        with open(args.current) as f:
+            current = json.load(f)
+        baseline_path = args.baseline
+
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    flags = compare(current, baseline, args.tolerance, args.memory_tolerance)
+    for f in flags:
+        change = f"{f['change']:+.1%}" if f["change"] is not None else ""
+        print(f"REGRESSION {f['backend']} T={f['maturity']} K/S0={f['moneyness']} "
+              f"n={f['n_paths']}: {f['metric']} {f['baseline']} -> {f['current']:.4g} {change}")
+    print(f"{len(flags)} regression(s) against {baseline_path}")
+    return 1 if flags else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
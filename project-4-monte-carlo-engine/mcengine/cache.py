@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from functools import lru_cache
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+from typing import Any
+
+import numpy as np
+
+from . import __version__, engine, fast_engine, models, products, samplers, stats, summaries
+from .engine import MonteCarloConfig, MonteCarloEngine
+from .fast_engine import FastMCConfig, price_european_mc_cpp
+from .models import GBMModel
+from .products import EuropeanOption
+
+
+def _canonical(obj: Any) -> Any:
+    """JSON-ready form of a model / product / config, stable across runs.
+
+    Dataclasses carry their class name so that, say, an Asian and a
+    lookback option with equal fields never share a key.
+    """
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            "__type__": type(obj).__name__,
+            **{f.name: _canonical(getattr(obj, f.name)) for f in fields(obj)},
+        }
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, np.random.SeedSequence):
+        return {"entropy": _canonical(obj.entropy), "spawn_key": list(obj.spawn_key)}
+    if isinstance(obj, np.ndarray):
+        # MultiAssetGBMModel keeps its spots, vols and correlation as arrays
+        return _canonical(obj.tolist())
+    if isinstance(obj, (list, tuple)):
+        return [_canonical(x) for x in obj]
+    if isinstance(obj, (np.integer, int)) and not isinstance(obj, bool):
+        return int(obj)
+    if isinstance(obj, (np.floating, float)):
+        # repr round-trips, so 0.1 and 0.1000000000000001 stay distinct
+        return repr(float(obj))
+    return obj
+
+
+def cache_key(backend: str, *parts: Any) -> str:
+    """SHA-256 over the backend name, its version and the canonical fields
+    of ``parts`` (model, product, config)."""
+    payload = {
+        "backend": backend,
+        "version": backend_version(backend),
+        "parts": [_canonical(p) for p in parts],
+    }
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def _file_digest(*paths: str) -> str:
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+# Modules whose code determines a NumPy result for a given seed
+_NUMPY_ENGINE_MODULES = (engine, models, products, samplers, stats, summaries)
+
+
+@lru_cache(maxsize=None)
+def backend_version(backend: str) -> str:
+    """Version string folded into every key, so results from an older
+    build are never served.
+
+    The NumPy backend depends on the NumPy version (its bit generators and
+    normal sampler) and on the engine's own code, identified by a hash of
+    its modules' sources; the C++ backend on the compiled extension and
+    its Python wrapper, identified by a hash of the shared library and
+    fast_engine.py. Changing either algorithm therefore invalidates the
+    entries it wrote, including those in a persistent SQLite store.
+    """
+    if backend == "numpy":
+        digest = _file_digest(*(m.__file__ for m in _NUMPY_ENGINE_MODULES))
+        return f"{__version__}+engine-{digest}+numpy-{np.__version__}"
+    if backend == "cpp":
+        if fast_engine._mc_core is None:
+            return f"{__version__}+cpp-unavailable"
+        digest = _file_digest(fast_engine._mc_core.__file__, fast_engine.__file__)
+        return f"{__version__}+cpp-{digest}"
+    raise ValueError(f"Unknown backend {backend!r}; expected 'numpy' or 'cpp'")
+
+
+class ResultCache:
+    """Bounded LRU of pricing results, optionally backed by SQLite.
+
+    The in-memory layer keeps the ``maxsize`` most recently used results.
+    With ``path`` set, every result is also written to a SQLite file, and
+    a memory miss falls through to it. Entries evicted from memory (or
+    left by earlier processes) are therefore still served from disk.
+
+    Safe to share between threads.
+    """
+
+    def __init__(self, maxsize: int = 1024, path: str | None = None) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.maxsize = maxsize
+        self.path = path
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._disk_hits = self._misses = self._evictions = 0
+
+        self._db = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> dict | None:
+        """Cached result for ``key`` (a deep copy, so callers never share
+        nested objects such as ``summaries``), or None."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return copy.deepcopy(result)
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None:
+                    result = pickle.loads(row[0])
+                    self._remember(key, result)
+                    self._disk_hits += 1
+                    return copy.deepcopy(result)
+
+            self._misses += 1
+            return None
+
+    def put(self, key: str, result: dict) -> None:
+        with self._lock:
+            self._remember(key, copy.deepcopy(result))
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO results (key, value) VALUES (?, ?)",
+                    (key, pickle.dumps(result)),
+                )
+                self._db.commit()
+
+    def _remember(self, key: str, result: dict) -> None:
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry (memory and disk) and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._disk_hits = self._misses = self._evictions = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    @property
+    def stats(self) -> dict:
+        """{"hits", "disk_hits", "misses", "evictions", "size", "hit_rate"};
+        ``hits`` counts memory hits only, ``hit_rate`` includes disk hits."""
+        with self._lock:
+            lookups = self._hits + self._disk_hits + self._misses
+            return {
+                "hits": self._hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+                "hit_rate": (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+            }
+
+
+# Process-wide cache used when no explicit cache is passed
+_default_cache = ResultCache()
+
+
+def default_cache() -> ResultCache:
+    return _default_cache
+
+
+def _deterministic(config: MonteCarloConfig) -> bool:
+    # Unseeded runs differ every time, and a time budget makes the path
+    # count depend on machine load
+    return config.seed is not None and config.time_budget is None
+
+
+def _measured(config: MonteCarloConfig | FastMCConfig) -> bool:
+    # An instrumented run exists to time itself and record a profile in
+    # the metrics registry; a cache hit would replay a stale profile
+    return config.instrument
+
+
+def cached_price(
+    model: GBMModel,
+    product: Any,
+    config: MonteCarloConfig,
+    cache: ResultCache | None = None,
+) -> dict:
+    """``MonteCarloEngine(model, config).price(product)`` through a cache.
+
+    Seeded results are deterministic, so a repeat call with equal
+    (model, product, config) returns the stored dict instead of
+    re-simulating. Unseeded, time-budgeted or instrumented runs bypass
+    the cache.
+    """
+    cache = cache or _default_cache
+    if not _deterministic(config) or _measured(config):
+        return MonteCarloEngine(model, config).price(product)
+
+    key = cache_key("numpy", model, product, config)
+    result = cache.get(key)
+    if result is None:
+        result = MonteCarloEngine(model, config).price(product)
+        cache.put(key, result)
+    return result
+
+
+def cached_price_european_mc_cpp(
+    model: GBMModel,
+    option: EuropeanOption,
+    config: FastMCConfig,
+    cache: ResultCache | None = None,
+) -> dict:
+    """``price_european_mc_cpp`` through a cache (see ``cached_price``).
+
+    The C++ default seed (42) is applied when ``config.seed`` is None, so
+    those runs are deterministic and cached too. Instrumented runs bypass
+    the cache.
+    """
+    cache = cache or _default_cache
+    if _measured(config):
+        return price_european_mc_cpp(model, option, config)
+    key = cache_key("cpp", model, option, config)
+    result = cache.get(key)
+    if result is None:
+        result = price_european_mc_cpp(model, option, config)
+        cache.put(key, result)
+    return result
@@ -1,67 +1,961 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import time
+from typing import Callable, Sequence
 import numpy as np
 
-from .models import GBMModel
-from .products import EuropeanOption
+from .analytics import black_scholes_price
+from .instrumentation import NULL_TIMER, StageTimer, make_profile, metrics_registry
+from .models import GBMModel, HestonModel, MultiAssetGBMModel, PathState
+from .products import (
+    AmericanOption,
+    BasketOption,
+    BestOfOption,
+    EuropeanOption,
+    MultiAssetOption,
+    OptionType,
+    PathDependentOption,
+    SpreadOption,
+)
+from .samplers import SobolSampler
+from .stats import ElementwiseMoments, RunningMoments
+from .summaries import PricingSummaries, terminal_range
+
+
+# Supported values for ``MonteCarloConfig.variance_reduction`` /
+# ``FastMCConfig.variance_reduction``.
+VARIANCE_REDUCTION_MODES = ("none", "antithetic", "control_variate")
+
+
+# Supported values for ``MonteCarloConfig.sampler`` / ``FastMCConfig.sampler``.
+SAMPLERS = ("pseudo", "sobol")
+
+
+# Supported values for ``MonteCarloConfig.dtype`` / ``FastMCConfig.dtype``.
+DTYPES = ("float64", "float32")
+
+
+def _check_variance_reduction(mode: str) -> str:
+    if mode not in VARIANCE_REDUCTION_MODES:
+        raise ValueError(
+            f"Unknown variance_reduction {mode!r}; "
+            f"expected one of {VARIANCE_REDUCTION_MODES}"
+        )
+    return mode
+
+
+def _check_sampler(sampler: str, n_randomizations: int) -> str:
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler {sampler!r}; expected one of {SAMPLERS}")
+    if sampler == "sobol" and n_randomizations < 2:
+        raise ValueError("sobol sampler needs n_randomizations >= 2 for error bars")
+    return sampler
+
+
+def _check_n_paths(
+    n_paths: int, sampler: str, n_randomizations: int, variance_reduction: str = "none"
+) -> int:
+    if n_paths < 1:
+        raise ValueError("n_paths must be >= 1")
+    if sampler == "sobol" and n_paths < n_randomizations:
+        # Each scramble needs at least one point
+        raise ValueError("sobol sampler needs n_paths >= n_randomizations")
+    if variance_reduction == "antithetic":
+        # At least one (Z, -Z) pair per stream
+        n_streams = n_randomizations if sampler == "sobol" else 1
+        if n_paths < 2 * n_streams:
+            raise ValueError("antithetic needs n_paths >= 2 per stream (one pair)")
+    return n_paths
+
+
+def _check_dtype(dtype: str, precision_tolerance: float, pilot_paths: int) -> str:
+    if dtype not in DTYPES:
+        raise ValueError(f"Unknown dtype {dtype!r}; expected one of {DTYPES}")
+    if precision_tolerance < 0:
+        raise ValueError("precision_tolerance must be >= 0")
+    if pilot_paths < 1:
+        raise ValueError("pilot_paths must be >= 1")
+    return dtype
+
+
+def _relative_gap(approx: float, exact: float) -> float:
+    """|approx - exact| / |exact|, the pilot-run precision check."""
+    if approx == exact:
+        return 0.0
+    if exact == 0.0:
+        return float("inf")
+    return abs(approx - exact) / abs(exact)
 
 
 @dataclass
 class MonteCarloConfig:
     n_paths: int
-    seed: int | None = None
+    # Anything np.random.default_rng accepts; the process pool passes
+    # SeedSequence children here
+    seed: int | np.random.SeedSequence | None = None
+    # "none", "antithetic" (pairs Z with -Z; n_paths rounded down to even)
+    # or "control_variate" (discounted S_T as control, known mean S0)
+    variance_reduction: str = "none"
+    # "pseudo" (NumPy Generator) or "sobol" (scrambled Sobol, randomised QMC).
+    # With "sobol", n_paths is split across n_randomizations independent
+    # scrambles and std_error comes from the spread of their estimates.
+    sampler: str = "pseudo"
+    n_randomizations: int = 16
+    # Streaming mode: simulate chunk_size paths at a time (O(chunk) memory)
+    # and stop once std_error <= target_std_error or time_budget seconds
+    # have elapsed; n_paths becomes a cap. Enabled when any of the three is
+    # set; chunk_size defaults to DEFAULT_CHUNK_SIZE.
+    chunk_size: int | None = None
+    target_std_error: float | None = None
+    time_budget: float | None = None
+    # "float64" or "float32". float32 draws the normals and computes S_T
+    # and payoffs in single precision (half the memory traffic); moments
+    # are still accumulated in float64. A pilot run first prices the same
+    # pilot_paths normals in both precisions, and the run falls back to
+    # float64 if they differ by more than precision_tolerance (relative).
+    dtype: str = "float64"
+    precision_tolerance: float = 1e-4
+    pilot_paths: int = 10_000
+    # Collect streaming summaries during the pricing pass and return them
+    # as result["summaries"] (a summaries.PricingSummaries): a histogram of
+    # S_T over summary_bins fixed bins, a quantile sketch of the discounted
+    # payoffs and a uniform sample of summary_sample_size of them.
+    summaries: bool = False
+    summary_bins: int = 100
+    summary_sample_size: int = 1000
+    # Time the stages of price() (rng, exp, payoff, reduction, summaries),
+    # return them as result["profile"] and record them in
+    # instrumentation.metrics_registry()
+    instrument: bool = False
+
+    @property
+    def streaming(self) -> bool:
+        return (
+            self.chunk_size is not None
+            or self.target_std_error is not None
+            or self.time_budget is not None
+        )
+
+
+DEFAULT_CHUNK_SIZE = 1 << 18
+
+# Values in one chunk of (paths, n_assets) normals when a multi-asset run
+# sets no chunk_size; the correlated copy and S_T are the same size
+MULTI_ASSET_CHUNK_ELEMENTS = 1 << 22
+
+_MULTI_ASSET_PRODUCTS = (BasketOption, SpreadOption, BestOfOption)
+
+
+def _result_dict(
+    price_estimate: float,
+    std_error: float,
+    crude: RunningMoments,
+    elapsed: float,
+    reduced: bool,
+) -> dict:
+    """Assemble the engine's result dict.
+
+    ``crude`` holds the moments of the individual discounted payoffs; it
+    gives the simulated path count and, when ``reduced`` (variance
+    reduction or QMC is active), the variance-reduction factor.
+    """
+    # 95% confidence interval from CLT
+    z = 1.96
+    ci_lower = price_estimate - z * std_error
+    ci_upper = price_estimate + z * std_error
+
+    # Variance-reduction factor and crude-equivalent throughput
+    crude_var_of_mean = crude.variance / crude.n
+    vr_factor = (
+        crude_var_of_mean / std_error**2 if reduced and std_error > 0 else 1.0
+    )
+    effective_pps = crude.n * vr_factor / elapsed if elapsed > 0 else float("inf")
+
+    return {
+        "price": float(price_estimate),
+        "std_error": float(std_error),
+        "conf_int_95": (float(ci_lower), float(ci_upper)),
+        "variance_reduction_factor": float(vr_factor),
+        "effective_paths_per_sec": float(effective_pps),
+        "n_paths": int(crude.n),
+    }
 
 
 class MonteCarloEngine:
-    """Simple Monte Carlo engine for pricing European options under GBM."""
+    """Simple Monte Carlo engine for pricing options under GBM.
+
+    European options are priced off S_T directly; path-dependent products
+    (Asian, barrier, lookback) off a time-stepped ``PathState``. With a
+    ``MultiAssetGBMModel`` the engine prices basket, spread and best-of
+    options off correlated S_T vectors. With a ``HestonModel`` every
+    product is time-stepped with the QE scheme.
+    """
 
-    def __init__(self, model: GBMModel, config: MonteCarloConfig) -> None:
+    def __init__(
+        self,
+        model: GBMModel | MultiAssetGBMModel | HestonModel,
+        config: MonteCarloConfig,
+    ) -> None:
         self.model = model
         self.cfg = config
         self.rng = np.random.default_rng(config.seed)
+        _check_variance_reduction(config.variance_reduction)
+        _check_sampler(config.sampler, config.n_randomizations)
+        _check_n_paths(
+            config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+        )
+        if config.chunk_size is not None and config.chunk_size < 2:
+            raise ValueError("chunk_size must be >= 2")
+        if config.summary_bins < 1 or config.summary_sample_size < 1:
+            raise ValueError("summary_bins and summary_sample_size must be >= 1")
+        _check_dtype(config.dtype, config.precision_tolerance, config.pilot_paths)
+        if config.dtype == "float32" and (
+            config.sampler != "pseudo" or not isinstance(model, GBMModel)
+        ):
+            raise ValueError("dtype 'float32' supports GBMModel with the pseudo sampler")
+        if config.summaries and not isinstance(model, GBMModel):
+            raise ValueError("summaries support GBMModel only")
+        self._timer = NULL_TIMER
 
-    def price(self, product: EuropeanOption) -> dict:
-        """Price a European option with Monte Carlo.
+    def price(
+        self, product: EuropeanOption | PathDependentOption | MultiAssetOption
+    ) -> dict:
+        """Price an option with Monte Carlo.
         Returns a small dict instead of a custom class so it's easy to
         inspect and serialise:
 
         {
           "price": float,
           "std_error": float,
-          "conf_int_95": (lower, upper)
+          "conf_int_95": (lower, upper),
+          "variance_reduction_factor": float,  # crude var / estimator var
+          "effective_paths_per_sec": float,    # crude-equivalent throughput
+          "n_paths": int                       # paths actually simulated
         }
+
+        In streaming mode the dict also carries ``"stop_reason"``: one of
+        ``"target_std_error"``, ``"time_budget"`` or ``"n_paths"``. With
+        ``dtype="float32"`` it carries ``"dtype"`` (the precision actually
+        used, after the pilot check) and ``"pilot_rel_error"``; with
+        ``summaries=True``, ``"summaries"`` (a ``PricingSummaries``); with
+        ``instrument=True``, ``"profile"`` (see ``mcengine.instrumentation``).
         """
-        T = product.maturity
+        if not self.cfg.instrument:
+            return self._price(product)
+        self._timer = timer = StageTimer()
+        try:
+            result = self._price(product)
+        finally:
+            self._timer = NULL_TIMER
+        result["profile"] = make_profile(
+            "numpy",
+            1,
+            result["n_paths"],
+            time.perf_counter() - timer.started,
+            timer.seconds,
+            timer.bytes_allocated,
+        )
+        metrics_registry().record(result["profile"])
+        return result
+
+    def _price(
+        self, product: EuropeanOption | PathDependentOption | MultiAssetOption
+    ) -> dict:
+        start = time.perf_counter()
+        cfg = self.cfg
+        if isinstance(product, AmericanOption):
+            raise TypeError("American options are priced by mcengine.american.price_american_lsm")
+        if cfg.sampler == "sobol" and not (
+            isinstance(product, EuropeanOption) and isinstance(self.model, GBMModel)
+        ):
+            raise ValueError("sobol sampler only supports European options under GBM")
+        if isinstance(product, _MULTI_ASSET_PRODUCTS) != isinstance(
+            self.model, MultiAssetGBMModel
+        ):
+            raise TypeError(
+                "basket, spread and best-of options need a MultiAssetGBMModel, "
+                "and a MultiAssetGBMModel only prices those"
+            )
+
+        dtype, pilot_error = self._resolve_dtype(product)
+
+        # One normal stream for pseudo-random MC; one per scramble for RQMC
+        streams = self._normal_streams(dtype)
+        n_streams = len(streams)
+        n_per_stream = cfg.n_paths // n_streams
+        if cfg.streaming:
+            chunk = cfg.chunk_size or DEFAULT_CHUNK_SIZE
+            step = max(chunk // n_streams, 2)
+        elif isinstance(self.model, MultiAssetGBMModel):
+            # Keep the (chunk, n_assets) blocks bounded however large n_paths is
+            step = max(MULTI_ASSET_CHUNK_ELEMENTS // self.model.n_assets, 2)
+        else:
+            step = n_per_stream
+        if cfg.variance_reduction == "antithetic" and step < n_per_stream:
+            # Whole pairs per chunk, so no path is dropped mid-run
+            step -= step % 2
 
-        # 1) Simulate terminal prices under the model
-        terminal_prices = self.model.simulate_terminal(
-            T=T,
-            n_paths=self.cfg.n_paths,
-            rng=self.rng,
+        estimators = [RunningMoments.empty() for _ in streams]
+        crude = RunningMoments.empty()
+        summaries = self._empty_summaries(product) if cfg.summaries else None
+        stop_reason = "n_paths"
+        done = 0
+
+        while done < n_per_stream:
+            m = min(step, n_per_stream - done)
+
+            # 1) Simulate a chunk per stream and merge its moments (O(chunk) memory)
+            for i, draw_normals in enumerate(streams):
+                chunk_moments, chunk_crude = self._simulate_chunk(
+                    product, m, draw_normals, summaries
+                )
+                with self._timer.stage("reduction"):
+                    if estimators[i].n == 0:
+                        estimators[i] = chunk_moments
+                    else:
+                        estimators[i].merge(chunk_moments)
+                    crude.merge(chunk_crude)
+            done += m
+
+            # 2-3) Estimator and standard error so far
+            with self._timer.stage("reduction"):
+                price_estimate, std_error = self._combine(estimators)
+
+            if cfg.target_std_error is not None and std_error <= cfg.target_std_error:
+                stop_reason = "target_std_error"
+                break
+            if cfg.time_budget is not None and time.perf_counter() - start >= cfg.time_budget:
+                stop_reason = "time_budget"
+                break
+
+        # 4-5) CI, variance-reduction factor and throughput
+        reduced = cfg.variance_reduction != "none" or cfg.sampler != "pseudo"
+        result = _result_dict(
+            price_estimate, std_error, crude, time.perf_counter() - start, reduced
         )
+        if cfg.streaming:
+            result["stop_reason"] = stop_reason
+        if cfg.dtype == "float32":
+            result["dtype"] = np.dtype(dtype).name
+            result["pilot_rel_error"] = pilot_error
+        if summaries is not None:
+            result["summaries"] = summaries
+        return result
 
-        # 2) Map prices -> payoffs
-        payoffs = product.payoff(terminal_prices)
+    def _empty_summaries(self, product: EuropeanOption | PathDependentOption) -> PricingSummaries:
+        """Summaries sized from the config, with the S_T histogram spanning
+        ``terminal_range`` and a child stream for the reservoir keys."""
+        low, high = terminal_range(self.model, product.maturity)
+        summaries = PricingSummaries.empty(
+            low, high, self.cfg.summary_bins, self.cfg.summary_sample_size
+        )
+        self._summary_rng = self.rng.spawn(1)[0]
+        return summaries
 
-        # 3) Discount each payoff back to today
-        disc_factor = np.exp(-self.model.rate * T)
-        discounted = disc_factor * payoffs  # X_i in the maths
+    def _resolve_dtype(
+        self, product: EuropeanOption | PathDependentOption
+    ) -> tuple[np.dtype, float | None]:
+        """Simulation dtype for ``product`` and the pilot's relative error.
+
+        float64 runs skip the pilot (error None). For float32 the pilot
+        prices ``pilot_paths`` paths twice off the same float64 normals,
+        once cast to float32, from a child stream so the main stream is
+        left untouched.
+        """
+        cfg = self.cfg
+        if cfg.dtype == "float64":
+            return np.dtype(np.float64), None
+
+        n_pilot = min(cfg.pilot_paths, cfg.n_paths)
+        pilot_rng = self.rng.spawn(1)[0]
+        draws: list[np.ndarray] = []
+
+        def draw_and_record(size: int) -> np.ndarray:
+            draws.append(pilot_rng.standard_normal(size))
+            return draws[-1]
+
+        exact, _ = self._discounted_payoffs(product, n_pilot, draw_and_record)
+        replay = iter(draws)
+        approx, _ = self._discounted_payoffs(
+            product, n_pilot, lambda size: next(replay).astype(np.float32)
+        )
+
+        error = _relative_gap(float(approx.mean(dtype=np.float64)), float(exact.mean()))
+        if error > cfg.precision_tolerance:
+            return np.dtype(np.float64), error
+        return np.dtype(np.float32), error
+
+    def _normal_streams(
+        self, dtype: np.dtype | type = np.float64
+    ) -> list[Callable[[int], np.ndarray]]:
+        """Independent sources of N(0, 1) draws, each ``draw(n) -> (n,)``."""
+        if self.cfg.sampler == "sobol":
+            samplers = [
+                SobolSampler(dim=1, rng=self.rng)
+                for _ in range(self.cfg.n_randomizations)
+            ]
+            return [lambda n, s=s: s.normals(n, 1)[:, 0] for s in samplers]
+        return [lambda n: self.rng.standard_normal(n, dtype=dtype)]
+
+    def _combine(self, estimators: list[RunningMoments]) -> tuple[float, float]:
+        """Price and std error from per-stream moments.
+
+        A single pseudo-random stream uses the CLT standard error. For
+        randomised QMC the CLT error over correlated QMC points is not
+        valid, so the price is the mean of the per-scramble estimates and
+        the std error their spread over sqrt(n_randomizations).
+        """
+        if len(estimators) == 1:
+            return self._estimate(estimators[0])
 
-        # 4) Monte Carlo estimator (sample mean)
-        price_estimate = float(discounted.mean())
+        estimates = np.array([self._estimate(e)[0] for e in estimators])
+        std_error = float(estimates.std(ddof=1)) / np.sqrt(len(estimates))
+        return float(estimates.mean()), std_error
 
-        # 5) Estimated standard error via sample variance
-        sample_std = float(discounted.std(ddof=1))
-        std_error = sample_std / np.sqrt(self.cfg.n_paths)
+    def _estimate(self, moments: RunningMoments) -> tuple[float, float]:
+        """Sample-mean estimator and its std error from one stream's moments.
+
+        With the control variate enabled the moments are two-dimensional
+        (discounted payoff, discounted S_T). E[e^{-rT} S_T] = S0 under the
+        risk-neutral measure, so X_i - beta * (C_i - S0) is unbiased for any
+        beta; the variance-minimising beta is estimated from the same paths.
+        Multi-asset products use the mean of the assets' discounted S_T as
+        the control, whose expectation is the mean spot.
+        """
+        if isinstance(self.model, MultiAssetGBMModel):
+            control_mean = float(self.model.spots.mean())
+        else:
+            control_mean = self.model.spot
+
+        mean = moments.mean
+        cov = moments.covariance
+        price_estimate = float(mean[0])
+        variance = float(cov[0, 0])
+
+        if moments.dim == 2 and cov[1, 1] > 0:
+            beta = cov[0, 1] / cov[1, 1]
+            price_estimate = float(mean[0] - beta * (mean[1] - control_mean))
+            variance = float(cov[0, 0] - cov[0, 1] ** 2 / cov[1, 1])
+
+        std_error = np.sqrt(max(variance, 0.0) / moments.n) if moments.n > 1 else float("inf")
+        return price_estimate, float(std_error)
+
+    def _simulate_chunk(
+        self,
+        product: EuropeanOption,
+        n_paths: int,
+        draw_normals: Callable[[int], np.ndarray],
+        summaries: PricingSummaries | None = None,
+    ) -> tuple[RunningMoments, RunningMoments]:
+        """Simulate ``n_paths`` paths and return their moments.
+
+        Returns ``(estimator, crude)``. ``estimator`` holds the moments of
+        the i.i.d. samples the estimator averages over: discounted payoffs,
+        antithetic pair means, or (payoff, control) pairs for the control
+        variate. ``crude`` holds the moments of the individual discounted
+        payoffs, used for the variance-reduction factor. Every simulated
+        path is also added to ``summaries`` when given.
+        """
+        samples, discounted, control = self._estimator_samples(product, n_paths, draw_normals)
+        self._summarise(summaries, product, discounted, control)
+
+        with self._timer.stage("reduction"):
+            if self.cfg.variance_reduction == "antithetic":
+                n_pairs = samples.shape[0]
+                crude = RunningMoments.from_samples(discounted[:n_pairs]).merge(
+                    RunningMoments.from_samples(discounted[n_pairs:])
+                )
+                return RunningMoments.from_samples(samples), crude
+
+            crude = RunningMoments.from_samples(discounted)
+            if self.cfg.variance_reduction == "control_variate":
+                return RunningMoments.from_samples(samples), crude
+            return crude, crude
+
+    def _estimator_samples(
+        self,
+        product: EuropeanOption | PathDependentOption | MultiAssetOption,
+        n_paths: int,
+        draw_normals: Callable[[int], np.ndarray],
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Simulate ``n_paths`` paths and return ``(samples, discounted,
+        control)``: the i.i.d. samples the estimator averages over
+        (discounted payoffs, antithetic pair means, or (payoff, control)
+        rows for the control variate), plus the discounted payoff and
+        control of every simulated path.
+        """
+        mode = self.cfg.variance_reduction
+        if mode == "antithetic":
+            n_pairs = n_paths // 2
+            discounted, control = self._discounted_payoffs(
+                product, n_pairs, draw_normals, antithetic=True
+            )
+            return 0.5 * (discounted[:n_pairs] + discounted[n_pairs:]), discounted, control
+
+        discounted, control = self._discounted_payoffs(product, n_paths, draw_normals)
+        if mode == "control_variate":
+            return np.column_stack([discounted, control]), discounted, control
+        return discounted, discounted, control
+
+    def _summarise(
+        self,
+        summaries: PricingSummaries | None,
+        product: EuropeanOption | PathDependentOption,
+        discounted: np.ndarray,
+        control: np.ndarray,
+    ) -> None:
+        if summaries is None:
+            return
+        with self._timer.stage("summaries"):
+            # The control is the discounted S_T
+            terminal = control / np.exp(-self.model.rate * product.maturity)
+            summaries.add(terminal, discounted, self._summary_rng)
+
+    def _discounted_payoffs(
+        self,
+        product: EuropeanOption | PathDependentOption | MultiAssetOption,
+        n_paths: int,
+        draw_normals: Callable[[int], np.ndarray],
+        antithetic: bool = False,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Discounted payoffs and discounted S_T (the control) per path.
+
+        With ``antithetic=True`` each draw Z is followed by -Z, so the
+        returned arrays have 2 * n_paths entries: the first half from Z,
+        the second from -Z.
+        """
+        T = product.maturity
+        # A Python float keeps float32 payoffs in float32
+        disc_factor = float(np.exp(-self.model.rate * T))
+        timer = self._timer
+
+        def draw(size: int | tuple[int, int] = n_paths) -> np.ndarray:
+            with timer.stage("rng"):
+                Z = draw_normals(size)
+                Z = np.concatenate([Z, -Z]) if antithetic else Z
+            timer.count(Z)
+            return Z
+
+        if isinstance(product, _MULTI_ASSET_PRODUCTS):
+            # One (n_paths, n_assets) block of independent normals, correlated
+            # inside terminal_from_normals by a single matrix multiply
+            Z = draw((n_paths, self.model.n_assets))
+            with timer.stage("exp"):
+                terminal_prices = self.model.terminal_from_normals(T, Z)
+            with timer.stage("payoff"):
+                discounted = disc_factor * product.payoff(terminal_prices)
+                control = disc_factor * terminal_prices.mean(axis=1)
+            timer.count(terminal_prices, discounted, control)
+            return discounted, control
+
+        # "exp" is the S_T / path evolution; the draws inside it are
+        # charged to "rng"
+        if isinstance(self.model, HestonModel):
+            # Two normals per step (variance, log-price); European products
+            # are stepped over the model's own grid
+            european = isinstance(product, EuropeanOption)
+            n_steps = self.model.n_steps if european else product.n_steps
+            with timer.stage("exp"):
+                state = self.model.path_state_from_normals(
+                    T, n_steps, (draw((n_paths, 2)) for _ in range(n_steps))
+                )
+            terminal_prices = state.terminal
+            timer.count(state.average, state.minimum, state.maximum)
+            with timer.stage("payoff"):
+                payoffs = (
+                    product.payoff(terminal_prices)
+                    if european
+                    else product.payoff_from_state(state)
+                )
+        elif isinstance(product, EuropeanOption):
+            Z = draw()
+            with timer.stage("exp"):
+                terminal_prices = self.model.terminal_from_normals(T, Z)
+            with timer.stage("payoff"):
+                payoffs = product.payoff(terminal_prices)
+        else:
+            with timer.stage("exp"):
+                state = self.model.path_state_from_normals(
+                    T, product.n_steps, (draw() for _ in range(product.n_steps))
+                )
+            terminal_prices = state.terminal
+            timer.count(state.average, state.minimum, state.maximum)
+            with timer.stage("payoff"):
+                payoffs = product.payoff_from_state(state)
+
+        with timer.stage("payoff"):
+            discounted, control = disc_factor * payoffs, disc_factor * terminal_prices
+        timer.count(terminal_prices, payoffs, discounted, control)
+        return discounted, control
+
+    def convergence_profile(
+        self,
+        product: EuropeanOption | PathDependentOption | MultiAssetOption,
+        n_points: int = 20,
+        min_paths: int = 1_000,
+    ) -> dict:
+        """Price, std error and CI at log-spaced prefixes of one simulation.
+
+        Simulates ``n_paths`` paths once, ``chunk_size`` at a time (default
+        ``DEFAULT_CHUNK_SIZE``). Running sums of the estimator samples
+        and their outer products (shifted by the first chunk's mean, so
+        they do not cancel) give the moments of every prefix. The estimate at
+        each of ``n_points`` sizes from ``min_paths`` to ``n_paths`` is
+        the one ``price`` would report after that many paths, control
+        variate included. This replaces one ``price`` call per path count.
+        For European options the last point matches ``price`` with the
+        same seed.
+
+        Supports the pseudo sampler with every variance-reduction mode.
+        Returns arrays with one entry per prefix:
+
+        {
+          "n_paths": np.ndarray,           # paths simulated up to the prefix
+          "price": np.ndarray,
+          "std_error": np.ndarray,
+          "conf_int_95": (lower, upper),   # both np.ndarray
+          "reference": float | None,       # Black-Scholes, European under GBM
+          "abs_error": np.ndarray | None,  # |price - reference|
+          "elapsed": float                 # seconds
+        }
+        """
+        start = time.perf_counter()
+        cfg = self.cfg
+        if cfg.sampler != "pseudo":
+            raise ValueError("convergence_profile supports the pseudo sampler only")
+        if isinstance(product, AmericanOption):
+            raise TypeError("American options are priced by mcengine.american.price_american_lsm")
+        if isinstance(product, _MULTI_ASSET_PRODUCTS) != isinstance(
+            self.model, MultiAssetGBMModel
+        ):
+            raise TypeError(
+                "basket, spread and best-of options need a MultiAssetGBMModel, "
+                "and a MultiAssetGBMModel only prices those"
+            )
+        if n_points < 1 or min_paths < 2:
+            raise ValueError("n_points must be >= 1 and min_paths >= 2")
+
+        # Prefixes are counted in estimator samples (pairs for antithetic)
+        per_sample = 2 if cfg.variance_reduction == "antithetic" else 1
+        n_samples = cfg.n_paths // per_sample
+        if n_samples < 2:
+            raise ValueError("n_paths too small for a convergence profile")
+        first = min(max(min_paths // per_sample, 2), n_samples)
+        prefixes = np.unique(np.geomspace(first, n_samples, n_points).round().astype(np.int64))
+
+        dtype, _ = self._resolve_dtype(product)
+        draw_normals = self._normal_streams(dtype)[0]
+        step = max((cfg.chunk_size or DEFAULT_CHUNK_SIZE) // per_sample, 2)
+
+        shift = total = total_outer = None
+        price = np.empty(prefixes.size)
+        std_error = np.empty(prefixes.size)
+        done = 0
+        while done < n_samples:
+            m = min(step, n_samples - done)
+            samples, _, _ = self._estimator_samples(product, m * per_sample, draw_normals)
+            y = np.asarray(samples, dtype=np.float64).reshape(m, -1)
+            if shift is None:
+                shift = y.mean(axis=0)
+                total = np.zeros_like(shift)
+                total_outer = np.zeros((shift.size, shift.size))
+            y = y - shift
+
+            # Prefixes that end inside this chunk
+            hits = np.flatnonzero((prefixes > done) & (prefixes <= done + m))
+            if hits.size:
+                rows = prefixes[hits] - done - 1
+                sums = np.cumsum(y, axis=0)[rows] + total
+                outer = np.cumsum(y[:, :, None] * y[:, None, :], axis=0)[rows] + total_outer
+                for k, n, s, o in zip(hits, prefixes[hits], sums, outer):
+                    mean = s / n
+                    moments = RunningMoments(
+                        n=int(n), mean=shift + mean, m2=o - n * np.outer(mean, mean)
+                    )
+                    price[k], std_error[k] = self._estimate(moments)
+
+            total += y.sum(axis=0)
+            total_outer += y.T @ y
+            done += m
+
+        reference = None
+        abs_error = None
+        if isinstance(product, EuropeanOption) and isinstance(self.model, GBMModel):
+            reference = float(black_scholes_price(self.model, product))
+            abs_error = np.abs(price - reference)
 
-        # 6) 95% confidence interval from CLT
         z = 1.96
-        ci_lower = price_estimate - z * std_error
-        ci_upper = price_estimate + z * std_error
+        return {
+            "n_paths": prefixes * per_sample,
+            "price": price,
+            "std_error": std_error,
+            "conf_int_95": (price - z * std_error, price + z * std_error),
+            "reference": reference,
+            "abs_error": abs_error,
+            "elapsed": time.perf_counter() - start,
+        }
+
+    def price_ladder(
+        self,
+        product: EuropeanOption | PathDependentOption,
+        spot_bumps: Sequence[float],
+        vol_bumps: Sequence[float],
+    ) -> dict:
+        """Price ``product`` on a grid of spot and vol bumps in one pass.
+
+        Cell (i, j) uses spot ``S0 * (1 + spot_bumps[i])`` and vol
+        ``sigma + vol_bumps[j]``. Under GBM a spot bump only rescales the
+        path and a vol bump reuses the same Z. So normals are drawn once
+        per chunk, each vol gets one unit-spot simulation, and every spot
+        is evaluated as a broadcast (n_spot, chunk) array. All cells share
+        the normals (common random numbers), so differences between cells
+        carry little noise. A European cell equals ``price`` on the bumped
+        model with the same seed.
+
+        Honours ``n_paths``, ``seed``, ``chunk_size`` (cell values held at
+        once, default ``DEFAULT_CHUNK_SIZE``) and antithetic variates
+        (``n_paths`` rounded down to even, as in ``price``).
+        Returns arrays of shape (len(spot_bumps), len(vol_bumps)):
+
+        {
+          "spot": np.ndarray,             # bumped spots, (n_spot,)
+          "vol": np.ndarray,              # bumped vols, (n_vol,)
+          "price": np.ndarray,
+          "std_error": np.ndarray,
+          "conf_int_95": (lower, upper),  # both np.ndarray
+          "n_paths": int
+        }
+        """
+        cfg = self.cfg
+        if not isinstance(self.model, GBMModel) or isinstance(product, _MULTI_ASSET_PRODUCTS):
+            raise TypeError("price_ladder supports single-asset products under GBMModel only")
+        if cfg.sampler != "pseudo" or cfg.variance_reduction == "control_variate":
+            raise ValueError(
+                "price_ladder supports the pseudo sampler with "
+                "variance_reduction 'none' or 'antithetic'"
+            )
+        spots = float(self.model.spot) * (1.0 + np.asarray(spot_bumps, dtype=float))
+        vols = float(self.model.vol) + np.asarray(vol_bumps, dtype=float)
+        if spots.ndim != 1 or vols.ndim != 1 or spots.size == 0 or vols.size == 0:
+            raise ValueError("spot_bumps and vol_bumps must be non-empty 1-D sequences")
+        if (spots <= 0).any() or (vols < 0).any():
+            raise ValueError("bumped spots must be > 0 and bumped vols >= 0")
+
+        T = product.maturity
+        disc_factor = float(np.exp(-self.model.rate * T))
+        european = isinstance(product, EuropeanOption)
+        unit_models = [GBMModel(spot=1.0, rate=self.model.rate, vol=float(v)) for v in vols]
+        antithetic = cfg.variance_reduction == "antithetic"
+        # Paths per chunk, so the (n_spot, chunk) payoff block stays bounded;
+        # whole antithetic pairs, so only an odd n_paths loses a path
+        step = max(2, (cfg.chunk_size or DEFAULT_CHUNK_SIZE) // spots.size)
+        if antithetic:
+            step -= step % 2
+        moments = [ElementwiseMoments.empty(spots.shape) for _ in vols]
+        done = simulated = 0
+
+        while done < cfg.n_paths:
+            m = min(step, cfg.n_paths - done)
+            n_draw = m // 2 if antithetic else m
+            shape = n_draw if european else (product.n_steps, n_draw)
+            Z = self.rng.standard_normal(shape)
+            if antithetic:
+                Z = np.concatenate([Z, -Z], axis=-1)
+
+            for unit, cell_moments in zip(unit_models, moments):
+                if european:
+                    # Same expression as terminal_from_normals, scaled per spot
+                    growth = unit.terminal_from_normals(T, Z)
+                    payoffs = product.payoff(spots[:, None] * growth)
+                else:
+                    state = unit.path_state_from_normals(T, product.n_steps, iter(Z))
+                    payoffs = product.payoff_from_state(PathState(
+                        terminal=spots[:, None] * state.terminal,
+                        average=spots[:, None] * state.average,
+                        minimum=spots[:, None] * state.minimum,
+                        maximum=spots[:, None] * state.maximum,
+                    ))
+                discounted = disc_factor * payoffs
+                if antithetic:
+                    discounted = 0.5 * (discounted[:, :n_draw] + discounted[:, n_draw:])
+                cell_moments.merge(ElementwiseMoments.from_samples(discounted))
+            done += m
+            simulated += Z.shape[-1]
+
+        prices = np.stack([cell.mean for cell in moments], axis=1)
+        std_errors = np.stack(
+            [np.sqrt(cell.variance / cell.n) for cell in moments], axis=1
+        )
+        z = 1.96
+        return {
+            "spot": spots,
+            "vol": vols,
+            "price": prices,
+            "std_error": std_errors,
+            "conf_int_95": (prices - z * std_errors, prices + z * std_errors),
+            "n_paths": simulated,
+        }
+
+    def price_with_greeks(self, product: EuropeanOption) -> dict:
+        """Price a European option and its delta, gamma and vega in one pass.
+
+        All estimators reuse the same normals, so there is no bump-and-
+        reprice noise:
+
+        - delta, vega: pathwise derivatives of the discounted payoff,
+        - gamma: pathwise delta times the likelihood-ratio score
+          (Z / (sigma sqrt(T)) - 1) / S0, which stays unbiased for the kinked
+          vanilla payoff where a pure pathwise gamma would be zero.
+
+        Honours ``n_paths``, ``seed``, ``chunk_size`` and antithetic
+        variates. Returns the ``price`` keys plus ``delta``, ``gamma`` and
+        ``vega``, each with a matching ``*_std_error``.
+        """
+        cfg = self.cfg
+        if not isinstance(product, EuropeanOption) or not isinstance(self.model, GBMModel):
+            raise TypeError("price_with_greeks supports EuropeanOption under GBMModel only")
+        if cfg.sampler != "pseudo" or cfg.variance_reduction == "control_variate":
+            raise ValueError(
+                "price_with_greeks supports the pseudo sampler with "
+                "variance_reduction 'none' or 'antithetic'"
+            )
+
+        antithetic = cfg.variance_reduction == "antithetic"
+        step = cfg.chunk_size or cfg.n_paths
+        if antithetic and cfg.chunk_size:
+            # Whole pairs per chunk, so only an odd n_paths loses a path
+            step -= step % 2
+        moments = RunningMoments.empty(4)
+        done = 0
+
+        while done < cfg.n_paths:
+            m = min(step, cfg.n_paths - done)
+            if antithetic:
+                Z = self.rng.standard_normal(m // 2)
+                samples = self._greek_samples(product, np.concatenate([Z, -Z]))
+                samples = 0.5 * (samples[: Z.shape[0]] + samples[Z.shape[0]:])
+            else:
+                samples = self._greek_samples(product, self.rng.standard_normal(m))
+            moments.merge(RunningMoments.from_samples(samples))
+            done += m
+
+        std_errors = np.sqrt(np.diag(moments.covariance) / moments.n)
+        price_estimate, delta, gamma, vega = (float(v) for v in moments.mean)
 
+        z = 1.96
         return {
             "price": price_estimate,
-            "std_error": float(std_error),
-            "conf_int_95": (float(ci_lower), float(ci_upper)),
+            "std_error": float(std_errors[0]),
+            "conf_int_95": (
+                price_estimate - z * float(std_errors[0]),
+                price_estimate + z * float(std_errors[0]),
+            ),
+            "delta": delta,
+            "delta_std_error": float(std_errors[1]),
+            "gamma": gamma,
+            "gamma_std_error": float(std_errors[2]),
+            "vega": vega,
+            "vega_std_error": float(std_errors[3]),
+        }
+
+    def _greek_samples(self, product: EuropeanOption, Z: np.ndarray) -> np.ndarray:
+        """Per-path (discounted payoff, delta, gamma, vega), shape (n, 4)."""
+        T = product.maturity
+        S0, sigma = self.model.spot, self.model.vol
+        sqrt_T = np.sqrt(T)
+        disc_factor = np.exp(-self.model.rate * T)
+
+        terminal_prices = self.model.terminal_from_normals(T, Z)
+        discounted = disc_factor * product.payoff(terminal_prices)
+
+        # d(discounted payoff)/d(S_T) * S_T, i.e. e^{-rT} * (+/-1{ITM}) * S_T
+        if product.option_type == OptionType.CALL:
+            pathwise = disc_factor * terminal_prices * (terminal_prices > product.strike)
+        else:
+            pathwise = -disc_factor * terminal_prices * (terminal_prices < product.strike)
+
+        delta = pathwise / S0
+        vega = pathwise * (sqrt_T * Z - sigma * T)
+        gamma = delta * (Z / (sigma * sqrt_T) - 1.0) / S0
+        return np.column_stack([discounted, delta, gamma, vega])
+
+    def price_batch(self, products: Sequence[EuropeanOption]) -> dict:
+        """Price a book of European options off one shared simulation.
+
+        The normals are drawn once for the whole batch, ``chunk_size``
+        paths at a time (default ``DEFAULT_CHUNK_SIZE``). Products are
+        grouped by maturity, so S_T is computed once per maturity and chunk
+        and reused across every strike in that group.
+
+        Honours ``n_paths``, ``seed`` and ``chunk_size``; other settings
+        (variance reduction, Sobol, float32, summaries, a stopping rule,
+        instrumentation) raise ValueError rather than being ignored.
+
+        Returns columnar arrays aligned with ``products``:
+
+        {
+          "price": np.ndarray,
+          "std_error": np.ndarray,
+          "conf_int_95": (lower, upper)   # both np.ndarray
+        }
+        """
+        cfg = self.cfg
+        if not isinstance(self.model, GBMModel):
+            raise TypeError("price_batch supports GBMModel only")
+        if (
+            cfg.variance_reduction != "none"
+            or cfg.sampler != "pseudo"
+            or cfg.dtype != "float64"
+            or cfg.summaries
+            or cfg.target_std_error is not None
+            or cfg.time_budget is not None
+            or cfg.instrument
+        ):
+            raise ValueError(
+                "price_batch supports crude float64 pseudo-random MC only "
+                "(n_paths, seed and chunk_size)"
+            )
+
+        n_products = len(products)
+        prices = np.empty(n_products)
+        std_errors = np.empty(n_products)
+
+        if n_products == 0:
+            return {
+                "price": prices,
+                "std_error": std_errors,
+                "conf_int_95": (prices.copy(), prices.copy()),
+            }
+
+        # Group product indices by maturity
+        groups: dict[float, list[int]] = {}
+        for idx, product in enumerate(products):
+            groups.setdefault(float(product.maturity), []).append(idx)
+
+        moments = [ElementwiseMoments.empty(()) for _ in products]
+        step = cfg.chunk_size or DEFAULT_CHUNK_SIZE
+        for begin in range(0, cfg.n_paths, step):
+            # 1) One chunk of normals for the whole book
+            Z = self.rng.standard_normal(min(step, cfg.n_paths - begin))
+
+            for T, indices in groups.items():
+                # 2) One terminal-price array per maturity
+                terminal_prices = self.model.terminal_from_normals(T, Z)
+                disc_factor = np.exp(-self.model.rate * T)
+
+                # 3) Only the payoff and reduction are repeated per strike
+                for idx in indices:
+                    discounted = disc_factor * products[idx].payoff(terminal_prices)
+                    moments[idx].merge(ElementwiseMoments.from_samples(discounted))
+
+        for idx, product_moments in enumerate(moments):
+            prices[idx] = product_moments.mean
+            std_errors[idx] = np.sqrt(product_moments.variance / product_moments.n)
+
+        z = 1.96
+        return {
+            "price": prices,
+            "std_error": std_errors,
+            "conf_int_95": (prices - z * std_errors, prices + z * std_errors),
         }
@@ -1,9 +1,36 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import time
+from typing import Any, Mapping, Sequence
 
-from .models import GBMModel
-from .products import EuropeanOption, OptionType
+import numpy as np
+
+from .american import _check_inputs as _check_american_inputs
+from .engine import (
+    _check_dtype,
+    _check_n_paths,
+    _check_sampler,
+    _check_variance_reduction,
+    _relative_gap,
+)
+from .instrumentation import make_profile, metrics_registry
+from .models import GBMModel, HestonModel, MultiAssetGBMModel
+from .products import (
+    AmericanOption,
+    AsianOption,
+    BarrierOption,
+    BarrierType,
+    BasketOption,
+    BestOfOption,
+    EuropeanOption,
+    LookbackOption,
+    MultiAssetOption,
+    OptionType,
+    PathDependentOption,
+    SpreadOption,
+)
+from .summaries import Histogram, PricingSummaries, QuantileSketch, Reservoir, terminal_range
 
 try:
     # Compiled C++ extension built by `python setup.py build_ext --inplace`
@@ -16,6 +43,41 @@ except ImportError:
 class FastMCConfig:
     n_paths: int
     seed: int | None = None
+    # None -> run on the calling thread. Any int -> spread the fixed,
+    # independently seeded blocks over that many threads (0 = all hardware
+    # threads). The result depends only on (seed, n_paths), never on the
+    # thread count.
+    n_threads: int | None = None
+    # Same modes as MonteCarloConfig.variance_reduction
+    variance_reduction: str = "none"
+    # Same meaning as MonteCarloConfig.sampler / n_randomizations. With
+    # "sobol" the scrambles are spread over n_threads (None -> 1).
+    sampler: str = "pseudo"
+    n_randomizations: int = 16
+    # Same meaning as MonteCarloConfig.dtype / precision_tolerance /
+    # pilot_paths; honoured by price_european_mc_cpp (pseudo sampler). The
+    # pilot reruns the first pilot_paths paths of the same stream in both
+    # precisions.
+    dtype: str = "float64"
+    precision_tolerance: float = 1e-4
+    pilot_paths: int = 10_000
+    # Same meaning as MonteCarloConfig.summaries / summary_bins /
+    # summary_sample_size; honoured by price_european_mc_cpp (pseudo
+    # sampler), collected per block inside the kernel.
+    summaries: bool = False
+    summary_bins: int = 100
+    summary_sample_size: int = 1000
+    # Same meaning as MonteCarloConfig.instrument; honoured by
+    # price_european_mc_cpp (pseudo sampler, no summaries), which then
+    # calls the timed kernel mc_price_european_instrumented.
+    instrument: bool = False
+
+
+# Integer codes understood by _mc_core (VarianceReduction enum in mc_core.hpp)
+_VR_CODES = {"none": 0, "antithetic": 1, "control_variate": 2}
+
+# Precision enum in mc_core.hpp
+_PRECISION_CODES = {"float64": 0, "float32": 1}
 
 
 def price_european_mc_cpp(
@@ -30,8 +92,17 @@ def price_european_mc_cpp(
         {
           "price": float,
           "std_error": float,
-          "conf_int_95": (lower, upper)
+          "conf_int_95": (lower, upper),
+          "variance_reduction_factor": float,
+          "effective_paths_per_sec": float,
+          "n_paths": int
         }
+
+    With ``dtype="float32"`` the dict also carries ``"dtype"`` and
+    ``"pilot_rel_error"``, with ``summaries=True`` a ``"summaries"``
+    ``PricingSummaries`` and with ``instrument=True`` a ``"profile"``, as
+    in ``MonteCarloEngine.price``. The profile's stages come from the
+    kernel and are summed over its threads.
     """
     if _mc_core is None:
         raise RuntimeError(
@@ -44,9 +115,25 @@ def price_european_mc_cpp(
         seed = int(config.seed)
 
     is_call = option.option_type == OptionType.CALL
+    vr_code = _VR_CODES[_check_variance_reduction(config.variance_reduction)]
+    _check_sampler(config.sampler, config.n_randomizations)
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+    _check_dtype(config.dtype, config.precision_tolerance, config.pilot_paths)
+    if config.dtype == "float32" and config.sampler != "pseudo":
+        raise ValueError("dtype 'float32' supports the pseudo sampler only")
+    if config.summaries and config.sampler != "pseudo":
+        raise ValueError("summaries support the pseudo sampler only")
+    if config.summary_bins < 1 or config.summary_sample_size < 1:
+        raise ValueError("summary_bins and summary_sample_size must be >= 1")
+    if config.instrument and (config.sampler != "pseudo" or config.summaries):
+        raise ValueError("instrument supports the pseudo sampler without summaries")
 
-    # Call into C++ via pybind11
-    raw = _mc_core.mc_price_european(
+    # Call into C++ via pybind11 (the GIL is released for the kernel)
+    kwargs = dict(
         S0=float(model.spot),
         K=float(option.strike),
         r=float(model.rate),
@@ -55,10 +142,493 @@ def price_european_mc_cpp(
         n_paths=int(config.n_paths),
         seed=int(seed),
         is_call=bool(is_call),
+        variance_reduction=vr_code,
+    )
+    start = time.perf_counter()
+    if config.sampler == "sobol":
+        raw = _mc_core.mc_price_european_rqmc(
+            n_randomizations=int(config.n_randomizations),
+            n_threads=1 if config.n_threads is None else int(config.n_threads),
+            **kwargs,
+        )
+    else:
+        if config.n_threads is not None or config.summaries or config.instrument:
+            # The summarised and instrumented kernels run the block-parallel
+            # streams on an explicit thread count, so the pilot does too
+            kwargs["n_threads"] = 1 if config.n_threads is None else int(config.n_threads)
+            kernel = _mc_core.mc_price_european_parallel
+        else:
+            kernel = _mc_core.mc_price_european
+
+        precision = _PRECISION_CODES[config.dtype]
+        pilot_error = None
+        if config.dtype == "float32":
+            # Same seed, streams and thread count as the main run, hence the
+            # same normals: the gap is pure rounding
+            pilot = dict(kwargs, n_paths=min(config.pilot_paths, config.n_paths))
+            pilot_error = _relative_gap(
+                kernel(**pilot, precision=1)["price"],
+                kernel(**pilot, precision=0)["price"],
+            )
+            if pilot_error > config.precision_tolerance:
+                precision = 0
+        if config.summaries:
+            low, high = terminal_range(model, option.maturity)
+            sketch = QuantileSketch()
+            raw = _mc_core.mc_price_european_summarised(
+                low=low,
+                high=high,
+                n_bins=int(config.summary_bins),
+                relative_accuracy=sketch.relative_accuracy,
+                max_buckets=sketch.max_buckets,
+                sample_size=int(config.summary_sample_size),
+                precision=precision,
+                **kwargs,
+            )
+        elif config.instrument:
+            raw = _mc_core.mc_price_european_instrumented(**kwargs, precision=precision)
+        else:
+            raw = kernel(**kwargs, precision=precision)
+
+    elapsed = time.perf_counter() - start
+
+    result = _result_dict(raw, config.n_paths, elapsed)
+    if config.dtype == "float32":
+        result["dtype"] = "float32" if precision == 1 else "float64"
+        result["pilot_rel_error"] = pilot_error
+    if config.summaries:
+        result["summaries"] = _summaries_from_raw(raw, low, high, config.summary_sample_size)
+    if config.instrument:
+        result["profile"] = make_profile(
+            "cpp",
+            raw["n_threads"],
+            result["n_paths"],
+            elapsed,
+            raw["stages"],
+            raw["bytes_allocated"],
+        )
+        metrics_registry().record(result["profile"])
+    return result
+
+
+def _summaries_from_raw(
+    raw: dict, low: float, high: float, sample_size: int
+) -> PricingSummaries:
+    """Load the kernel's summary arrays into a ``PricingSummaries``."""
+    return PricingSummaries(
+        terminal_histogram=Histogram(
+            low=low,
+            high=high,
+            counts=np.asarray(raw["histogram"], dtype=np.int64),
+            underflow=int(raw["underflow"]),
+            overflow=int(raw["overflow"]),
+        ),
+        payoff_sketch=QuantileSketch(
+            zero_count=int(raw["zero_count"]),
+            offset=int(raw["bucket_offset"]),
+            counts=np.asarray(raw["buckets"], dtype=np.int64),
+        ),
+        payoff_sample=Reservoir(
+            size=int(sample_size),
+            keys=np.asarray(raw["sample_keys"], dtype=float),
+            values=np.asarray(raw["sample_values"], dtype=float),
+        ),
+    )
+
+
+def price_european_greeks_mc_cpp(
+    model: GBMModel,
+    option: EuropeanOption,
+    config: FastMCConfig,
+) -> dict:
+    """
+    Price a European option and its delta, gamma and vega in one C++ pass.
+
+    Delta and vega are pathwise; gamma is the pathwise delta times the
+    likelihood-ratio score. Supports ``variance_reduction`` "none" or
+    "antithetic" and runs on the block-parallel streams (``n_threads=None``
+    means one thread). Returns the same keys as
+    ``MonteCarloEngine.price_with_greeks``.
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    seed = 42 if config.seed is None else int(config.seed)
+    _check_variance_reduction(config.variance_reduction)
+    if config.sampler != "pseudo" or config.variance_reduction == "control_variate":
+        raise ValueError(
+            "price_european_greeks_mc_cpp supports the pseudo sampler with "
+            "variance_reduction 'none' or 'antithetic'"
+        )
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+
+    raw = _mc_core.mc_price_european_greeks(
+        S0=float(model.spot),
+        K=float(option.strike),
+        r=float(model.rate),
+        sigma=float(model.vol),
+        T=float(option.maturity),
+        n_paths=int(config.n_paths),
+        seed=seed,
+        is_call=option.option_type == OptionType.CALL,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+        antithetic=config.variance_reduction == "antithetic",
+    )
+
+    result = {key: float(value) for key, value in raw.items()}
+    z = 1.96
+    result["conf_int_95"] = (
+        result["price"] - z * result["std_error"],
+        result["price"] + z * result["std_error"],
+    )
+    return result
+
+
+def price_european_ladder_mc_cpp(
+    model: GBMModel,
+    option: EuropeanOption,
+    spot_bumps: Sequence[float],
+    vol_bumps: Sequence[float],
+    config: FastMCConfig,
+) -> dict:
+    """
+    Price a European option on a grid of spot and vol bumps in one C++ pass.
+
+    Cell (i, j) uses spot ``S0 * (1 + spot_bumps[i])`` and vol
+    ``sigma + vol_bumps[j]``; every cell reuses the same normals. Supports
+    ``variance_reduction`` "none" or "antithetic" and runs on the
+    block-parallel streams (``n_threads=None`` means one thread). Returns
+    the same keys as ``MonteCarloEngine.price_ladder``, with arrays of
+    shape (len(spot_bumps), len(vol_bumps)).
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    seed = 42 if config.seed is None else int(config.seed)
+    vr_code = _VR_CODES[_check_variance_reduction(config.variance_reduction)]
+    if config.sampler != "pseudo" or config.variance_reduction == "control_variate":
+        raise ValueError(
+            "price_european_ladder_mc_cpp supports the pseudo sampler with "
+            "variance_reduction 'none' or 'antithetic'"
+        )
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+    spot_bumps = np.asarray(spot_bumps, dtype=float)
+    vol_bumps = np.asarray(vol_bumps, dtype=float)
+    if spot_bumps.ndim != 1 or vol_bumps.ndim != 1 or spot_bumps.size == 0 or vol_bumps.size == 0:
+        raise ValueError("spot_bumps and vol_bumps must be non-empty 1-D sequences")
+    spots = float(model.spot) * (1.0 + spot_bumps)
+    vols = float(model.vol) + vol_bumps
+    if (spots <= 0).any() or (vols < 0).any():
+        raise ValueError("bumped spots must be > 0 and bumped vols >= 0")
+
+    raw = _mc_core.mc_price_european_ladder(
+        S0=float(model.spot),
+        K=float(option.strike),
+        r=float(model.rate),
+        sigma=float(model.vol),
+        T=float(option.maturity),
+        spot_bumps=spot_bumps.tolist(),
+        vol_bumps=vol_bumps.tolist(),
+        n_paths=int(config.n_paths),
+        seed=seed,
+        is_call=option.option_type == OptionType.CALL,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+        variance_reduction=vr_code,
+    )
+
+    shape = (spots.size, vols.size)
+    price = np.asarray(raw["price"], dtype=float).reshape(shape)
+    std_error = np.asarray(raw["std_error"], dtype=float).reshape(shape)
+    n_paths = int(config.n_paths)
+    if config.variance_reduction == "antithetic":
+        n_paths -= n_paths % 2
+
+    z = 1.96
+    return {
+        "spot": spots,
+        "vol": vols,
+        "price": price,
+        "std_error": std_error,
+        "conf_int_95": (price - z * std_error, price + z * std_error),
+        "n_paths": n_paths,
+    }
+
+
+def price_american_mc_cpp(
+    model: GBMModel,
+    option: AmericanOption,
+    config: FastMCConfig,
+    basis_degree: int = 3,
+) -> dict:
+    """
+    Longstaff-Schwartz price of an American option with the C++
+    backward-induction kernel (``cpp/mc_american.cpp``).
+
+    Same algorithm as ``price_american_lsm`` (backward Brownian bridge,
+    Laguerre basis of S / K of degree ``basis_degree``, regression on
+    in-the-money paths), on the block-parallel streams (``n_threads=None``
+    means one thread). Only ``variance_reduction="none"`` with the pseudo
+    sampler is supported. Returns the same keys as ``price_american_lsm``.
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    _check_american_inputs(model, option, config.n_paths, basis_degree)
+    seed = 42 if config.seed is None else int(config.seed)
+    if config.sampler != "pseudo" or config.variance_reduction != "none":
+        raise ValueError(
+            "price_american_mc_cpp supports the pseudo sampler with variance_reduction 'none'"
+        )
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+
+    start = time.perf_counter()
+    raw = _mc_core.mc_price_american_lsm(
+        S0=float(model.spot),
+        K=float(option.strike),
+        r=float(model.rate),
+        sigma=float(model.vol),
+        T=float(option.maturity),
+        n_exercise=int(option.n_exercise),
+        n_paths=int(config.n_paths),
+        seed=seed,
+        is_call=option.option_type == OptionType.CALL,
+        n_basis=int(basis_degree) + 1,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+    )
+    elapsed = time.perf_counter() - start
+
+    price = float(raw["price"])
+    std_error = float(raw["std_error"])
+    european = float(raw["european_price"])
+    z = 1.96
+    return {
+        "price": price,
+        "std_error": std_error,
+        "conf_int_95": (price - z * std_error, price + z * std_error),
+        "n_paths": int(config.n_paths),
+        "european_price": european,
+        "exercise_premium": price - european,
+        "elapsed": elapsed,
+    }
+
+
+def price_path_dependent_mc_cpp(
+    model: GBMModel,
+    option: PathDependentOption,
+    config: FastMCConfig,
+) -> dict:
+    """
+    Price an Asian, barrier or lookback option with the C++ time-stepping
+    kernel (``_mc_core.mc_price_path_dependent``).
+
+    Each path keeps only running state, so memory does not grow with
+    ``option.n_steps``. Paths are always split into the fixed,
+    independently seeded blocks of the parallel kernel (``n_threads=None``
+    runs them on one thread), each drawing from a ziggurat normal source
+    and stepping paths in tiles. Returns the same dict as
+    ``price_european_mc_cpp``.
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    seed = 42 if config.seed is None else int(config.seed)
+    vr_code = _VR_CODES[_check_variance_reduction(config.variance_reduction)]
+    if config.sampler != "pseudo":
+        raise ValueError("sobol sampler only supports European options")
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+
+    start = time.perf_counter()
+    raw = _mc_core.mc_price_path_dependent(
+        S0=float(model.spot),
+        r=float(model.rate),
+        sigma=float(model.vol),
+        T=float(option.maturity),
+        n_steps=int(option.n_steps),
+        n_paths=int(config.n_paths),
+        seed=seed,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+        variance_reduction=vr_code,
+        is_call=option.option_type == OptionType.CALL,
+        **_path_product_args(option),
+    )
+    elapsed = time.perf_counter() - start
+
+    return _result_dict(raw, config.n_paths, elapsed)
+
+
+def price_heston_mc_cpp(
+    model: HestonModel,
+    option: EuropeanOption | PathDependentOption,
+    config: FastMCConfig,
+) -> dict:
+    """
+    Price a European, Asian, barrier or lookback option under Heston with
+    the C++ QE kernel (``_mc_core.mc_price_heston``).
+
+    Same scheme as ``MonteCarloEngine`` with a ``HestonModel``: European
+    options are stepped over ``model.n_steps`` dates, path-dependent ones
+    over their own ``n_steps``. Paths run on the fixed, independently
+    seeded blocks of the parallel kernel (``n_threads=None`` runs them on
+    one thread). Returns the same dict as ``price_european_mc_cpp``.
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    seed = 42 if config.seed is None else int(config.seed)
+    vr_code = _VR_CODES[_check_variance_reduction(config.variance_reduction)]
+    if config.sampler != "pseudo":
+        raise ValueError("sobol sampler only supports European options under GBM")
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+
+    n_steps = model.n_steps if isinstance(option, EuropeanOption) else option.n_steps
+
+    start = time.perf_counter()
+    raw = _mc_core.mc_price_heston(
+        S0=float(model.spot),
+        r=float(model.rate),
+        v0=float(model.v0),
+        kappa=float(model.kappa),
+        theta=float(model.theta),
+        xi=float(model.xi),
+        rho=float(model.rho),
+        T=float(option.maturity),
+        n_steps=int(n_steps),
+        n_paths=int(config.n_paths),
+        seed=seed,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+        variance_reduction=vr_code,
+        is_call=option.option_type == OptionType.CALL,
+        **_path_product_args(option),
+    )
+    elapsed = time.perf_counter() - start
+
+    return _result_dict(raw, config.n_paths, elapsed)
+
+
+def price_multi_asset_mc_cpp(
+    model: MultiAssetGBMModel,
+    option: MultiAssetOption,
+    config: FastMCConfig,
+) -> dict:
+    """
+    Price a basket, spread or best-of option with the C++ multi-asset
+    kernel (``_mc_core.mc_price_multi_asset``).
+
+    The model's cached Cholesky factor is passed to C++, so it is
+    factorised once per model and not per call. Spreads are priced as
+    baskets with signed weights. Paths run on the fixed, independently
+    seeded blocks of the parallel kernel (``n_threads=None`` runs them on
+    one thread). Returns the same dict as ``price_european_mc_cpp``.
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    seed = 42 if config.seed is None else int(config.seed)
+    vr_code = _VR_CODES[_check_variance_reduction(config.variance_reduction)]
+    if config.sampler != "pseudo":
+        raise ValueError("sobol sampler only supports European options")
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+
+    if isinstance(option, BasketOption):
+        payoff, weights = 0, np.asarray(option.weights, dtype=float)
+    elif isinstance(option, SpreadOption):
+        payoff, weights = 0, option.net_weights
+    elif isinstance(option, BestOfOption):
+        payoff, weights = 1, np.empty(0)
+    else:
+        raise TypeError(f"Unsupported multi-asset product: {type(option).__name__}")
+
+    start = time.perf_counter()
+    raw = _mc_core.mc_price_multi_asset(
+        S0=model.spots.tolist(),
+        sigma=model.vols.tolist(),
+        cholesky=model.cholesky.ravel().tolist(),
+        r=float(model.rate),
+        T=float(option.maturity),
+        payoff=payoff,
+        is_call=option.option_type == OptionType.CALL,
+        K=float(option.strike),
+        weights=weights.tolist(),
+        n_paths=int(config.n_paths),
+        seed=seed,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+        variance_reduction=vr_code,
     )
+    elapsed = time.perf_counter() - start
+
+    return _result_dict(raw, config.n_paths, elapsed)
+
+
+# PathPayoff / BarrierKind codes understood by _mc_core (see mc_core.hpp)
+_BARRIER_CODES = {
+    BarrierType.UP_AND_OUT: 0,
+    BarrierType.DOWN_AND_OUT: 1,
+    BarrierType.UP_AND_IN: 2,
+    BarrierType.DOWN_AND_IN: 3,
+}
 
+
+def _path_product_args(option: EuropeanOption | PathDependentOption) -> dict:
+    """Encode a product as mc_price_path_dependent / mc_price_heston kwargs."""
+    if isinstance(option, EuropeanOption):
+        return {"payoff": 3, "K": float(option.strike)}
+    if isinstance(option, AsianOption):
+        return {"payoff": 0, "K": float(option.strike)}
+    if isinstance(option, BarrierOption):
+        return {
+            "payoff": 1,
+            "K": float(option.strike),
+            "barrier": float(option.barrier),
+            "barrier_kind": _BARRIER_CODES[BarrierType(option.barrier_type)],
+        }
+    if isinstance(option, LookbackOption):
+        floating = option.strike is None
+        return {
+            "payoff": 2,
+            "K": 0.0 if floating else float(option.strike),
+            "floating_strike": floating,
+        }
+    raise TypeError(f"Unsupported path-dependent product: {type(option).__name__}")
+
+
+def _result_dict(raw: dict, n_paths: int, elapsed: float) -> dict:
+    """Turn a raw ``_mc_core`` result into the engine's result dict."""
     price = float(raw["price"])
     std_error = float(raw["std_error"])
+    vr_factor = float(raw["vr_factor"])
 
     # Use the same 95% CI convention as the Python engine
     z = 1.96
@@ -69,4 +639,189 @@ def price_european_mc_cpp(
         "price": price,
         "std_error": std_error,
         "conf_int_95": (ci_lower, ci_upper),
+        "variance_reduction_factor": vr_factor,
+        "effective_paths_per_sec": (
+            n_paths * vr_factor / elapsed if elapsed > 0 else float("inf")
+        ),
+        "n_paths": int(n_paths),
+    }
+
+
+def price_european_batch_mc_cpp(
+    model: GBMModel,
+    options: Sequence[EuropeanOption],
+    config: FastMCConfig,
+) -> dict:
+    """
+    Price a book of European options off one shared C++ simulation.
+
+    Normals are drawn once, one fixed block of paths at a time; the C++
+    side groups options by maturity and reuses S_T across strikes. Blocks
+    run on ``n_threads`` threads (None: one) and the result does not depend
+    on the thread count. Returns columnar arrays aligned with ``options``,
+    matching ``MonteCarloEngine.price_batch``:
+        {
+          "price": np.ndarray,
+          "std_error": np.ndarray,
+          "conf_int_95": (lower, upper)
+        }
+
+    The batch kernel is crude float64 MC; variance reduction, Sobol,
+    float32, summaries or instrumentation raise ValueError rather than
+    being ignored.
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+    seed = 42 if config.seed is None else int(config.seed)
+    if (
+        config.variance_reduction != "none"
+        or config.sampler != "pseudo"
+        or config.dtype != "float64"
+        or config.summaries
+        or config.instrument
+    ):
+        raise ValueError(
+            "price_european_batch_mc_cpp supports crude float64 pseudo-random MC only"
+        )
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+
+    raw = _mc_core.mc_price_european_batch(
+        S0=float(model.spot),
+        r=float(model.rate),
+        sigma=float(model.vol),
+        K=[float(o.strike) for o in options],
+        T=[float(o.maturity) for o in options],
+        is_call=[o.option_type == OptionType.CALL for o in options],
+        n_paths=int(config.n_paths),
+        seed=seed,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+    )
+
+    price = np.asarray(raw["price"], dtype=float)
+    std_error = np.asarray(raw["std_error"], dtype=float)
+
+    z = 1.96
+    return {
+        "price": price,
+        "std_error": std_error,
+        "conf_int_95": (price - z * std_error, price + z * std_error),
+    }
+
+
+def price_european_arrays_mc_cpp(
+    S0: Any,
+    K: Any,
+    r: Any,
+    sigma: Any,
+    T: Any,
+    is_call: Any,
+    config: FastMCConfig,
+    out: tuple[np.ndarray, np.ndarray] | None = None,
+) -> dict:
+    """
+    Price many independent European options through the zero-copy array
+    binding (``_mc_core.mc_price_european_arrays``).
+
+    Each input is a column (array-like, one entry per row) or a scalar that
+    is broadcast to every row. Contiguous float64 columns and a bool
+    ``is_call`` column are handed to C++ without copying. Results go
+    straight into ``out = (price, std_error)`` when given (contiguous
+    float64 arrays of the row count), otherwise into fresh arrays. Row i
+    uses its own stream seeded from (seed, i), and rows are spread over
+    ``n_threads``. The row kernel is crude float64 MC; variance reduction,
+    Sobol, float32, summaries or instrumentation raise ValueError rather
+    than being ignored.
+
+    Returns columnar arrays like ``price_european_batch_mc_cpp``:
+        {
+          "price": np.ndarray,
+          "std_error": np.ndarray,
+          "conf_int_95": (lower, upper)
+        }
+    """
+    if _mc_core is None:
+        raise RuntimeError(
+            "C++ backend (_mc_core) is not available. "
+        )
+    _check_n_paths(
+        config.n_paths, config.sampler, config.n_randomizations, config.variance_reduction
+    )
+    if (
+        config.variance_reduction != "none"
+        or config.sampler != "pseudo"
+        or config.dtype != "float64"
+        or config.summaries
+        or config.instrument
+    ):
+        raise ValueError("the array binding supports crude float64 pseudo-random MC only")
+    if config.n_threads is not None and config.n_threads < 0:
+        raise ValueError("n_threads must be >= 0")
+
+    seed = 42 if config.seed is None else int(config.seed)
+
+    *floats, calls = np.broadcast_arrays(
+        *(np.asarray(x, dtype=float) for x in (S0, K, r, sigma, T)),
+        np.asarray(is_call, dtype=bool),
+    )
+    if calls.ndim != 1:
+        raise ValueError("inputs must be scalars or 1-D columns")
+    floats = [np.ascontiguousarray(x) for x in floats]
+    calls = np.ascontiguousarray(calls)
+
+    if out is None:
+        price = np.empty(calls.shape[0])
+        std_error = np.empty(calls.shape[0])
+    else:
+        price, std_error = out
+
+    _mc_core.mc_price_european_arrays(
+        *floats,
+        calls,
+        n_paths=int(config.n_paths),
+        seed=seed,
+        price_out=price,
+        std_error_out=std_error,
+        n_threads=1 if config.n_threads is None else int(config.n_threads),
+    )
+
+    z = 1.96
+    return {
+        "price": price,
+        "std_error": std_error,
+        "conf_int_95": (price - z * std_error, price + z * std_error),
     }
+
+
+def price_european_table_mc_cpp(
+    table: Mapping[str, Any],
+    config: FastMCConfig,
+) -> dict:
+    """
+    Column-oriented front end for ``price_european_arrays_mc_cpp``.
+
+    ``table`` is a pandas DataFrame or any mapping of column name -> array
+    with columns ``S0``, ``K``, ``r``, ``sigma``, ``T`` and either a bool
+    ``is_call`` or an ``option_type`` column of "call" / "put" values.
+    """
+    if "is_call" in table:
+        is_call = np.asarray(table["is_call"], dtype=bool)
+    else:
+        option_type = np.asarray(table["option_type"], dtype=object)
+        is_call = np.array([OptionType(v) == OptionType.CALL for v in option_type])
+
+    return price_european_arrays_mc_cpp(
+        np.asarray(table["S0"]),
+        np.asarray(table["K"]),
+        np.asarray(table["r"]),
+        np.asarray(table["sigma"]),
+        np.asarray(table["T"]),
+        is_call,
+        config,
+    )
@@ -0,0 +1,222 @@
+"""Opt-in stage timing for the pricing engines and a process-wide registry.
+
+With ``MonteCarloConfig(instrument=True)`` or ``FastMCConfig(instrument=True)``
+the result dict gains a ``"profile"``:
+
+    {
+      "backend": "numpy" | "cpp",
+      "n_threads": int,
+      "n_paths": int,
+      "wall_time": float,          # seconds
+      "paths_per_sec": float,
+      "bytes_allocated": int,
+      "stages": {"rng": s, "exp": s, "payoff": s, "reduction": s, ...},
+    }
+
+and the profile is added to ``metrics_registry()``, which keeps counters
+over every instrumented run in the process and dumps them in the
+Prometheus text format or as JSON lines (one profile per line):
+
+    from mcengine.instrumentation import metrics_registry
+    print(metrics_registry().to_prometheus())
+
+Stage times are exclusive: a stage nested in another (normal draws inside
+the Heston path evolution, say) is charged only to itself. Time outside
+the named stages (argument checks, Python glue) is in ``wall_time`` but
+in no stage. When instrumentation is off the engines use ``NULL_TIMER``,
+whose stages are a shared no-op context manager, and the C++ backend
+calls the plain kernels, so the cost is a few attribute lookups per chunk.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import json
+import threading
+import time
+
+import numpy as np
+
+
+class StageTimer:
+    """Exclusive wall time and allocated bytes per named stage.
+
+    ``with timer.stage("rng"): ...`` charges the block's time to "rng";
+    entering a nested stage pauses the enclosing one until it exits.
+    ``count(*arrays)`` adds the arrays' ``nbytes`` to ``bytes_allocated``
+    (the engines count the normals, paths and payoffs they create, not
+    NumPy's temporaries).
+    """
+
+    def __init__(self) -> None:
+        self.seconds: dict[str, float] = {}
+        self.bytes_allocated = 0
+        self._stack: list[str] = []
+        self.started = self._mark = time.perf_counter()
+
+    def stage(self, name: str) -> "_Stage":
+        return _Stage(self, name)
+
+    def count(self, *arrays: np.ndarray | None) -> None:
+        for a in arrays:
+            if a is not None:
+                self.bytes_allocated += a.nbytes
+
+    def _switch(self, push: str | None) -> None:
+        now = time.perf_counter()
+        if self._stack:
+            top = self._stack[-1]
+            self.seconds[top] = self.seconds.get(top, 0.0) + (now - self._mark)
+        if push is None:
+            self._stack.pop()
+        else:
+            self._stack.append(push)
+        self._mark = now
+
+
+class _Stage:
+    __slots__ = ("_timer", "_name")
+
+    def __init__(self, timer: StageTimer, name: str) -> None:
+        self._timer = timer
+        self._name = name
+
+    def __enter__(self) -> None:
+        self._timer._switch(self._name)
+
+    def __exit__(self, *exc) -> None:
+        self._timer._switch(None)
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc) -> None:
+        pass
+
+
+class _NullTimer:
+    """Stand-in for StageTimer when instrumentation is off."""
+
+    _stage = _NullStage()
+
+    def stage(self, name: str) -> _NullStage:
+        return self._stage
+
+    def count(self, *arrays: np.ndarray | None) -> None:
+        pass
+
+
+NULL_TIMER = _NullTimer()
+
+
+def make_profile(
+    backend: str,
+    n_threads: int,
+    n_paths: int,
+    wall_time: float,
+    stages: dict[str, float],
+    bytes_allocated: int,
+) -> dict:
+    """The ``"profile"`` entry of an instrumented result (see module docs)."""
+    return {
+        "backend": backend,
+        "n_threads": int(n_threads),
+        "n_paths": int(n_paths),
+        "wall_time": float(wall_time),
+        "paths_per_sec": n_paths / wall_time if wall_time > 0 else float("inf"),
+        "bytes_allocated": int(bytes_allocated),
+        "stages": {name: float(s) for name, s in stages.items()},
+    }
+
+
+# name -> (Prometheus type, help text, labels)
+_METRICS = {
+    "mcengine_runs_total": ("counter", "Instrumented pricing runs.", ("backend",)),
+    "mcengine_paths_total": ("counter", "Paths simulated by instrumented runs.", ("backend",)),
+    "mcengine_wall_seconds_total": (
+        "counter", "Wall time of instrumented runs.", ("backend",),
+    ),
+    "mcengine_stage_seconds_total": (
+        "counter", "Time spent per pricing stage.", ("backend", "stage"),
+    ),
+    "mcengine_bytes_allocated_total": (
+        "counter", "Bytes allocated by instrumented runs.", ("backend",),
+    ),
+    "mcengine_threads": ("gauge", "Threads used by the last run.", ("backend",)),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class MetricsRegistry:
+    """Counters over instrumented runs plus the last ``max_runs`` profiles.
+
+    Thread-safe, so runs on several threads can record into one registry.
+    Each process has its own (process-pool workers do not report back).
+    """
+
+    def __init__(self, max_runs: int = 1000) -> None:
+        self._lock = threading.Lock()
+        self._runs: deque[dict] = deque(maxlen=max_runs)
+        self._values: dict[str, dict[tuple[str, ...], float]] = {name: {} for name in _METRICS}
+
+    def record(self, profile: dict) -> None:
+        """Add one ``"profile"`` dict to the counters and the run log."""
+        backend = profile["backend"]
+        entry = dict(profile, timestamp=time.time())
+        with self._lock:
+            self._runs.append(entry)
+            self._add("mcengine_runs_total", (backend,), 1)
+            self._add("mcengine_paths_total", (backend,), profile["n_paths"])
+            self._add("mcengine_wall_seconds_total", (backend,), profile["wall_time"])
+            self._add("mcengine_bytes_allocated_total", (backend,), profile["bytes_allocated"])
+            for stage, seconds in profile["stages"].items():
+                self._add("mcengine_stage_seconds_total", (backend, stage), seconds)
+            self._values["mcengine_threads"][(backend,)] = profile["n_threads"]
+
+    def _add(self, name: str, labels: tuple[str, ...], value: float) -> None:
+        series = self._values[name]
+        series[labels] = series.get(labels, 0.0) + value
+
+    def runs(self) -> list[dict]:
+        """Copies of the recorded profiles, oldest first."""
+        with self._lock:
+            return [dict(run) for run in self._runs]
+
+    def to_prometheus(self) -> str:
+        """All counters in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (kind, help_text, label_names) in _METRICS.items():
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(self._values[name].items()):
+                    pairs = ",".join(
+                        f'{key}="{_escape(v)}"' for key, v in zip(label_names, labels)
+                    )
+                    lines.append(f"{name}{{{pairs}}} {value!r}")
+        return "\n".join(lines) + "\n"
+
+    def to_json_lines(self) -> str:
+        """The recorded profiles, one JSON object per line."""
+        return "".join(json.dumps(run) + "\n" for run in self.runs())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._runs.clear()
+            for series in self._values.values():
+                series.clear()
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def metrics_registry() -> MetricsRegistry:
+    """The process-wide registry the engines record into."""
+    return _REGISTRY
@@ -1,8 +1,32 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
+from typing import Iterable, Sequence
 import numpy as np
 
+from .samplers import NormalSampler, normal_cdf
+
+
+@dataclass
+class PathState:
+    """Running per-path statistics from a time-stepped simulation.
+
+    Only O(n_paths) state is kept, never the full path matrix.
+
+    Attributes
+    ----------
+    terminal: S_T, shape (n_paths,).
+    average: Arithmetic mean of S over the monitoring dates t_1..t_n.
+    minimum: Running minimum of S over t_0..t_n.
+    maximum: Running maximum of S over t_0..t_n.
+    """
+
+    terminal: np.ndarray
+    average: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+
 
 @dataclass
 class GBMModel:
@@ -20,6 +44,8 @@ class GBMModel:
         T: float,
         n_paths: int,
         rng: np.random.Generator,
+        sampler: NormalSampler | None = None,
+        dtype: np.dtype | type = np.float64,
     ) -> np.ndarray:
         """Simulate terminal prices S_T under GBM.
 
@@ -28,13 +54,381 @@ class GBMModel:
         T: Time to maturity in years.
         n_paths: Number of Monte Carlo paths.
         rng: NumPy random generator (for reproducibility).
+        sampler: Optional normal sampler (e.g. ``SobolSampler``) used
+            instead of ``rng.standard_normal``.
+        dtype: ``np.float64`` (default) or ``np.float32``; the normals and
+            S_T are computed in this precision.
+
+        Returns
+        -------
+        np.ndarray
+        Array of shape (n_paths,) with simulated terminal prices S_T.
+        """
+        if sampler is None:
+            Z = rng.standard_normal(n_paths, dtype=dtype)
+        else:
+            Z = sampler.normals(n_paths, 1)[:, 0].astype(dtype, copy=False)
+        return self.terminal_from_normals(T, Z)
+
+    def terminal_from_normals(self, T: float, Z: np.ndarray) -> np.ndarray:
+        """Map standard normal draws to terminal prices S_T under GBM.
+
+        Splitting this out of ``simulate_terminal`` lets callers reuse one
+        set of normals across several maturities or products.
+
+        Parameters
+        ----------
+        T: Time to maturity in years.
+        Z: Array of standard normal draws, shape (n_paths,).
+
+        Returns
+        -------
+        np.ndarray
+        Array of shape (n_paths,) with terminal prices S_T, in the dtype
+        of ``Z``.
+        """
+        # Python-float coefficients, so float32 draws are not promoted
+        drift = float((self.rate - 0.5 * self.vol**2) * T)
+        diffusion = float(self.vol * np.sqrt(T)) * Z
+        return float(self.spot) * np.exp(drift + diffusion)
+
+    def simulate_path_state(
+        self,
+        T: float,
+        n_steps: int,
+        n_paths: int,
+        rng: np.random.Generator,
+    ) -> PathState:
+        """Time-step GBM paths, keeping only running per-path statistics.
+
+        Parameters
+        ----------
+        T: Time to maturity in years.
+        n_steps: Number of equally spaced monitoring dates in (0, T].
+        n_paths: Number of Monte Carlo paths.
+        rng: NumPy random generator (for reproducibility).
+
+        Returns
+        -------
+        PathState
+        Terminal price, running average, minimum and maximum per path.
+        """
+        step_normals = (rng.standard_normal(n_paths) for _ in range(n_steps))
+        return self.path_state_from_normals(T, n_steps, step_normals)
+
+    def simulate_paths_into(
+        self,
+        T: float,
+        out: np.ndarray,
+        rng: np.random.Generator,
+        chunk_size: int = 65_536,
+    ) -> np.ndarray:
+        """Fill ``out`` with full GBM paths, a chunk of rows at a time.
+
+        Parameters
+        ----------
+        T: Time to maturity in years.
+        out: Array of shape (n_paths, n_steps), e.g. a ``np.memmap``; row
+            i receives S at the equally spaced dates t_1..t_n of path i.
+            float32 arrays are written from float64 log-prices.
+        rng: NumPy random generator (for reproducibility).
+        chunk_size: Rows simulated per chunk, so scratch memory is
+            O(chunk_size * n_steps) however large ``out`` is.
+
+        Returns
+        -------
+        np.ndarray
+        ``out``.
+        """
+        n_paths, n_steps = out.shape
+        dt = T / n_steps
+        drift = (self.rate - 0.5 * self.vol**2) * dt
+        scale = self.vol * np.sqrt(dt)
+        log_spot = np.log(self.spot)
+
+        for start in range(0, n_paths, chunk_size):
+            stop = min(start + chunk_size, n_paths)
+            # log S_{t_k} = log S_0 + sum_{j <= k} (drift + scale * Z_j)
+            log_paths = rng.standard_normal((stop - start, n_steps))
+            log_paths *= scale
+            log_paths += drift
+            np.cumsum(log_paths, axis=1, out=log_paths)
+            log_paths += log_spot
+            np.exp(log_paths, out=out[start:stop], casting="same_kind")
+        return out
+
+    def path_state_from_normals(
+        self,
+        T: float,
+        n_steps: int,
+        step_normals: Iterable[np.ndarray],
+    ) -> PathState:
+        """Accumulate a ``PathState`` from per-step normal draws.
+
+        ``step_normals`` yields ``n_steps`` arrays of shape (n_paths,), one
+        per time step, so callers control the draws (e.g. antithetic
+        pairs) while memory stays O(n_paths).
+        """
+        dt = T / n_steps
+        drift = (self.rate - 0.5 * self.vol**2) * dt
+        scale = self.vol * np.sqrt(dt)
+
+        S = total = minimum = maximum = growth = None
+        for Z in step_normals:
+            if S is None:
+                S = np.full(Z.shape[0], float(self.spot), dtype=Z.dtype)
+                total = np.zeros_like(S)
+                minimum = S.copy()
+                maximum = S.copy()
+                growth = np.empty_like(S)
+
+            # S_{t+dt} = S_t * exp(drift + scale * Z), updated in place
+            np.multiply(Z, scale, out=growth)
+            growth += drift
+            np.exp(growth, out=growth)
+            S *= growth
+
+            total += S
+            np.minimum(minimum, S, out=minimum)
+            np.maximum(maximum, S, out=maximum)
+
+        return PathState(
+            terminal=S,
+            average=total / n_steps,
+            minimum=minimum,
+            maximum=maximum,
+        )
+
+
+@dataclass(eq=False)
+class MultiAssetGBMModel:
+    """Correlated multi-asset GBM under the risk-neutral measure.
+
+    dS_t^i = r S_t^i dt + sigma_i S_t^i dW_t^i,  d<W^i, W^j>_t = rho_ij dt
+
+    ``spots``, ``vols`` and ``correlation`` are stored as arrays. The
+    Cholesky factor of the correlation matrix is computed on first use and
+    cached, so pricing many products (or many chunks) pays for it once.
+    Treat the parameters as immutable after construction.
+    """
+
+    spots: Sequence[float]        # S0 per asset, shape (n_assets,)
+    rate: float                   # r
+    vols: Sequence[float]         # sigma per asset, shape (n_assets,)
+    correlation: Sequence[Sequence[float]]  # shape (n_assets, n_assets)
+
+    def __post_init__(self) -> None:
+        self.spots = np.asarray(self.spots, dtype=float)
+        self.vols = np.asarray(self.vols, dtype=float)
+        self.correlation = np.asarray(self.correlation, dtype=float)
+
+        n = self.spots.shape[0]
+        if self.spots.ndim != 1 or self.vols.shape != (n,):
+            raise ValueError("spots and vols must be 1-D arrays of the same length")
+        if self.correlation.shape != (n, n):
+            raise ValueError(f"correlation must have shape ({n}, {n})")
+        if not np.allclose(self.correlation, self.correlation.T):
+            raise ValueError("correlation must be symmetric")
+        if not np.allclose(np.diag(self.correlation), 1.0):
+            raise ValueError("correlation must have a unit diagonal")
+
+    @property
+    def n_assets(self) -> int:
+        return self.spots.shape[0]
+
+    @cached_property
+    def cholesky(self) -> np.ndarray:
+        """Lower-triangular L with L @ L.T == correlation."""
+        try:
+            return np.linalg.cholesky(self.correlation)
+        except np.linalg.LinAlgError as exc:
+            raise ValueError("correlation must be positive definite") from exc
+
+    def simulate_terminal(
+        self,
+        T: float,
+        n_paths: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """Simulate correlated terminal prices S_T.
+
+        Returns
+        -------
+        np.ndarray
+        Array of shape (n_paths, n_assets) with terminal prices S_T.
+        """
+        Z = rng.standard_normal((n_paths, self.n_assets))
+        return self.terminal_from_normals(T, Z)
+
+    def terminal_from_normals(self, T: float, Z: np.ndarray) -> np.ndarray:
+        """Map independent normals, shape (n_paths, n_assets), to
+        correlated terminal prices of the same shape.
+
+        The correlation is applied as one matrix multiply per batch
+        (Z @ L.T), and the rest is updated in place, so peak memory is two
+        (n_paths, n_assets) arrays.
+        """
+        W = Z @ self.cholesky.T
+        W *= self.vols * np.sqrt(T)
+        W += (self.rate - 0.5 * self.vols**2) * T
+        np.exp(W, out=W)
+        W *= self.spots
+        return W
+
+
+@dataclass
+class HestonModel:
+    """Heston stochastic-volatility model under the risk-neutral measure.
+
+    dS_t = r S_t dt + sqrt(v_t) S_t dW_t^S
+    dv_t = kappa (theta - v_t) dt + xi sqrt(v_t) dW_t^v,  d<W^S, W^v>_t = rho dt
+
+    Discretised with Andersen's (2008) quadratic-exponential (QE) scheme
+    for the variance and his martingale-corrected log-price step, so the
+    discounted simulated S is an exact martingale on the time grid. There
+    is no closed-form S_T, so European options are time-stepped too, over
+    ``n_steps`` equally spaced dates; path-dependent products use their
+    own ``n_steps``.
+    """
+
+    spot: float    # S0
+    rate: float    # r
+    v0: float      # initial variance
+    kappa: float   # mean-reversion speed
+    theta: float   # long-run variance
+    xi: float      # volatility of variance
+    rho: float     # spot/variance correlation
+    n_steps: int = 252
+
+    # Switch from the quadratic to the exponential branch above this psi
+    PSI_CRITICAL = 1.5
+
+    def __post_init__(self) -> None:
+        if self.kappa <= 0 or self.xi <= 0:
+            raise ValueError("kappa and xi must be > 0")
+        if self.v0 < 0 or self.theta < 0:
+            raise ValueError("v0 and theta must be >= 0")
+        if not -1.0 <= self.rho <= 1.0:
+            raise ValueError("rho must be in [-1, 1]")
+
+    def simulate_terminal(
+        self,
+        T: float,
+        n_paths: int,
+        rng: np.random.Generator,
+    ) -> np.ndarray:
+        """Simulate S_T by QE time-stepping over ``self.n_steps`` dates.
 
         Returns
         -------
         np.ndarray
         Array of shape (n_paths,) with simulated terminal prices S_T.
         """
-        Z = rng.standard_normal(n_paths)
-        drift = (self.rate - 0.5 * self.vol**2) * T
-        diffusion = self.vol * np.sqrt(T) * Z
-        return self.spot * np.exp(drift + diffusion)
+        return self.simulate_path_state(T, self.n_steps, n_paths, rng).terminal
+
+    def simulate_path_state(
+        self,
+        T: float,
+        n_steps: int,
+        n_paths: int,
+        rng: np.random.Generator,
+    ) -> PathState:
+        """Time-step Heston paths, keeping only running per-path statistics
+        (same contract as ``GBMModel.simulate_path_state``)."""
+        step_normals = (rng.standard_normal((n_paths, 2)) for _ in range(n_steps))
+        return self.path_state_from_normals(T, n_steps, step_normals)
+
+    def path_state_from_normals(
+        self,
+        T: float,
+        n_steps: int,
+        step_normals: Iterable[np.ndarray],
+    ) -> PathState:
+        """Accumulate a ``PathState`` from per-step normal draws.
+
+        ``step_normals`` yields ``n_steps`` arrays of shape (n_paths, 2):
+        column 0 drives the variance (mapped to a uniform through the
+        normal CDF in the exponential branch), column 1 the log-price.
+        Negating both columns gives the antithetic path. Memory stays
+        O(n_paths).
+        """
+        dt = T / n_steps
+        kappa, theta, xi, rho = self.kappa, self.theta, self.xi, self.rho
+
+        # Conditional variance moments: m = theta + (v - theta) e,
+        # s^2 = v * c1 + c2
+        e = np.exp(-kappa * dt)
+        c1 = xi**2 * e * (1.0 - e) / kappa
+        c2 = theta * xi**2 * (1.0 - e) ** 2 / (2.0 * kappa)
+
+        # Log-price step with central weighting (gamma1 = gamma2 = 1/2)
+        k1 = 0.5 * dt * (kappa * rho / xi - 0.5) - rho / xi
+        k2 = 0.5 * dt * (kappa * rho / xi - 0.5) + rho / xi
+        k3 = 0.5 * dt * (1.0 - rho**2)
+        k4 = k3
+        A = k2 + 0.5 * k4
+        k0 = -rho * kappa * theta * dt / xi  # uncorrected drift term
+
+        v = X = total = minimum = maximum = None
+        for Z in step_normals:
+            if v is None:
+                n_paths = Z.shape[0]
+                v = np.full(n_paths, float(self.v0))
+                X = np.full(n_paths, np.log(self.spot))
+                total = np.zeros(n_paths)
+                minimum = np.full(n_paths, float(self.spot))
+                maximum = minimum.copy()
+                v_next = np.empty(n_paths)
+                # -log E[exp(A v_next)]: makes E[S_{t+dt} | S_t, v_t] = S_t e^{r dt}
+                correction = np.empty(n_paths)
+            z_v, z_s = Z[:, 0], Z[:, 1]
+
+            m = theta + (v - theta) * e
+            psi = (v * c1 + c2) / (m * m)
+
+            quad = psi <= self.PSI_CRITICAL
+            with np.errstate(divide="ignore", invalid="ignore"):
+                # Quadratic branch: v_next = a (b + Z_v)^2
+                inv = 2.0 / psi[quad]
+                b2 = inv - 1.0 + np.sqrt(inv) * np.sqrt(inv - 1.0)
+                a = m[quad] / (1.0 + b2)
+                v_next[quad] = a * (np.sqrt(b2) + z_v[quad]) ** 2
+                one_minus = 1.0 - 2.0 * A * a
+                correction[quad] = -A * b2 * a / one_minus + 0.5 * np.log(one_minus)
+
+                # Exponential branch: point mass p at 0, exponential tail
+                expo = ~quad
+                p = (psi[expo] - 1.0) / (psi[expo] + 1.0)
+                beta = (1.0 - p) / m[expo]
+                u = normal_cdf(z_v[expo])
+                v_next[expo] = np.where(
+                    u <= p, 0.0, np.log((1.0 - p) / (1.0 - np.maximum(u, p))) / beta
+                )
+                correction[expo] = -np.log(p + beta * (1.0 - p) / (beta - A))
+
+            # Where the moment generating function does not exist (rare,
+            # large dt with rho > 0) fall back to the uncorrected drift
+            bad = ~np.isfinite(correction)
+            if np.any(bad):
+                correction[bad] = k0 + (k1 + 0.5 * k3) * v[bad]
+
+            X += (
+                self.rate * dt
+                + correction
+                - 0.5 * k3 * v
+                + k2 * v_next
+                + np.sqrt(k3 * v + k4 * v_next) * z_s
+            )
+            v, v_next = v_next, v
+
+            S = np.exp(X)
+            total += S
+            np.minimum(minimum, S, out=minimum)
+            np.maximum(maximum, S, out=maximum)
+
+        return PathState(
+            terminal=S,
+            average=total / n_steps,
+            minimum=minimum,
+            maximum=maximum,
+        )
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+import math
+import os
+import time
+from typing import Callable, Sequence, TypeVar, Union
+
+import numpy as np
+
+from .engine import (
+    DEFAULT_CHUNK_SIZE,
+    MonteCarloConfig,
+    MonteCarloEngine,
+    _result_dict,
+)
+from .models import GBMModel
+from .products import EuropeanOption, PathDependentOption
+from .stats import RunningMoments
+from .summaries import PricingSummaries
+
+Product = Union[EuropeanOption, PathDependentOption]
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+def _check_pool_config(config: MonteCarloConfig) -> None:
+    if config.sampler != "pseudo":
+        raise ValueError("the process pool only supports the pseudo sampler")
+    if config.target_std_error is not None or config.time_budget is not None:
+        raise ValueError(
+            "target_std_error / time_budget are not supported by the process "
+            "pool; use MonteCarloEngine streaming instead"
+        )
+
+
+def _run_tasks(
+    fn: Callable[[_T], _R],
+    tasks: Sequence[_T],
+    n_workers: int | None,
+) -> list[_R]:
+    """Map ``fn`` over ``tasks`` in a process pool, preserving order.
+
+    ``n_workers=1`` runs inline (no pool); ``None`` uses ``os.cpu_count()``.
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if n_workers == 1 or len(tasks) <= 1:
+        return [fn(task) for task in tasks]
+
+    # A few tasks per worker amortises pickling without hurting balance
+    chunksize = max(1, math.ceil(len(tasks) / (4 * n_workers)))
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(fn, tasks, chunksize=chunksize))
+
+
+def _price_task(args: tuple) -> dict:
+    model, product, config = args
+    return MonteCarloEngine(model, config).price(product)
+
+
+def _chunk_task(
+    args: tuple,
+) -> tuple[RunningMoments, RunningMoments, PricingSummaries | None]:
+    model, product, config, n_paths = args
+    engine = MonteCarloEngine(model, config)
+    draw_normals = engine._normal_streams(np.dtype(config.dtype))[0]
+    summaries = engine._empty_summaries(product) if config.summaries else None
+    estimator, crude = engine._simulate_chunk(product, n_paths, draw_normals, summaries)
+    return estimator, crude, summaries
+
+
+def price_portfolio(
+    model: GBMModel,
+    products: Sequence[Product],
+    config: MonteCarloConfig,
+    n_workers: int | None = None,
+) -> list[dict]:
+    """Price a book of products across a process pool.
+
+    Each product gets its own child stream from
+    ``SeedSequence(config.seed).spawn``, indexed by its position in
+    ``products``. Results are therefore reproducible for a given seed and do
+    not depend on ``n_workers``. Returns one ``MonteCarloEngine.price`` result
+    dict per product, in input order.
+    """
+    _check_pool_config(config)
+    children = np.random.SeedSequence(config.seed).spawn(len(products))
+    tasks = [
+        (model, product, replace(config, seed=child))
+        for product, child in zip(products, children)
+    ]
+    return _run_tasks(_price_task, tasks, n_workers)
+
+
+def price_parallel(
+    model: GBMModel,
+    product: Product,
+    config: MonteCarloConfig,
+    n_workers: int | None = None,
+) -> dict:
+    """Price one product by spreading its path chunks across a process pool.
+
+    ``n_paths`` is cut into chunks of ``config.chunk_size`` paths (default
+    ``DEFAULT_CHUNK_SIZE``), each simulated from its own
+    ``SeedSequence.spawn`` child. The per-chunk moments are merged in chunk
+    order, so the result depends on the seed and chunk size but not on
+    ``n_workers``; so are the summaries when ``config.summaries`` is set.
+    Returns the same dict as ``MonteCarloEngine.price``.
+    With ``dtype="float32"`` the pilot check runs once, in this process.
+    """
+    _check_pool_config(config)
+    start = time.perf_counter()
+    dtype, pilot_error = MonteCarloEngine(model, config)._resolve_dtype(product)
+
+    chunk = config.chunk_size or DEFAULT_CHUNK_SIZE
+    sizes = [chunk] * (config.n_paths // chunk)
+    if config.n_paths % chunk:
+        sizes.append(config.n_paths % chunk)
+
+    worker_config = replace(config, chunk_size=None, dtype=dtype.name)
+    children = np.random.SeedSequence(config.seed).spawn(len(sizes))
+    tasks = [
+        (model, product, replace(worker_config, seed=child), size)
+        for size, child in zip(sizes, children)
+    ]
+
+    estimator = RunningMoments.empty()
+    crude = RunningMoments.empty()
+    summaries = None
+    for chunk_estimator, chunk_crude, chunk_summaries in _run_tasks(
+        _chunk_task, tasks, n_workers
+    ):
+        estimator.merge(chunk_estimator)
+        crude.merge(chunk_crude)
+        if chunk_summaries is not None:
+            summaries = chunk_summaries if summaries is None else summaries.merge(chunk_summaries)
+
+    price_estimate, std_error = MonteCarloEngine(model, config)._estimate(estimator)
+    result = _result_dict(
+        price_estimate,
+        std_error,
+        crude,
+        time.perf_counter() - start,
+        reduced=config.variance_reduction != "none",
+    )
+    if config.dtype == "float32":
+        result["dtype"] = dtype.name
+        result["pilot_rel_error"] = pilot_error
+    if summaries is not None:
+        result["summaries"] = summaries
+    return result
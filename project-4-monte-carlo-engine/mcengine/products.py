@@ -2,14 +2,33 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING, Sequence, Union
 import numpy as np
 
+if TYPE_CHECKING:
+    from .models import PathState
+
 
 class OptionType(str, Enum):
     CALL = "call"
     PUT = "put"
 
 
+class BarrierType(str, Enum):
+    UP_AND_OUT = "up-and-out"
+    DOWN_AND_OUT = "down-and-out"
+    UP_AND_IN = "up-and-in"
+    DOWN_AND_IN = "down-and-in"
+
+
+def _vanilla_payoff(
+    option_type: OptionType, underlying: np.ndarray, strike: float | np.ndarray
+) -> np.ndarray:
+    if option_type == OptionType.CALL:
+        return np.maximum(underlying - strike, 0.0)
+    return np.maximum(strike - underlying, 0.0)
+
+
 @dataclass
 class EuropeanOption:
     strike: float
@@ -32,3 +51,155 @@ class EuropeanOption:
         if self.option_type == OptionType.CALL:
             return np.maximum(terminal_prices - self.strike, 0.0)
         return np.maximum(self.strike - terminal_prices, 0.0)
+
+
+@dataclass
+class AsianOption:
+    """Arithmetic-average-price option.
+
+    The average is taken over ``n_steps`` equally spaced monitoring dates
+    t_1..t_n (S_0 excluded); the payoff is a vanilla call/put on it.
+    """
+
+    strike: float
+    maturity: float  # T in years
+    option_type: OptionType = OptionType.CALL
+    n_steps: int = 252
+
+    def payoff_from_state(self, state: "PathState") -> np.ndarray:
+        return _vanilla_payoff(self.option_type, state.average, self.strike)
+
+
+@dataclass
+class BarrierOption:
+    """Discretely monitored knock-in / knock-out barrier option.
+
+    The barrier is checked at t_0..t_n (``n_steps`` equally spaced dates,
+    plus inception). Knock-outs pay the vanilla payoff only if the barrier
+    was never touched; knock-ins only if it was.
+    """
+
+    strike: float
+    maturity: float  # T in years
+    barrier: float
+    barrier_type: BarrierType = BarrierType.UP_AND_OUT
+    option_type: OptionType = OptionType.CALL
+    n_steps: int = 252
+
+    def payoff_from_state(self, state: "PathState") -> np.ndarray:
+        if self.barrier_type in (BarrierType.UP_AND_OUT, BarrierType.UP_AND_IN):
+            touched = state.maximum >= self.barrier
+        else:
+            touched = state.minimum <= self.barrier
+
+        knock_in = self.barrier_type in (BarrierType.UP_AND_IN, BarrierType.DOWN_AND_IN)
+        alive = touched if knock_in else ~touched
+        return np.where(alive, _vanilla_payoff(self.option_type, state.terminal, self.strike), 0.0)
+
+
+@dataclass
+class LookbackOption:
+    """Discretely monitored lookback option.
+
+    With ``strike=None`` (floating strike) a call pays S_T - min S and a
+    put pays max S - S_T. With a fixed strike a call pays max(max S - K, 0)
+    and a put max(K - min S, 0). Extremes are taken over t_0..t_n.
+    """
+
+    maturity: float  # T in years
+    option_type: OptionType = OptionType.CALL
+    strike: float | None = None
+    n_steps: int = 252
+
+    def payoff_from_state(self, state: "PathState") -> np.ndarray:
+        if self.strike is None:
+            if self.option_type == OptionType.CALL:
+                return state.terminal - state.minimum
+            return state.maximum - state.terminal
+        if self.option_type == OptionType.CALL:
+            return np.maximum(state.maximum - self.strike, 0.0)
+        return np.maximum(self.strike - state.minimum, 0.0)
+
+
+@dataclass
+class AmericanOption:
+    """Early-exercise vanilla option, exercisable on ``n_exercise`` equally
+    spaced dates t_1..t_n = T (a Bermudan grid; t_0 excluded). Priced by
+    Longstaff-Schwartz regression, see ``mcengine.american``.
+    """
+
+    strike: float
+    maturity: float  # T in years
+    option_type: OptionType = OptionType.PUT
+    n_exercise: int = 50
+
+    def payoff(self, prices: np.ndarray) -> np.ndarray:
+        """Exercise value for a batch of spot prices."""
+        return _vanilla_payoff(self.option_type, prices, self.strike)
+
+
+# Products priced off a time-stepped PathState rather than S_T alone
+PathDependentOption = Union[AsianOption, BarrierOption, LookbackOption]
+
+
+@dataclass
+class BasketOption:
+    """European option on a weighted basket sum_i w_i S_T^i.
+
+    Priced with a ``MultiAssetGBMModel``; ``weights`` has one entry per
+    asset.
+    """
+
+    strike: float
+    maturity: float  # T in years
+    weights: Sequence[float]
+    option_type: OptionType = OptionType.CALL
+
+    def payoff(self, terminal_prices: np.ndarray) -> np.ndarray:
+        """Payoff for S_T of shape (n_paths, n_assets)."""
+        basket = terminal_prices @ np.asarray(self.weights, dtype=float)
+        return _vanilla_payoff(self.option_type, basket, self.strike)
+
+
+@dataclass
+class SpreadOption:
+    """European option on the spread between two weighted baskets.
+
+    The underlying is ``long_weights · S_T - short_weights · S_T``, so a
+    plain two-asset spread S_T^1 - S_T^2 uses weights (1, 0) and (0, 1).
+    A call pays max(spread - K, 0); ``strike=0`` gives an exchange option.
+    """
+
+    strike: float
+    maturity: float  # T in years
+    long_weights: Sequence[float]
+    short_weights: Sequence[float]
+    option_type: OptionType = OptionType.CALL
+
+    @property
+    def net_weights(self) -> np.ndarray:
+        return np.asarray(self.long_weights, dtype=float) - np.asarray(
+            self.short_weights, dtype=float
+        )
+
+    def payoff(self, terminal_prices: np.ndarray) -> np.ndarray:
+        """Payoff for S_T of shape (n_paths, n_assets)."""
+        spread = terminal_prices @ self.net_weights
+        return _vanilla_payoff(self.option_type, spread, self.strike)
+
+
+@dataclass
+class BestOfOption:
+    """European call or put on the best performer, max_i S_T^i."""
+
+    strike: float
+    maturity: float  # T in years
+    option_type: OptionType = OptionType.CALL
+
+    def payoff(self, terminal_prices: np.ndarray) -> np.ndarray:
+        """Payoff for S_T of shape (n_paths, n_assets)."""
+        return _vanilla_payoff(self.option_type, terminal_prices.max(axis=1), self.strike)
+
+
+# Products on several correlated underlyings (MultiAssetGBMModel)
+MultiAssetOption = Union[BasketOption, SpreadOption, BestOfOption]
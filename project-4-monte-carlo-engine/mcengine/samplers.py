@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+import numpy as np
+
+
+# Joe & Kuo (new-joe-kuo-6.21201) primitive polynomials for Sobol
+# dimensions 2..21 as (degree s, coefficient a, initial m_1..m_s).
+# Dimension 1 is the van der Corput sequence (all m_k = 1).
+_JOE_KUO = (
+    (1, 0, (1,)),
+    (2, 1, (1, 3)),
+    (3, 1, (1, 3, 1)),
+    (3, 2, (1, 1, 1)),
+    (4, 1, (1, 1, 3, 3)),
+    (4, 4, (1, 3, 5, 13)),
+    (5, 2, (1, 1, 5, 5, 17)),
+    (5, 4, (1, 1, 5, 5, 5)),
+    (5, 7, (1, 1, 7, 11, 19)),
+    (5, 11, (1, 1, 5, 1, 1)),
+    (5, 13, (1, 1, 1, 3, 11)),
+    (5, 14, (1, 3, 5, 5, 31)),
+    (6, 1, (1, 3, 3, 9, 7, 49)),
+    (6, 13, (1, 1, 1, 15, 21, 21)),
+    (6, 16, (1, 3, 1, 13, 27, 49)),
+    (6, 19, (1, 1, 1, 15, 7, 5)),
+    (6, 22, (1, 3, 1, 15, 13, 25)),
+    (6, 25, (1, 1, 5, 5, 19, 61)),
+    (7, 1, (1, 3, 7, 11, 23, 15, 103)),
+    (7, 4, (1, 3, 7, 13, 13, 15, 69)),
+)
+
+SOBOL_MAX_DIM = len(_JOE_KUO) + 1
+_BITS = 32
+
+
+def _direction_numbers(dim: int) -> np.ndarray:
+    """Unscrambled Sobol direction numbers, shape (dim, 32), as uint64.
+
+    Row d holds V_1..V_32 for dimension d + 1, left-aligned in 32 bits.
+    """
+    V = np.zeros((dim, _BITS), dtype=np.uint64)
+    V[0] = [1 << (_BITS - 1 - k) for k in range(_BITS)]
+
+    for d in range(1, dim):
+        s, a, m = _JOE_KUO[d - 1]
+        v = [0] * _BITS
+        for k in range(min(s, _BITS)):
+            v[k] = m[k] << (_BITS - 1 - k)
+        for k in range(s, _BITS):
+            v[k] = v[k - s] ^ (v[k - s] >> s)
+            for j in range(1, s):
+                if (a >> (s - 1 - j)) & 1:
+                    v[k] ^= v[k - j]
+        V[d] = v
+    return V
+
+
+def _parity(x: np.ndarray) -> np.ndarray:
+    """Bitwise parity of each uint64 element (0 or 1)."""
+    x = x.copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        x ^= x >> np.uint64(shift)
+    return x & np.uint64(1)
+
+
+def inverse_normal_cdf(u: np.ndarray) -> np.ndarray:
+    """Vectorised inverse standard normal CDF (Acklam's rational approximation).
+
+    Relative error is below 1.2e-9 on (0, 1), far below Monte Carlo noise,
+    and it avoids pulling in SciPy.
+    """
+    a = (-3.969683028665376e01, 2.209460984245205e02, -2.759285104469687e02,
+         1.383577518672690e02, -3.066479806614716e01, 2.506628277459239e00)
+    b = (-5.447609879822406e01, 1.615858368580409e02, -1.556989798598866e02,
+         6.680131188771972e01, -1.328068155288572e01)
+    c = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e00,
+         -2.549732539343734e00, 4.374664141464968e00, 2.938163982698783e00)
+    d = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e00,
+         3.754408661907416e00)
+    p_low = 0.02425
+
+    u = np.asarray(u, dtype=float)
+    out = np.empty_like(u)
+
+    # Tails: rational function in sqrt(-2 log p)
+    tail = np.minimum(u, 1.0 - u)
+    in_tail = tail < p_low
+    q = np.sqrt(-2.0 * np.log(tail[in_tail]))
+    x = (((((c[0] * q + c[1]) * q + c[2]) * q + c[3]) * q + c[4]) * q + c[5]) / (
+        (((d[0] * q + d[1]) * q + d[2]) * q + d[3]) * q + 1.0
+    )
+    out[in_tail] = np.where(u[in_tail] < 0.5, x, -x)
+
+    # Central region: rational function in (p - 0.5)^2
+    centre = ~in_tail
+    q = u[centre] - 0.5
+    r = q * q
+    out[centre] = (
+        (((((a[0] * r + a[1]) * r + a[2]) * r + a[3]) * r + a[4]) * r + a[5]) * q
+        / (((((b[0] * r + b[1]) * r + b[2]) * r + b[3]) * r + b[4]) * r + 1.0)
+    )
+    return out
+
+
+def normal_cdf(x: np.ndarray) -> np.ndarray:
+    """Vectorised standard normal CDF.
+
+    Hart's double-precision rational approximation (as given by West,
+    2005), accurate to about 1e-14 over the real line. NumPy has no erf,
+    and this keeps SciPy out of the dependencies.
+    """
+    x = np.asarray(x, dtype=float)
+    shape = x.shape
+    x = np.atleast_1d(x)  # the far-tail branch assigns through a mask
+    z = np.minimum(np.abs(x), 40.0)  # beyond 37 the tail underflows to 0
+    e = np.exp(-0.5 * z * z)
+
+    # |x| < 10 / sqrt(2): rational function
+    num = ((((((3.52624965998911e-02 * z + 0.700383064443688) * z
+                + 6.37396220353165) * z + 33.912866078383) * z
+              + 112.079291497871) * z + 221.213596169931) * z
+           + 220.206867912376)
+    den = (((((((8.83883476483184e-02 * z + 1.75566716318264) * z
+                 + 16.064177579207) * z + 86.7807322029461) * z
+               + 296.564248779674) * z + 637.333633378831) * z
+             + 793.826512519948) * z + 440.413735824752)
+    tail = e * num / den
+
+    # Far tail: continued fraction
+    far = z >= 7.07106781186547
+    if np.any(far):
+        zf = z[far]
+        b = zf + 0.65
+        for k in (4.0, 3.0, 2.0, 1.0):
+            b = zf + k / b
+        tail[far] = e[far] / b / 2.506628274631
+
+    tail = np.where(z > 37.0, 0.0, tail)
+    return np.where(x > 0.0, 1.0 - tail, tail).reshape(shape)
+
+
+class NormalSampler(Protocol):
+    """Source of standard normal draws used by the simulation layer."""
+
+    def normals(self, n: int, dim: int = 1) -> np.ndarray:
+        """Return an array of shape (n, dim) of N(0, 1) draws."""
+        ...
+
+
+class PseudoRandomSampler:
+    """Plain pseudo-random normals from a NumPy Generator."""
+
+    def __init__(self, rng: np.random.Generator) -> None:
+        self.rng = rng
+
+    def normals(self, n: int, dim: int = 1) -> np.ndarray:
+        return self.rng.standard_normal((n, dim))
+
+
+class SobolSampler:
+    """Scrambled Sobol normals (randomised quasi-Monte Carlo).
+
+    Each instance carries one randomisation: a random linear matrix
+    scramble of the direction numbers plus a random digital shift, both
+    drawn from ``rng``. Points are mapped to normals through the inverse
+    normal CDF. Successive ``normals`` calls continue the same sequence.
+
+    A single randomisation gives no usable error estimate; average several
+    independent ``SobolSampler`` instances and use the spread of their
+    estimates instead (see ``MonteCarloEngine`` with ``sampler="sobol"``).
+    Power-of-two point counts give the best balance.
+    """
+
+    def __init__(self, dim: int, rng: np.random.Generator) -> None:
+        if not 1 <= dim <= SOBOL_MAX_DIM:
+            raise ValueError(f"Sobol dimension must be in [1, {SOBOL_MAX_DIM}]")
+        self.dim = dim
+        self._index = 0
+        self._V = self._scramble(_direction_numbers(dim), rng)
+        self._shift = rng.integers(0, 1 << _BITS, size=dim, dtype=np.uint64)
+
+    @staticmethod
+    def _scramble(V: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Left-multiply each dimension's direction numbers by a random
+        lower-triangular binary matrix with unit diagonal (Matousek LMS)."""
+        out = np.zeros_like(V)
+        msb = np.uint64(1 << (_BITS - 1))
+        for d in range(V.shape[0]):
+            L = np.tril(rng.integers(0, 2, size=(_BITS, _BITS)), k=-1)
+            L[np.diag_indices(_BITS)] = 1
+            # Row j of L as a bit mask over output bit positions (MSB first)
+            rows = (L * (1 << np.arange(_BITS - 1, -1, -1, dtype=np.uint64))).sum(
+                axis=1, dtype=np.uint64
+            )
+            for j in range(_BITS):
+                out[d] |= _parity(V[d] & rows[j]) * (msb >> np.uint64(j))
+        return out
+
+    def uniforms(self, n: int) -> np.ndarray:
+        """Next ``n`` scrambled points in (0, 1)^dim, shape (n, dim)."""
+        idx = np.arange(self._index, self._index + n, dtype=np.uint64)
+        self._index += n
+
+        x = np.zeros((n, self.dim), dtype=np.uint64)
+        one = np.uint64(1)
+        for k in range(_BITS):
+            bit = (idx >> np.uint64(k)) & one
+            x ^= bit[:, None] * self._V[:, k][None, :]
+        x ^= self._shift[None, :]
+        # Midpoint of each 2^-32 cell keeps u strictly inside (0, 1)
+        return (x.astype(float) + 0.5) / float(1 << _BITS)
+
+    def normals(self, n: int, dim: int = 1) -> np.ndarray:
+        if dim != self.dim:
+            raise ValueError(f"sampler was built for dim={self.dim}, got {dim}")
+        return inverse_normal_cdf(self.uniforms(n))
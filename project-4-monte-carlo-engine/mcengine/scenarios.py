@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+import math
+import os
+import time
+
+import numpy as np
+
+from .engine import _result_dict
+from .models import GBMModel, PathState
+from .products import EuropeanOption, PathDependentOption
+from .stats import RunningMoments
+
+# File layout: an 8-byte magic, a JSON header padded with spaces to
+# HEADER_BYTES, then the (n_paths, n_steps) C-order path matrix.
+CUBE_MAGIC = b"MCCUBE01"
+HEADER_BYTES = 4096
+CUBE_DTYPES = ("float64", "float32")
+
+# Default chunk when writing or pricing a cube, in path values
+# (rows * n_steps): 32 MB of float64 scratch whatever n_steps is
+CUBE_CHUNK_ELEMENTS = 1 << 22
+
+
+def _default_chunk_rows(n_steps: int) -> int:
+    return max(1, CUBE_CHUNK_ELEMENTS // n_steps)
+
+
+@dataclass(eq=False)
+class ScenarioCube:
+    """Memory-mapped GBM scenarios: S at t_1..t_n for ``n_paths`` paths.
+
+    Create one with ``write_scenario_cube`` and reopen it with
+    ``ScenarioCube.open``. ``paths`` is a read-only ``np.memmap``, so
+    slicing it (``cube.paths[a:b]``, ``cube.state(a, b)``) maps the rows
+    from disk without copying them into RAM up front, and every product
+    priced off the cube sees the same scenarios.
+
+    Attributes
+    ----------
+    path: File the cube lives in.
+    model: The GBM model the paths were simulated under.
+    maturity: T in years; step k is at t_k = k * T / n_steps.
+    seed: Seed of the generator that produced the paths.
+    paths: Array of shape (n_paths, n_steps), float64 or float32.
+    """
+
+    path: str
+    model: GBMModel
+    maturity: float
+    seed: int | None
+    paths: np.ndarray
+
+    @property
+    def n_paths(self) -> int:
+        return self.paths.shape[0]
+
+    @property
+    def n_steps(self) -> int:
+        return self.paths.shape[1]
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.paths.dtype
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> "ScenarioCube":
+        """Map an existing cube read-only."""
+        path = os.fspath(path)
+        with open(path, "rb") as f:
+            raw = f.read(HEADER_BYTES)
+        if not raw.startswith(CUBE_MAGIC):
+            raise ValueError(f"{path} is not a scenario cube")
+        header = json.loads(raw[len(CUBE_MAGIC):].decode())
+        paths = np.memmap(
+            path,
+            dtype=header["dtype"],
+            mode="r",
+            offset=HEADER_BYTES,
+            shape=(header["n_paths"], header["n_steps"]),
+        )
+        return cls(
+            path=path,
+            model=GBMModel(**header["model"]),
+            maturity=header["maturity"],
+            seed=header["seed"],
+            paths=paths,
+        )
+
+    def state(self, start: int = 0, stop: int | None = None, stride: int = 1) -> PathState:
+        """``PathState`` of rows ``start:stop``, monitored every ``stride``
+        steps (so a cube with 252 steps also serves a 12- or 63-date
+        product). Only the selected rows are read from disk.
+        """
+        if self.n_steps % stride:
+            raise ValueError(f"stride must divide n_steps ({self.n_steps})")
+        view = self.paths[start:stop, stride - 1 :: stride]
+        spot = float(self.model.spot)
+        return PathState(
+            terminal=view[:, -1],
+            average=view.mean(axis=1),
+            minimum=np.minimum(view.min(axis=1), spot),
+            maximum=np.maximum(view.max(axis=1), spot),
+        )
+
+    def price(
+        self,
+        product: EuropeanOption | PathDependentOption,
+        start: int = 0,
+        stop: int | None = None,
+        chunk_size: int | None = None,
+    ) -> dict:
+        """Price ``product`` off rows ``start:stop`` instead of simulating.
+
+        The product's maturity must match the cube's; a path-dependent
+        product's ``n_steps`` must divide the cube's. Rows are read
+        ``chunk_size`` at a time (default ``CUBE_CHUNK_ELEMENTS // n_steps``),
+        so memory stays O(chunk) for any cube size. Returns the same dict as
+        ``MonteCarloEngine.price`` (crude Monte Carlo).
+        """
+        start_time = time.perf_counter()
+        if not math.isclose(product.maturity, self.maturity, rel_tol=1e-12, abs_tol=0.0):
+            raise ValueError(
+                f"product maturity {product.maturity} does not match the cube's {self.maturity}"
+            )
+        if isinstance(product, EuropeanOption):
+            stride = None
+        elif self.n_steps % product.n_steps == 0:
+            stride = self.n_steps // product.n_steps
+        else:
+            raise ValueError(
+                f"product n_steps {product.n_steps} must divide the cube's {self.n_steps}"
+            )
+
+        stop = self.n_paths if stop is None else min(stop, self.n_paths)
+        chunk = chunk_size or _default_chunk_rows(self.n_steps)
+        disc_factor = float(np.exp(-self.model.rate * self.maturity))
+        moments = RunningMoments.empty()
+        for begin in range(start, stop, chunk):
+            end = min(begin + chunk, stop)
+            if stride is None:
+                payoffs = product.payoff(self.paths[begin:end, -1])
+            else:
+                payoffs = product.payoff_from_state(self.state(begin, end, stride))
+            moments.merge(RunningMoments.from_samples(disc_factor * payoffs))
+
+        if moments.n == 0:
+            raise ValueError("no paths selected")
+        std_error = math.sqrt(moments.variance / moments.n)
+        return _result_dict(
+            float(moments.mean[0]),
+            std_error,
+            moments,
+            time.perf_counter() - start_time,
+            reduced=False,
+        )
+
+
+def write_scenario_cube(
+    path: str | os.PathLike,
+    model: GBMModel,
+    T: float,
+    n_steps: int,
+    n_paths: int,
+    seed: int | None = None,
+    dtype: str = "float64",
+    chunk_size: int | None = None,
+) -> ScenarioCube:
+    """Simulate ``n_paths`` GBM paths straight into a memory-mapped cube.
+
+    Paths are generated ``chunk_size`` rows at a time by
+    ``GBMModel.simulate_paths_into``, so RAM use is O(chunk * n_steps)
+    however large the file. The default chunk holds
+    ``CUBE_CHUNK_ELEMENTS`` float64 values (32 MB) of scratch. The normals
+    are drawn in row order, so the chunk size does not change the cube.
+    The header records the model parameters, maturity, shape, dtype and
+    seed; the same arguments rebuild the same cube. Returns the cube
+    reopened read-only.
+    """
+    if dtype not in CUBE_DTYPES:
+        raise ValueError(f"dtype must be one of {CUBE_DTYPES}, got {dtype!r}")
+    if n_steps < 1 or n_paths < 1:
+        raise ValueError("n_steps and n_paths must be >= 1")
+    if seed is not None and not isinstance(seed, (int, np.integer)):
+        raise TypeError("seed must be an int or None")
+
+    seed = None if seed is None else int(seed)
+    header = {
+        "model": {"spot": float(model.spot), "rate": float(model.rate), "vol": float(model.vol)},
+        "maturity": float(T),
+        "n_steps": int(n_steps),
+        "n_paths": int(n_paths),
+        "dtype": dtype,
+        "seed": seed,
+    }
+    encoded = CUBE_MAGIC + json.dumps(header).encode()
+    if len(encoded) > HEADER_BYTES:
+        raise ValueError("scenario cube header too large")
+
+    path = os.fspath(path)
+    size = HEADER_BYTES + n_paths * n_steps * np.dtype(dtype).itemsize
+    with open(path, "wb") as f:
+        f.write(encoded.ljust(HEADER_BYTES, b" "))
+        f.truncate(size)
+
+    paths = np.memmap(path, dtype=dtype, mode="r+", offset=HEADER_BYTES, shape=(n_paths, n_steps))
+    model.simulate_paths_into(
+        T, paths, np.random.default_rng(seed), chunk_size or _default_chunk_rows(n_steps)
+    )
+    paths.flush()
+    del paths
+    return ScenarioCube.open(path)
@@ -0,0 +1,368 @@
+"""Local pricing server that batches concurrent European requests.
+
+Clients send one JSON object per line over localhost TCP or a Unix
+socket and get one JSON line back per request (matched by ``id``;
+responses to pipelined requests can arrive out of order):
+
+    {"id": 1, "spot": 100, "rate": 0.02, "vol": 0.2, "strike": 105, "maturity": 1, "type": "call"}
+    -> {"id": 1, "price": 6.04, "std_error": 0.03}
+
+    {"id": 2, "op": "metrics"}
+    -> {"id": 2, "queue_depth": 0, "requests": 1, "batches": 1, ...}
+
+``n_paths`` and ``seed`` default to the server's ``ServerConfig`` and can
+be set per request. Requests that arrive within ``coalesce_window`` of
+each other and share a model, ``n_paths`` and ``seed`` are priced by one
+batched kernel call (``price_european_batch_mc_cpp``, or
+``MonteCarloEngine.price_batch`` without the C++ extension). S_T is
+computed once per maturity in the batch. A request's price depends only
+on its own fields, never on which other requests it was batched with.
+
+    python -m mcengine.server --port 8765
+    python -m mcengine.server --unix /tmp/mcengine.sock
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+import json
+import time
+from typing import Sequence
+
+import numpy as np
+
+from . import fast_engine
+from .engine import MonteCarloConfig, MonteCarloEngine
+from .fast_engine import FastMCConfig, price_european_batch_mc_cpp
+from .models import GBMModel
+from .products import EuropeanOption, OptionType
+
+BACKENDS = ("auto", "cpp", "numpy")
+
+
+@dataclass
+class ServerConfig:
+    # Defaults for requests that do not set them
+    n_paths: int = 100_000
+    seed: int = 42
+    # Seconds to keep collecting after the first queued request
+    coalesce_window: float = 0.002
+    max_batch: int = 4096
+    # "auto" uses the C++ batch kernel when it is built, else NumPy
+    backend: str = "auto"
+    # Most recent request latencies kept for the percentiles
+    latency_window: int = 10_000
+
+
+@dataclass
+class _Pending:
+    key: tuple
+    option: EuropeanOption
+    received: float
+    future: asyncio.Future
+
+
+def _parse_request(request: dict, config: ServerConfig) -> tuple[tuple, EuropeanOption]:
+    """Batch key ``(spot, rate, vol, n_paths, seed)`` and option of a request."""
+    try:
+        option_type = OptionType(request.get("type", "call"))
+        option = EuropeanOption(
+            strike=float(request["strike"]),
+            maturity=float(request["maturity"]),
+            option_type=option_type,
+        )
+        key = (
+            float(request["spot"]),
+            float(request["rate"]),
+            float(request["vol"]),
+            int(request.get("n_paths", config.n_paths)),
+            int(request.get("seed", config.seed)),
+        )
+    except KeyError as exc:
+        raise ValueError(f"missing field {exc.args[0]!r}") from None
+    if option.maturity <= 0 or key[3] < 2:
+        raise ValueError("maturity must be > 0 and n_paths >= 2")
+    return key, option
+
+
+class PricingServer:
+    """Queue, coalesce and batch-price European requests.
+
+    ``submit`` is the in-process entry point; ``start_tcp`` /
+    ``start_unix`` expose it over the line protocol in the module
+    docstring. A single batcher task drains the queue: it waits up to
+    ``coalesce_window`` for more requests after the first, groups them by
+    batch key and prices each group in one kernel call on a worker thread
+    (the C++ kernel releases the GIL). Requests arriving while a batch
+    runs simply form the next one, so batches grow with load.
+    """
+
+    def __init__(self, config: ServerConfig | None = None) -> None:
+        self.cfg = config or ServerConfig()
+        if self.cfg.backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {self.cfg.backend!r}")
+        if self.cfg.backend == "cpp" and fast_engine._mc_core is None:
+            raise RuntimeError("C++ backend (_mc_core) is not available.")
+        self.backend = (
+            "numpy"
+            if self.cfg.backend == "numpy"
+            or (self.cfg.backend == "auto" and fast_engine._mc_core is None)
+            else "cpp"
+        )
+        self._queue: asyncio.Queue[_Pending] | None = None
+        self._batcher: asyncio.Task | None = None
+        self._latencies: deque[float] = deque(maxlen=self.cfg.latency_window)
+        self._n_requests = 0
+        self._n_batches = 0
+        self._n_errors = 0
+
+    # -- pricing ---------------------------------------------------------
+
+    async def submit(self, request: dict) -> dict:
+        """Price one request dict; returns ``{"price", "std_error"}``."""
+        key, option = _parse_request(request, self.cfg)
+        self._ensure_batcher()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_Pending(key, option, time.perf_counter(), future))
+        return await future
+
+    def _ensure_batcher(self) -> None:
+        if self._batcher is None:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.create_task(self._run_batches())
+
+    async def _run_batches(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.cfg.coalesce_window
+            while len(batch) < self.cfg.max_batch:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            groups: dict[tuple, list[_Pending]] = {}
+            for pending in batch:
+                groups.setdefault(pending.key, []).append(pending)
+            for key, group in groups.items():
+                await self._price_group(key, group)
+
+    async def _price_group(self, key: tuple, group: list[_Pending]) -> None:
+        loop = asyncio.get_running_loop()
+        options = [pending.option for pending in group]
+        try:
+            result = await loop.run_in_executor(None, self._price_batch, key, options)
+        except Exception as exc:  # report to every caller, keep serving
+            self._n_errors += len(group)
+            for pending in group:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            return
+
+        self._n_batches += 1
+        done = time.perf_counter()
+        for i, pending in enumerate(group):
+            self._n_requests += 1
+            self._latencies.append(done - pending.received)
+            if not pending.future.done():
+                pending.future.set_result({
+                    "price": float(result["price"][i]),
+                    "std_error": float(result["std_error"][i]),
+                })
+
+    def _price_batch(self, key: tuple, options: list[EuropeanOption]) -> dict:
+        spot, rate, vol, n_paths, seed = key
+        model = GBMModel(spot=spot, rate=rate, vol=vol)
+        if self.backend == "cpp":
+            return price_european_batch_mc_cpp(
+                model, options, FastMCConfig(n_paths=n_paths, seed=seed)
+            )
+        engine = MonteCarloEngine(model, MonteCarloConfig(n_paths=n_paths, seed=seed))
+        return engine.price_batch(options)
+
+    # -- metrics ---------------------------------------------------------
+
+    def metrics(self) -> dict:
+        """Queue depth, counters and latency percentiles (milliseconds)
+        over the last ``latency_window`` requests."""
+        latencies = np.asarray(self._latencies) * 1e3
+        percentiles = (
+            np.percentile(latencies, [50, 90, 99]) if latencies.size else [float("nan")] * 3
+        )
+        return {
+            "backend": self.backend,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "requests": self._n_requests,
+            "errors": self._n_errors,
+            "batches": self._n_batches,
+            "mean_batch_size": self._n_requests / self._n_batches if self._n_batches else 0.0,
+            "latency_ms_p50": float(percentiles[0]),
+            "latency_ms_p90": float(percentiles[1]),
+            "latency_ms_p99": float(percentiles[2]),
+        }
+
+    # -- transport -------------------------------------------------------
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.AbstractServer:
+        """Listen on ``host:port`` (``port=0`` picks a free port)."""
+        self._ensure_batcher()
+        return await asyncio.start_server(self._handle, host, port)
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._ensure_batcher()
+        return await asyncio.start_unix_server(self._handle, path)
+
+    async def close(self) -> None:
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks: set[asyncio.Task] = set()
+        try:
+            while line := await reader.readline():
+                if line.strip():
+                    # One task per request, so a connection can pipeline
+                    task = asyncio.create_task(self._respond(line, writer))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter) -> None:
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request.get("op", "price") == "metrics":
+                response = self.metrics()
+            elif request.get("op", "price") == "price":
+                response = await self.submit(request)
+            else:
+                raise ValueError(f"unknown op {request['op']!r}")
+        except Exception as exc:
+            response = {"error": f"{type(exc).__name__}: {exc}"}
+        response["id"] = request_id
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+
+class PricingClient:
+    """Minimal asyncio client for ``PricingServer``; concurrent ``price``
+    calls are pipelined over one connection."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting: dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.create_task(self._receive())
+
+    @classmethod
+    async def connect_tcp(cls, host: str = "127.0.0.1", port: int = 8765) -> "PricingClient":
+        return cls(*await asyncio.open_connection(host, port))
+
+    @classmethod
+    async def connect_unix(cls, path: str) -> "PricingClient":
+        return cls(*await asyncio.open_unix_connection(path))
+
+    async def request(self, payload: dict) -> dict:
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(json.dumps({**payload, "id": request_id}).encode() + b"\n")
+        await self._writer.drain()
+        response = await future
+        if "error" in response:
+            raise RuntimeError(response["error"])
+        return response
+
+    async def price(
+        self, model: GBMModel, option: EuropeanOption, **overrides: int
+    ) -> dict:
+        """Price via the server; ``overrides`` may set ``n_paths`` / ``seed``."""
+        return await self.request({
+            "spot": model.spot,
+            "rate": model.rate,
+            "vol": model.vol,
+            "strike": option.strike,
+            "maturity": option.maturity,
+            "type": OptionType(option.option_type).value,
+            **overrides,
+        })
+
+    async def metrics(self) -> dict:
+        return await self.request({"op": "metrics"})
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+
+    async def _receive(self) -> None:
+        while line := await self._reader.readline():
+            response = json.loads(line)
+            future = self._waiting.pop(response.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(response)
+        for future in self._waiting.values():
+            if not future.done():
+                future.set_exception(ConnectionError("server closed the connection"))
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = PricingServer(ServerConfig(
+        n_paths=args.n_paths,
+        seed=args.seed,
+        coalesce_window=args.window_ms / 1e3,
+        backend=args.backend,
+    ))
+    if args.unix:
+        listener = await server.start_unix(args.unix)
+        where = args.unix
+    else:
+        listener = await server.start_tcp(args.host, args.port)
+        where = "{}:{}".format(*listener.sockets[0].getsockname()[:2])
+    print(f"mcengine pricing server ({server.backend}) listening on {where}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m mcengine.server", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    defaults = ServerConfig()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket instead of TCP")
+    parser.add_argument("--n-paths", type=int, default=defaults.n_paths)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--window-ms", type=float, default=defaults.coalesce_window * 1e3)
+    parser.add_argument("--backend", choices=BACKENDS, default=defaults.backend)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
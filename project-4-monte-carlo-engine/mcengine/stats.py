@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+@dataclass
+class RunningMoments:
+    """Mergeable count / mean / co-moment accumulator (Welford–Chan).
+
+    Tracks ``k`` variables jointly so the covariances needed by the
+    control variate survive chunking. Merging two accumulators uses
+    Chan et al.'s pairwise update, which stays numerically stable where
+    raw sum / sum-of-squares would cancel.
+
+    Attributes
+    ----------
+    n: Number of samples seen.
+    mean: Array of shape (k,) with the running means.
+    m2: Array of shape (k, k) with the sum of outer products of
+        deviations from the mean.
+    """
+
+    n: int
+    mean: np.ndarray
+    m2: np.ndarray
+
+    @classmethod
+    def empty(cls, dim: int = 1) -> "RunningMoments":
+        return cls(n=0, mean=np.zeros(dim), m2=np.zeros((dim, dim)))
+
+    @classmethod
+    def from_samples(cls, x: np.ndarray) -> "RunningMoments":
+        """Moments of a batch, shape (n,) for one variable or (n, k)."""
+        x = np.asarray(x, dtype=float)
+        if x.ndim == 1:
+            x = x[:, None]
+        n = x.shape[0]
+        if n == 0:
+            return cls.empty(x.shape[1])
+        mean = x.mean(axis=0)
+        dev = x - mean
+        return cls(n=n, mean=mean, m2=dev.T @ dev)
+
+    @property
+    def dim(self) -> int:
+        return self.mean.shape[0]
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """Fold ``other`` into this accumulator in place and return self."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean.copy(), other.m2.copy()
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 = self.m2 + other.m2 + np.outer(delta, delta) * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+        return self
+
+    @property
+    def covariance(self) -> np.ndarray:
+        """Sample covariance matrix (ddof=1); zeros for fewer than 2 samples."""
+        if self.n < 2:
+            return np.zeros_like(self.m2)
+        return self.m2 / (self.n - 1)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1) of the first variable."""
+        return float(self.covariance[0, 0])
+
+
+@dataclass
+class ElementwiseMoments:
+    """Mergeable count / mean / M2 for an array of separate variables.
+
+    Like ``RunningMoments`` but without cross terms, for estimators that
+    share samples yet are reported independently (e.g. every cell of a
+    price ladder). ``mean`` and ``m2`` have the shape of one sample.
+    """
+
+    n: int
+    mean: np.ndarray
+    m2: np.ndarray
+
+    @classmethod
+    def empty(cls, shape: tuple[int, ...]) -> "ElementwiseMoments":
+        return cls(n=0, mean=np.zeros(shape), m2=np.zeros(shape))
+
+    @classmethod
+    def from_samples(cls, x: np.ndarray) -> "ElementwiseMoments":
+        """Moments over the last axis of ``x``."""
+        x = np.asarray(x, dtype=float)
+        mean = x.mean(axis=-1)
+        dev = x - mean[..., None]
+        return cls(n=x.shape[-1], mean=mean, m2=np.einsum("...i,...i->...", dev, dev))
+
+    def merge(self, other: "ElementwiseMoments") -> "ElementwiseMoments":
+        """Fold ``other`` into this accumulator in place and return self."""
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.n, self.mean, self.m2 = other.n, other.mean.copy(), other.m2.copy()
+            return self
+
+        n = self.n + other.n
+        delta = other.mean - self.mean
+        self.m2 = self.m2 + other.m2 + delta**2 * (self.n * other.n / n)
+        self.mean = self.mean + delta * (other.n / n)
+        self.n = n
+        return self
+
+    @property
+    def variance(self) -> np.ndarray:
+        """Sample variance (ddof=1) per element; zeros for fewer than 2 samples."""
+        if self.n < 2:
+            return np.zeros_like(self.m2)
+        return self.m2 / (self.n - 1)
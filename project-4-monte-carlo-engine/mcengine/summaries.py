@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import math
+
+import numpy as np
+
+from .models import GBMModel
+
+# Quantiles reported by ``PricingSummaries.payoff_quantiles``
+DEFAULT_QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+
+@dataclass
+class Histogram:
+    """Fixed-bin histogram with underflow / overflow counts.
+
+    Bin ``i`` covers ``[low + i * width, low + (i + 1) * width)``; values
+    below ``low`` count as underflow, values at or above ``high`` as
+    overflow. Bins are fixed up front, so histograms from different
+    chunks, workers or backends merge by adding counts.
+    """
+
+    low: float
+    high: float
+    counts: np.ndarray
+    underflow: int = 0
+    overflow: int = 0
+
+    @classmethod
+    def empty(cls, low: float, high: float, n_bins: int) -> "Histogram":
+        if n_bins < 1:
+            raise ValueError("n_bins must be >= 1")
+        if not high > low:
+            raise ValueError("high must be > low")
+        return cls(low=float(low), high=float(high), counts=np.zeros(n_bins, dtype=np.int64))
+
+    @property
+    def n_bins(self) -> int:
+        return self.counts.shape[0]
+
+    @property
+    def edges(self) -> np.ndarray:
+        return np.linspace(self.low, self.high, self.n_bins + 1)
+
+    @property
+    def centres(self) -> np.ndarray:
+        edges = self.edges
+        return 0.5 * (edges[:-1] + edges[1:])
+
+    def add(self, x: np.ndarray) -> None:
+        width = (self.high - self.low) / self.n_bins
+        idx = np.floor((np.asarray(x, dtype=float) - self.low) / width)
+        below = idx < 0
+        above = idx >= self.n_bins
+        self.underflow += int(below.sum())
+        self.overflow += int(above.sum())
+        inside = idx[~(below | above)].astype(np.int64)
+        self.counts += np.bincount(inside, minlength=self.n_bins)
+
+    def merge(self, other: "Histogram") -> "Histogram":
+        if (self.low, self.high, self.n_bins) != (other.low, other.high, other.n_bins):
+            raise ValueError("cannot merge histograms with different bins")
+        self.counts += other.counts
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        return self
+
+
+@dataclass
+class QuantileSketch:
+    """Mergeable quantile sketch for non-negative values (DDSketch).
+
+    Positive values fall into logarithmic buckets
+    ``(gamma^(i-1), gamma^i]`` with ``gamma = (1 + a) / (1 - a)``, so
+    every quantile is returned within relative error ``a``
+    (``relative_accuracy``) of an actual sample value. Exact zeros, e.g.
+    out-of-the-money payoffs, are counted separately. Buckets are a dense
+    array starting at index ``offset``; beyond ``max_buckets`` the lowest
+    ones are folded together, which only coarsens the smallest quantiles.
+    Merging adds bucket counts, so the result does not depend on how the
+    values were split up.
+    """
+
+    relative_accuracy: float = 0.01
+    max_buckets: int = 2048
+    zero_count: int = 0
+    offset: int = 0
+    counts: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+
+    def __post_init__(self) -> None:
+        if not 0.0 < self.relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.counts = np.asarray(self.counts, dtype=np.int64)
+
+    @property
+    def gamma(self) -> float:
+        a = self.relative_accuracy
+        return (1.0 + a) / (1.0 - a)
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + int(self.counts.sum())
+
+    def add(self, x: np.ndarray) -> None:
+        x = np.asarray(x, dtype=float).ravel()
+        if (x < 0).any():
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        positive = x[x > 0]
+        self.zero_count += x.shape[0] - positive.shape[0]
+        if positive.shape[0] == 0:
+            return
+        idx = np.ceil(np.log(positive) / math.log(self.gamma)).astype(np.int64)
+        lowest = int(idx.min())
+        self._add_counts(lowest, np.bincount(idx - lowest))
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("cannot merge sketches with different relative_accuracy")
+        self.zero_count += other.zero_count
+        if other.counts.shape[0]:
+            self._add_counts(other.offset, other.counts)
+        return self
+
+    def _add_counts(self, offset: int, counts: np.ndarray) -> None:
+        if self.counts.shape[0] == 0:
+            self.offset, self.counts = offset, counts.astype(np.int64)
+        else:
+            lo = min(self.offset, offset)
+            hi = max(self.offset + self.counts.shape[0], offset + counts.shape[0])
+            merged = np.zeros(hi - lo, dtype=np.int64)
+            merged[self.offset - lo : self.offset - lo + self.counts.shape[0]] += self.counts
+            merged[offset - lo : offset - lo + counts.shape[0]] += counts
+            self.offset, self.counts = lo, merged
+
+        excess = self.counts.shape[0] - self.max_buckets
+        if excess > 0:
+            folded = self.counts[excess:].copy()
+            folded[0] += self.counts[:excess].sum()
+            self.offset, self.counts = self.offset + excess, folded
+
+    def quantile(self, q: float) -> float:
+        """Value at quantile ``q`` in [0, 1]; NaN for an empty sketch."""
+        if not 0.0 <= q <= 1.0:
+            raise ValueError("q must be in [0, 1]")
+        n = self.count
+        if n == 0:
+            return float("nan")
+        rank = q * (n - 1)
+        if rank < self.zero_count:
+            return 0.0
+        cumulative = self.zero_count + np.cumsum(self.counts)
+        i = int(np.searchsorted(cumulative, rank, side="right"))
+        gamma = self.gamma
+        return 2.0 * gamma ** (self.offset + i) / (gamma + 1.0)
+
+
+@dataclass
+class Reservoir:
+    """Uniform random sample of at most ``size`` values.
+
+    Every value gets an independent uniform key and the ``size`` smallest
+    keys are kept (bottom-k sampling). Merging two reservoirs keeps the
+    smallest keys of the union, which is again a uniform sample of all
+    values seen, so chunks and workers can be sampled independently.
+    """
+
+    size: int
+    keys: np.ndarray = field(default_factory=lambda: np.zeros(0))
+    values: np.ndarray = field(default_factory=lambda: np.zeros(0))
+
+    def __post_init__(self) -> None:
+        if self.size < 1:
+            raise ValueError("size must be >= 1")
+
+    @property
+    def sample(self) -> np.ndarray:
+        """The kept values, ordered by key (i.e. in random order)."""
+        return self.values[np.argsort(self.keys, kind="stable")]
+
+    def add(self, x: np.ndarray, rng: np.random.Generator) -> None:
+        x = np.asarray(x, dtype=float).ravel()
+        keys = rng.random(x.shape[0])
+        if self.keys.shape[0] == self.size:
+            # Most values cannot displace the current sample
+            keep = keys < self.keys.max()
+            keys, x = keys[keep], x[keep]
+        self._keep_smallest(np.concatenate([self.keys, keys]), np.concatenate([self.values, x]))
+
+    def merge(self, other: "Reservoir") -> "Reservoir":
+        self._keep_smallest(
+            np.concatenate([self.keys, other.keys]),
+            np.concatenate([self.values, other.values]),
+        )
+        return self
+
+    def _keep_smallest(self, keys: np.ndarray, values: np.ndarray) -> None:
+        if keys.shape[0] > self.size:
+            idx = np.argpartition(keys, self.size - 1)[: self.size]
+            keys, values = keys[idx], values[idx]
+        self.keys, self.values = keys, values
+
+
+@dataclass
+class PricingSummaries:
+    """Streaming summaries collected during a pricing pass.
+
+    Attributes
+    ----------
+    terminal_histogram: Fixed-bin histogram of S_T.
+    payoff_sketch: Quantile sketch of the discounted payoffs.
+    payoff_sample: Uniform reservoir sample of the discounted payoffs.
+
+    All three merge across chunks, workers and blocks, so memory stays
+    O(bins + sample size) however many paths are priced.
+    """
+
+    terminal_histogram: Histogram
+    payoff_sketch: QuantileSketch
+    payoff_sample: Reservoir
+
+    @classmethod
+    def empty(
+        cls, low: float, high: float, n_bins: int = 100, sample_size: int = 1000
+    ) -> "PricingSummaries":
+        return cls(
+            terminal_histogram=Histogram.empty(low, high, n_bins),
+            payoff_sketch=QuantileSketch(),
+            payoff_sample=Reservoir(sample_size),
+        )
+
+    def add(
+        self, terminal: np.ndarray, discounted: np.ndarray, rng: np.random.Generator
+    ) -> None:
+        self.terminal_histogram.add(terminal)
+        self.payoff_sketch.add(discounted)
+        self.payoff_sample.add(discounted, rng)
+
+    def merge(self, other: "PricingSummaries") -> "PricingSummaries":
+        self.terminal_histogram.merge(other.terminal_histogram)
+        self.payoff_sketch.merge(other.payoff_sketch)
+        self.payoff_sample.merge(other.payoff_sample)
+        return self
+
+    def payoff_quantiles(self, qs: tuple[float, ...] = DEFAULT_QUANTILES) -> dict[float, float]:
+        return {q: self.payoff_sketch.quantile(q) for q in qs}
+
+
+def terminal_range(model: GBMModel, T: float, n_sd: float = 6.0) -> tuple[float, float]:
+    """S_T range for a summary histogram: ``n_sd`` standard deviations
+    either side of the mean of log S_T under GBM.
+
+    A zero-variance model gets a ±1% window around its deterministic S_T.
+    """
+    centre = math.log(model.spot) + (model.rate - 0.5 * model.vol**2) * T
+    half_width = n_sd * model.vol * math.sqrt(T)
+    if half_width <= 0.0:
+        half_width = 0.01
+    return math.exp(centre - half_width), math.exp(centre + half_width)
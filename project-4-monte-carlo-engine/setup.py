@@ -10,7 +10,13 @@ def get_compile_args():
         return ["/O2", "/std:c++17"]
     else:
         # GCC/Clang
-        return ["-O3", "-std=c++17"]
+        return ["-O3", "-std=c++17", "-pthread", "-fno-math-errno"]
+
+
+def get_link_args():
+    if sys.platform.startswith("win"):
+        return []
+    return ["-pthread"]
 
 
 ext_modules = [
@@ -18,6 +24,11 @@ ext_modules = [
         name="mcengine._mc_core",  # submodule of mcengine
         sources=[
             "cpp/mc_core.cpp",
+            "cpp/mc_paths.cpp",
+            "cpp/mc_multi_asset.cpp",
+            "cpp/mc_heston.cpp",
+            "cpp/mc_american.cpp",
+            "cpp/mc_instrumented.cpp",
             "cpp/bindings.cpp",
         ],
         include_dirs=[
@@ -26,6 +37,7 @@ ext_modules = [
         ],
         language="c++",
         extra_compile_args=get_compile_args(),
+        extra_link_args=get_link_args(),
     )
 ]
 
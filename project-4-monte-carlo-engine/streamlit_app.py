@@ -10,7 +10,8 @@ from mcengine import (
     MonteCarloConfig,
     MonteCarloEngine,
     FastMCConfig,
-    price_european_mc_cpp,
+    cached_price,
+    cached_price_european_mc_cpp,
     black_scholes_price,
 )
 
@@ -28,7 +29,8 @@ to the Black–Scholes closed–form price (for calls).
 You can switch between a **pure Python/NumPy backend** and a
 **C++ backend exposed via pybind11**, and visualise:
 
-- The distribution of discounted payoffs,
+- How the estimate converges with the number of paths,
+- The distribution of discounted payoffs (quantiles and a random sample),
 - The distribution of terminal prices \\(S_T\\),
 - Sample GBM paths coloured by whether they expire ITM/ATM or OTM.
 """
@@ -72,6 +74,12 @@ n_time_steps = st.sidebar.number_input(
     max_value=1000,
 )
 
+st.sidebar.header("Diagnostics")
+# An extra NumPy run of n_paths on top of the pricing run, so opt-in
+show_convergence = st.sidebar.checkbox(
+    "Convergence profile (extra NumPy run)", value=False
+)
+
 run_button = st.sidebar.button("Run simulation")
 
 # Main logic
@@ -83,16 +91,16 @@ if run_button:
 
     # Price using selected backend
     if backend.startswith("Python"):
-        cfg = MonteCarloConfig(n_paths=int(n_paths), seed=int(seed))
-        engine = MonteCarloEngine(model, cfg)
+        cfg = MonteCarloConfig(n_paths=int(n_paths), seed=int(seed), summaries=True)
 
+        # Seeded runs are cached, so re-clicking with the same inputs is free
         with st.spinner("Running Python/NumPy Monte Carlo simulation..."):
-            result = engine.price(option)
+            result = cached_price(model, option, cfg)
     else:
-        fast_cfg = FastMCConfig(n_paths=int(n_paths), seed=int(seed))
+        fast_cfg = FastMCConfig(n_paths=int(n_paths), seed=int(seed), summaries=True)
         try:
             with st.spinner("Running C++ Monte Carlo simulation via pybind11..."):
-                result = price_european_mc_cpp(model, option, fast_cfg)
+                result = cached_price_european_mc_cpp(model, option, fast_cfg)
         except RuntimeError as exc:
             st.error(
                 "C++ backend is not available. "
@@ -126,35 +134,91 @@ if run_button:
         if bs_price is not None:
             st.write(f"**Black–Scholes price (call):** {bs_price:.4f}")
 
-    # Resimulate for visualisation (using Python GBM for clarity)
-    rng = np.random.default_rng(int(seed))
-    ST = model.simulate_terminal(T=T, n_paths=int(n_paths), rng=rng)
-    payoffs = option.payoff(ST)
-    disc_factor = np.exp(-r * T)
-    discounted = disc_factor * payoffs
+    # Summaries collected by the engine during the pricing pass
+    summaries = result["summaries"]
 
     # Discounted payoff distribution
     with col2:
-        st.subheader("Discounted payoff samples")
+        st.subheader("Discounted payoff distribution")
+
+        quantiles = summaries.payoff_quantiles()
+        df_quantiles = pd.DataFrame(
+            {
+                "Quantile": [f"{q:.0%}" for q in quantiles],
+                "Discounted payoff": list(quantiles.values()),
+            }
+        )
+        st.dataframe(df_quantiles, hide_index=True)
 
-        df_discounted = pd.DataFrame({"Discounted payoff": discounted})
-        st.bar_chart(df_discounted)
+        df_sample = pd.DataFrame({"discounted": summaries.payoff_sample.sample})
+        sample_chart = (
+            alt.Chart(df_sample)
+            .mark_bar()
+            .encode(
+                x=alt.X(
+                    "discounted:Q",
+                    bin=alt.Bin(maxbins=50),
+                    title="Discounted payoff (same currency as S₀)",
+                ),
+                y=alt.Y("count():Q", title="Sampled paths"),
+            )
+            .properties(height=250)
+        )
+        st.altair_chart(sample_chart, use_container_width=True)
         st.caption(
-            "Each bar corresponds to one Monte Carlo path. "
-            "**x-axis:** path index. "
-            "**y-axis:** discounted payoff (same currency as S₀)."
+            "Quantiles cover all paths, to within 1% relative error. "
+            f"The histogram shows a uniform sample of {len(df_sample)} paths."
         )
 
-        #  Histogram of terminal prices ST
-    st.subheader("Distribution of terminal prices $S_T$")
+    # Convergence of the estimate, from the prefixes of one NumPy run.
+    # It re-simulates n_paths whatever the backend, so only on request.
+    if show_convergence:
+        st.subheader("Convergence with the number of paths")
+
+        profile = MonteCarloEngine(
+            model, MonteCarloConfig(n_paths=int(n_paths), seed=int(seed))
+        ).convergence_profile(option)
+        ci_lower, ci_upper = profile["conf_int_95"]
+        df_profile = pd.DataFrame(
+            {
+                "n_paths": profile["n_paths"],
+                "price": profile["price"],
+                "ci_lower": ci_lower,
+                "ci_upper": ci_upper,
+            }
+        )
+
+        x_paths = alt.X("n_paths:Q", title="Number of paths", scale=alt.Scale(type="log"))
+        band = (
+            alt.Chart(df_profile)
+            .mark_area(opacity=0.25)
+            .encode(x=x_paths, y=alt.Y("ci_lower:Q", title="Price"), y2="ci_upper:Q")
+        )
+        line = alt.Chart(df_profile).mark_line(point=True).encode(x=x_paths, y="price:Q")
+        convergence_chart = band + line
+        if profile["reference"] is not None:
+            reference = (
+                alt.Chart(pd.DataFrame({"reference": [profile["reference"]]}))
+                .mark_rule(color="#FF4B4B", strokeDash=[4, 4])
+                .encode(y="reference:Q")
+            )
+            convergence_chart = convergence_chart + reference
 
-    counts, bin_edges = np.histogram(ST, bins=100)
-    bin_centres = 0.5 * (bin_edges[:-1] + bin_edges[1:])
+        st.altair_chart(convergence_chart.properties(height=300), use_container_width=True)
+        st.caption(
+            "Price and 95% confidence band after the first n paths of a single "
+            f"NumPy run ({profile['elapsed']:.2f} s for all {len(df_profile)} points). "
+            "The dashed line is the Black–Scholes price."
+        )
+
+    #  Histogram of terminal prices ST
+    st.subheader("Distribution of terminal prices $S_T$")
 
+    histogram = summaries.terminal_histogram
     df_hist = pd.DataFrame(
         {
-            "bin_centre": bin_centres,
-            "frequency": counts,
+            "bin_centre": histogram.centres,
+            "frequency": histogram.counts,
         }
     )
 
@@ -178,7 +242,9 @@ if run_button:
     st.altair_chart(hist_chart, use_container_width=True)
     st.caption(
         "**x-axis:** terminal price bin centre "
-        "**y-axis:** number of paths ending in that bin."
+        "**y-axis:** number of paths ending in that bin. "
+        f"{histogram.underflow + histogram.overflow} paths fell outside the "
+        "plotted range (±6 standard deviations of log S_T)."
     )
 
 